@@ -0,0 +1,229 @@
+# benchmarks/eda_chart_benchmark.py
+# 실행: sosangomin-ai 디렉토리에서 python -m benchmarks.eda_chart_benchmark --rows 3000000
+
+import math
+import time
+import argparse
+import logging
+import tracemalloc
+from typing import Dict, Any, Callable, Tuple
+
+import numpy as np
+import pandas as pd
+
+from services.chart_aggregation_engine import chart_aggregation_engine
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+def make_synthetic_pos(rows: int, days: int, products: int, seed: int = 42) -> pd.DataFrame:
+    """auto_analysis.preprocess_data 결과와 같은 열 구성의 합성 POS 데이터"""
+    rng = np.random.default_rng(seed)
+
+    start = pd.Timestamp("2023-01-01")
+    day_offsets = rng.integers(0, days, rows)
+    hours = rng.choice(np.arange(9, 23), rows)
+    minutes = rng.integers(0, 60, rows)
+    sale_time = pd.to_datetime(start.value + (day_offsets * 86400 + hours * 3600 + minutes * 60) * 10**9)
+
+    # 상품은 인기 편중(Zipf)으로 선택
+    weights = 1 / np.arange(1, products + 1)
+    product_idx = rng.choice(products, rows, p=weights / weights.sum())
+    product_names = np.array([f"메뉴{i:04d}" for i in range(products)], dtype=object)
+    unit_prices = rng.integers(3, 30, products) * 500
+    quantities = rng.integers(1, 4, rows)
+
+    # 날씨는 날짜-시각 단위 값
+    weather_keys = day_offsets * 24 + hours
+    temperature = np.round(rng.normal(15, 10, days * 24), 1)
+    rainfall = np.where(rng.random(days * 24) < 0.2, np.round(rng.exponential(4, days * 24), 1), 0.0)
+    humidity = np.round(rng.uniform(30, 90, days * 24), 1)
+
+    df = pd.DataFrame({
+        '매출 일시': sale_time,
+        '상품 명칭': product_names[product_idx],
+        '단가': unit_prices[product_idx],
+        '수량': quantities,
+        '매출': unit_prices[product_idx] * quantities,
+        # 영수증당 평균 2.5개 품목
+        '전표 번호': np.arange(rows) // 2.5,
+        '기온': temperature[weather_keys],
+        '강수량': rainfall[weather_keys],
+        '습도': humidity[weather_keys]
+    })
+
+    # 날짜/시각 파생 열은 조회표에서 가져와 생성 시간 절약
+    calendar = pd.date_range(start, periods=days, freq="D")
+    day_names = np.array(calendar.day_name(), dtype=object)
+    df['년'] = np.array(calendar.year.astype(str), dtype=object)[day_offsets]
+    df['월'] = np.array(calendar.month.astype(str).str.zfill(2), dtype=object)[day_offsets]
+    df['일'] = np.array(calendar.day.astype(str).str.zfill(2), dtype=object)[day_offsets]
+    df['시'] = np.array([f"{h:02d}" for h in range(24)], dtype=object)[hours]
+    df['분'] = np.array([f"{m:02d}" for m in range(60)], dtype=object)[minutes]
+    df['요일'] = day_names[day_offsets]
+    df['시간대'] = np.array(['점심' if 11 <= h <= 15 else ('저녁' if 17 <= h <= 21 else '기타') for h in range(24)], dtype=object)[hours]
+    seasons = np.array(['겨울', '겨울', '봄', '봄', '봄', '여름', '여름', '여름', '가을', '가을', '가을', '겨울'], dtype=object)
+    df['계절'] = seasons[calendar.month.to_numpy() - 1][day_offsets]
+    df['공휴일'] = np.where(calendar.weekday.to_numpy() >= 5, '휴일', '평일').astype(object)[day_offsets]
+    return df
+
+def legacy_generate_chart_data(df: pd.DataFrame) -> Dict[str, Any]:
+    """기존 EdaService.generate_chart_data (열별 groupby 방식)"""
+    chart_data = {}
+
+    total_sales = df['매출'].sum() if '매출' in df.columns else 0
+    avg_transaction = df['매출'].mean() if '매출' in df.columns else 0
+    total_transactions = len(df)
+    unique_products = df['상품 명칭'].nunique() if '상품 명칭' in df.columns else 0
+
+    chart_data["basic_stats"] = {
+        "total_sales": float(total_sales),
+        "avg_transaction": float(avg_transaction),
+        "total_transactions": total_transactions,
+        "unique_products": unique_products
+    }
+
+    if '요일' in df.columns and '매출' in df.columns:
+        day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+        weekday_sales = df.groupby('요일')['매출'].sum()
+        chart_data["weekday_sales"] = {day: float(weekday_sales[day]) if day in weekday_sales else 0 for day in day_order}
+
+    if '시간대' in df.columns and '매출' in df.columns:
+        chart_data["time_period_sales"] = df.groupby('시간대')['매출'].sum().to_dict()
+
+    if '시' in df.columns and '매출' in df.columns:
+        hourly_dict = df.groupby('시')['매출'].sum().to_dict()
+        chart_data["hourly_sales"] = {str(k): float(v) for k, v in hourly_dict.items()}
+
+    if '상품 명칭' in df.columns and '매출' in df.columns:
+        chart_data["top_products"] = df.groupby('상품 명칭')['매출'].sum().sort_values(ascending=False).head(5).to_dict()
+
+    if '공휴일' in df.columns and '매출' in df.columns:
+        chart_data["holiday_sales"] = df.groupby('공휴일')['매출'].sum().to_dict()
+
+    if '계절' in df.columns and '매출' in df.columns:
+        chart_data["season_sales"] = df.groupby('계절')['매출'].sum().to_dict()
+
+    if '고객 수' in df.columns and '매출' in df.columns and df['고객 수'].sum() > 0:
+        chart_data["basic_stats"]["customer_avg"] = float(df['매출'].sum() / df['고객 수'].sum())
+
+    if all(col in df.columns for col in ['매출', '기온', '강수량', '습도']):
+        df['날짜'] = df['매출 일시'].dt.date
+        daily_df = df.groupby('날짜').agg({
+            '매출': 'sum',
+            '기온': 'mean',
+            '강수량': 'max',
+            '습도': 'mean'
+        }).reset_index()
+
+        daily_df['기온_구간'] = (daily_df['기온'] // 5) * 5
+        temp_sales = daily_df.groupby('기온_구간')['매출'].agg(['mean', 'count']).reset_index()
+        temp_sales_filtered = temp_sales[temp_sales['count'] >= 5]
+        chart_data["temperature_sales"] = {
+            f"{int(row['기온_구간'])}~{int(row['기온_구간']) + 5}°C": float(row['mean'])
+            for _, row in temp_sales_filtered.iterrows()
+        }
+
+        daily_df['날씨_상세'] = pd.cut(
+            daily_df['강수량'],
+            bins=[0, 0.1, 5, 20, float('inf')],
+            labels=['맑음', '이슬비', '보통비', '폭우']
+        )
+        weather_sales = daily_df.groupby('날씨_상세')['매출'].agg(['mean', 'count']).reset_index()
+        weather_filtered = weather_sales[weather_sales['count'] >= 3]
+        chart_data["weather_sales"] = {
+            str(row['날씨_상세']): float(row['mean'])
+            for _, row in weather_filtered.iterrows()
+        }
+
+    if all(col in df.columns for col in ['요일', '시간대', '매출']):
+        cross_dict = df.pivot_table(index='요일', columns='시간대', values='매출', aggfunc='sum').fillna(0).to_dict()
+        chart_data["weekday_time_sales"] = {k: {str(inner_k): float(inner_v) for inner_k, inner_v in v.items()}
+                                            for k, v in cross_dict.items()}
+
+    if '년' in df.columns and '월' in df.columns and '매출' in df.columns:
+        yearly_monthly_sales = df.groupby(['년', '월'])['매출'].sum()
+        chart_data["monthly_sales"] = {f"{year}-{month}": float(sales) for (year, month), sales in yearly_monthly_sales.items()}
+
+    if '상품 명칭' in df.columns and '수량' in df.columns:
+        product_qty = df.groupby('상품 명칭')['수량'].sum()
+        total_qty = product_qty.sum()
+        top_products = product_qty.sort_values(ascending=False).head(10)
+        others = pd.Series([product_qty.sum() - top_products.sum()], index=['기타 상품'])
+        product_share = pd.concat([top_products, others]) / total_qty * 100
+        chart_data["product_share"] = {str(k): float(v) for k, v in product_share.to_dict().items()}
+
+    if '매출' in df.columns and '전표 번호' in df.columns:
+        transaction_amounts = df.groupby('전표 번호')['매출'].sum()
+        bins = [0, 10000, 20000, 30000, 50000, 100000, float('inf')]
+        labels = ['1만원 미만', '1~2만원', '2~3만원', '3~5만원', '5~10만원', '10만원 이상']
+        transaction_ranges = pd.cut(transaction_amounts, bins=bins, labels=labels)
+        chart_data["transaction_amounts"] = {str(k): int(v) for k, v in transaction_ranges.value_counts().to_dict().items()}
+
+    return chart_data
+
+def measure(fn: Callable[[pd.DataFrame], Dict[str, Any]], df: pd.DataFrame, repeat: int) -> Tuple[Dict[str, Any], float, float]:
+    """최소 실행 시간(초)과 최대 추가 메모리(MB) 측정 (입력 프레임 자체는 제외)"""
+    best_seconds = float('inf')
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        # 기존 방식은 입력 프레임에 '날짜' 열을 추가하므로 얕은 복사본 전달
+        result = fn(df.copy(deep=False))
+        best_seconds = min(best_seconds, time.perf_counter() - started)
+
+    tracemalloc.start()
+    fn(df.copy(deep=False))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, best_seconds, peak / (1024 * 1024)
+
+def diff_charts(expected: Any, actual: Any, path: str = "") -> list:
+    """두 차트 결과의 차이 목록 (실수는 상대 오차 1e-9 허용)"""
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        diffs = [f"{path}.{key}: 누락" for key in expected.keys() - actual.keys()]
+        diffs += [f"{path}.{key}: 추가됨" for key in actual.keys() - expected.keys()]
+        for key in expected.keys() & actual.keys():
+            diffs += diff_charts(expected[key], actual[key], f"{path}.{key}")
+        return diffs
+    if isinstance(expected, float) or isinstance(actual, float):
+        if not (math.isclose(expected, actual, rel_tol=1e-9) or (math.isnan(expected) and math.isnan(actual))):
+            return [f"{path}: {expected} != {actual}"]
+        return []
+    return [] if expected == actual else [f"{path}: {expected} != {actual}"]
+
+def main():
+    parser = argparse.ArgumentParser(description='EDA 차트 데이터 집계 벤치마크')
+    parser.add_argument('--rows', type=int, default=3_000_000, help='합성 POS 행 수')
+    parser.add_argument('--days', type=int, default=730, help='기간(일)')
+    parser.add_argument('--products', type=int, default=300, help='상품 수')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수 (최소 시간 사용)')
+    parser.add_argument('--seed', type=int, default=42, help='난수 시드')
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    df = make_synthetic_pos(args.rows, args.days, args.products, args.seed)
+    logger.info(
+        f"합성 데이터 생성: {len(df):,}행, {df.memory_usage(deep=True).sum() / (1024 * 1024):,.0f}MB "
+        f"({time.perf_counter() - started:.1f}초)"
+    )
+
+    legacy, legacy_seconds, legacy_peak = measure(legacy_generate_chart_data, df, args.repeat)
+    logger.info(f"기존 열별 groupby: {legacy_seconds:.2f}초, 최대 추가 메모리 {legacy_peak:,.0f}MB")
+
+    compact, compact_seconds, compact_peak = measure(chart_aggregation_engine.generate, df, args.repeat)
+    logger.info(f"일별 x 시간 x 상품 큐브: {compact_seconds:.2f}초, 최대 추가 메모리 {compact_peak:,.0f}MB")
+
+    cube_cells = len(chart_aggregation_engine.build_cube(df)["cube"])
+    logger.info(f"큐브 셀 수: {cube_cells:,} (원본 대비 {cube_cells / len(df):.1%})")
+
+    diffs = diff_charts(legacy, compact)
+    logger.info(f"속도 향상: {legacy_seconds / compact_seconds:.1f}배, 결과 차이: {len(diffs)}건")
+    for diff in diffs[:20]:
+        logger.warning(diff)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+# benchmarks/mongo_async_benchmark.py
+# 실행: sosangomin-ai 디렉토리에서 python -m benchmarks.mongo_async_benchmark --uri mongodb://localhost:27017
+
+import time
+import random
+import asyncio
+import argparse
+import logging
+from typing import List, Dict, Any
+
+from pymongo import MongoClient
+from motor.motor_asyncio import AsyncIOMotorClient
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+DB_NAME = "sosangomin_benchmark"
+COLLECTION_NAME = "AnalysisResults"
+
+def make_documents(count: int, payload_kb: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """AnalysisResults와 비슷한 크기의 합성 문서"""
+    rng = random.Random(seed)
+    filler = "x" * 1024
+    return [
+        {
+            "store_id": rng.randint(1, 100),
+            "analysis_type": "combined_analysis",
+            "status": "completed",
+            "result_data": {f"chart_{i}": {"data": filler, "summary": filler[:200]} for i in range(payload_kb)}
+        }
+        for _ in range(count)
+    ]
+
+def percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(q / 100 * (len(ordered) - 1)))))
+    return ordered[index]
+
+def summarize(label: str, latencies: List[float], elapsed: float):
+    logger.info(
+        f"[{label}] 요청 {len(latencies)}건, 처리량 {len(latencies) / elapsed:.1f} req/s, "
+        f"p50 {percentile(latencies, 50) * 1000:.1f}ms, p99 {percentile(latencies, 99) * 1000:.1f}ms"
+    )
+
+async def run_sync(uri: str, ids: List[Any], concurrency: int, rounds: int, pool_size: int):
+    """기존 방식: async 핸들러 안에서 pymongo를 동기 호출 (이벤트 루프 블로킹)"""
+    client = MongoClient(uri, maxPoolSize=pool_size)
+    collection = client[DB_NAME][COLLECTION_NAME]
+    rng = random.Random(0)
+    latencies: List[float] = []
+
+    async def handler(wave_started: float):
+        collection.find_one({"_id": rng.choice(ids)})
+        latencies.append(time.perf_counter() - wave_started)
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        wave_started = time.perf_counter()
+        await asyncio.gather(*(handler(wave_started) for _ in range(concurrency)))
+    summarize(f"pymongo 동기, pool={pool_size}", latencies, time.perf_counter() - started)
+    client.close()
+
+async def run_motor(uri: str, ids: List[Any], concurrency: int, rounds: int, pool_size: int):
+    """Motor 비동기 호출"""
+    client = AsyncIOMotorClient(uri, maxPoolSize=pool_size)
+    collection = client[DB_NAME][COLLECTION_NAME]
+    rng = random.Random(0)
+    latencies: List[float] = []
+
+    async def handler(wave_started: float):
+        await collection.find_one({"_id": rng.choice(ids)})
+        latencies.append(time.perf_counter() - wave_started)
+
+    # 커넥션 풀 예열
+    await asyncio.gather(*(collection.find_one({"_id": ids[0]}) for _ in range(pool_size)))
+
+    started = time.perf_counter()
+    for _ in range(rounds):
+        wave_started = time.perf_counter()
+        await asyncio.gather(*(handler(wave_started) for _ in range(concurrency)))
+    summarize(f"Motor 비동기, pool={pool_size}", latencies, time.perf_counter() - started)
+    client.close()
+
+def main():
+    parser = argparse.ArgumentParser(description='MongoDB 동기/비동기 접근 지연 시간 벤치마크')
+    parser.add_argument('--uri', default='mongodb://localhost:27017', help='로컬 mongod URI')
+    parser.add_argument('--documents', type=int, default=500, help='시드 문서 수')
+    parser.add_argument('--payload-kb', type=int, default=16, help='문서당 대략적인 크기(KB)')
+    parser.add_argument('--concurrency', type=int, default=50, help='동시 요청 수 (한 웨이브)')
+    parser.add_argument('--rounds', type=int, default=40, help='웨이브 반복 횟수')
+    parser.add_argument('--pool-sizes', default='10,50', help='비교할 커넥션 풀 크기 목록')
+    args = parser.parse_args()
+
+    seed_client = MongoClient(args.uri)
+    collection = seed_client[DB_NAME][COLLECTION_NAME]
+    collection.drop()
+    ids = collection.insert_many(make_documents(args.documents, args.payload_kb)).inserted_ids
+    logger.info(f"시드 문서 {len(ids)}개 생성 ({args.payload_kb}KB/문서)")
+
+    try:
+        for pool_size in [int(size) for size in args.pool_sizes.split(',')]:
+            asyncio.run(run_sync(args.uri, ids, args.concurrency, args.rounds, pool_size))
+            asyncio.run(run_motor(args.uri, ids, args.concurrency, args.rounds, pool_size))
+    finally:
+        seed_client.drop_database(DB_NAME)
+        seed_client.close()
+
+if __name__ == "__main__":
+    main()
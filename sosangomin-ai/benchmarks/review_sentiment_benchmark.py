@@ -0,0 +1,196 @@
+# benchmarks/review_sentiment_benchmark.py
+# 실행: sosangomin-ai 디렉토리에서 python -m benchmarks.review_sentiment_benchmark
+
+import os
+import time
+import random
+import asyncio
+import argparse
+import logging
+import multiprocessing
+import concurrent.futures
+from typing import List, Dict, Any, Tuple
+
+from services.review_service import review_service
+from services.review_tokenizer import ReviewTokenizer
+from services.review_analysis_worker import analyze_batch, init_worker
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+FILLER_WORDS = [
+    "오늘", "점심", "메뉴", "주문", "가게", "사장님", "직원", "분위기", "가격", "양",
+    "국물", "고기", "반찬", "주차", "대기", "시간", "친구", "가족", "자리", "테이블"
+]
+
+def make_synthetic_reviews(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """사전 단어와 일반 단어를 섞은 합성 리뷰 생성"""
+    rng = random.Random(seed)
+    lexicon = list(review_service.sentiment_dict.keys())
+
+    reviews = []
+    for _ in range(count):
+        words = rng.choices(FILLER_WORDS, k=rng.randint(8, 25))
+        for _ in range(rng.randint(1, 4)):
+            words.insert(rng.randrange(len(words) + 1), rng.choice(lexicon) + rng.choice(["요", "다", "네요", ""]))
+        reviews.append({"text": " ".join(words), "rating": 0, "date": "알 수 없음"})
+    return reviews
+
+def legacy_score(morphs: List[Tuple[str, str]]) -> Tuple[float, List[str]]:
+    """기존 전수 비교 방식"""
+    sentiment_score = 0
+    matched_words = []
+    for word, pos in morphs:
+        if pos in ['Adjective', 'Verb', 'Noun']:
+            for sentiment_word, score in review_service.sentiment_dict.items():
+                if sentiment_word in word:
+                    sentiment_score += score
+                    matched_words.append(word)
+    return sentiment_score, matched_words
+
+def matcher_score(morphs: List[Tuple[str, str]]) -> Tuple[float, List[str]]:
+    """Aho–Corasick 매처 방식"""
+    sentiment_score = 0
+    matched_words = []
+    for word, pos in morphs:
+        if pos in ['Adjective', 'Verb', 'Noun']:
+            score, match_count = review_service.sentiment_matcher.score(word)
+            if match_count:
+                sentiment_score += score
+                matched_words.append(word)
+    return sentiment_score, matched_words
+
+def parse_worker_counts(value: str) -> List[int]:
+    """'1,2,4,N' 형식의 워커 수 목록 파싱 (N은 CPU 코어 수)"""
+    cpu_count = os.cpu_count() or 1
+    counts = [cpu_count if item.strip().upper() == "N" else int(item) for item in value.split(",") if item.strip()]
+    return sorted(set(count for count in counts if count > 0))
+
+def measure_parallel(reviews: List[Dict[str, Any]], workers: int, batch_size: int) -> Tuple[float, float]:
+    """
+    워커 수별 프로세스 풀 처리량 측정
+
+    Returns:
+        Tuple: (워커 기동 이후 reviews/sec, 워커 기동(JVM 포함) 소요 시간(초))
+    """
+    started = time.perf_counter()
+    pool = concurrent.futures.ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=init_worker,
+        initargs=(review_service.sentiment_dict, review_service.stopwords)
+    )
+    batches = [reviews[i:i + batch_size] for i in range(0, len(reviews), batch_size)]
+
+    async def run():
+        loop = asyncio.get_running_loop()
+        # 워커 예열 (JVM 기동)
+        await asyncio.gather(*[loop.run_in_executor(pool, analyze_batch, reviews[:1]) for _ in range(workers)])
+        warmed = time.perf_counter()
+        await asyncio.gather(*[loop.run_in_executor(pool, analyze_batch, batch) for batch in batches])
+        return warmed - started, time.perf_counter() - warmed
+
+    try:
+        startup_seconds, seconds = asyncio.run(run())
+        return len(reviews) / seconds, startup_seconds
+    finally:
+        pool.shutdown()
+
+def measure_pipeline(reviews: List[Dict[str, Any]], workers: int, batch_size: int) -> Tuple[float, int]:
+    """
+    감성 분석 + 워드 클라우드 + 카테고리 분석 전체 처리량 측정 (review_service 경로, 워커 기동 시간 제외)
+
+    Returns:
+        Tuple: (reviews/sec, 워커 분석 이후 현재 프로세스에서 다시 실행된 Okt 호출 수)
+    """
+    review_service.close_analysis_pool()
+    review_service.analysis_workers = workers
+    review_service.analysis_batch_size = batch_size
+    review_service.tokenizer = ReviewTokenizer(review_service.okt)
+
+    async def run():
+        # 워커 예열 (JVM 기동)
+        pool = review_service._get_analysis_pool()
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*[loop.run_in_executor(pool, analyze_batch, reviews[:1]) for _ in range(workers)])
+        review_service.tokenizer = ReviewTokenizer(review_service.okt)
+
+        started = time.perf_counter()
+        analyzed = await review_service.analyze_sentiment(reviews)
+        misses_before = review_service.tokenizer.misses
+        await review_service.generate_word_cloud_data(analyzed)
+        await review_service.generate_category_insights(analyzed)
+        return time.perf_counter() - started, review_service.tokenizer.misses - misses_before
+
+    try:
+        seconds, parent_okt_calls = asyncio.run(run())
+        return len(reviews) / seconds, parent_okt_calls
+    finally:
+        review_service.close_analysis_pool()
+
+def main():
+    parser = argparse.ArgumentParser(description='리뷰 감성 사전 매칭 벤치마크')
+    parser.add_argument('--reviews', type=int, default=3000, help='합성 리뷰 수')
+    parser.add_argument('--seed', type=int, default=42, help='난수 시드')
+    parser.add_argument('--workers', type=parse_worker_counts, default="1,2,4,N",
+                        help='측정할 워커 수 목록 (쉼표 구분, N은 CPU 코어 수)')
+    parser.add_argument('--batch-size', type=int, default=10, help='워커당 배치 크기')
+    args = parser.parse_args()
+
+    reviews = make_synthetic_reviews(args.reviews, args.seed)
+
+    started = time.perf_counter()
+    tokenized = [review_service.okt.pos(review["text"].lower()) for review in reviews]
+    okt_seconds = time.perf_counter() - started
+    logger.info(f"형태소 분석: {len(reviews) / okt_seconds:,.0f} reviews/sec")
+
+    started = time.perf_counter()
+    legacy = [legacy_score(morphs) for morphs in tokenized]
+    legacy_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    compiled = [matcher_score(morphs) for morphs in tokenized]
+    matcher_seconds = time.perf_counter() - started
+
+    mismatches = sum(
+        1 for (ls, lw), (ms, mw) in zip(legacy, compiled)
+        if ls != ms or set(lw) != set(mw)
+    )
+
+    logger.info(f"사전 매칭 (기존 전수 비교): {len(reviews) / legacy_seconds:,.0f} reviews/sec")
+    logger.info(f"사전 매칭 (Aho–Corasick): {len(reviews) / matcher_seconds:,.0f} reviews/sec")
+    logger.info(f"속도 향상: {legacy_seconds / matcher_seconds:.1f}배, 결과 불일치: {mismatches}건")
+
+    started = time.perf_counter()
+    for review in reviews:
+        review_service._analyze_single_review(review)
+    total_seconds = time.perf_counter() - started
+    logger.info(f"_analyze_single_review 전체: {len(reviews) / total_seconds:,.0f} reviews/sec")
+
+    # 캐시 효과를 배제하기 위해 다른 시드의 리뷰로 병렬 처리 측정
+    parallel_reviews = make_synthetic_reviews(args.reviews, args.seed + 1)
+    logger.info(f"CPU 코어 {os.cpu_count()}개, 워커 수 {args.workers}")
+    serial_throughput = len(reviews) / total_seconds
+    for workers in args.workers:
+        throughput, startup_seconds = measure_parallel(parallel_reviews, workers, args.batch_size)
+        logger.info(
+            f"프로세스 풀 워커 {workers}개: {throughput:,.0f} reviews/sec "
+            f"(프로세스 내 대비 {throughput / serial_throughput:.2f}배), 워커 기동 {startup_seconds * 1000:,.0f}ms"
+        )
+
+    # 워드 클라우드/카테고리 분석까지 포함한 서비스 경로의 코어 수별 처리량
+    pipeline_reviews = make_synthetic_reviews(args.reviews, args.seed + 2)
+    baseline = None
+    for workers in args.workers:
+        throughput, parent_okt_calls = measure_pipeline(pipeline_reviews, workers, args.batch_size)
+        baseline = baseline or throughput
+        logger.info(
+            f"전체 분석 경로 워커 {workers}개: {throughput:,.0f} reviews/sec ({throughput / baseline:.2f}배), "
+            f"부모 프로세스 Okt 재호출 {parent_okt_calls}건"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+# database/async_connector.py
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncEngine, AsyncSession
+from typing import Any, Callable, Dict
+import os
+from dotenv import load_dotenv
+import logging
+
+logger = logging.getLogger(__name__)
+
+class AsyncDatabase:
+    """
+    MariaDB 비동기 엔진 (aiomysql)
+
+    읽기 위주의 분석 API용으로 connector.Database와 함께 사용한다.
+    MARIA_DB_READ_HOST가 설정되면 read_only 세션은 읽기 복제본으로 보낸다.
+    """
+
+    def __init__(self):
+        load_dotenv("./config/.env")
+
+        self.host = os.getenv("MARIA_DB_HOST")
+        self.port = int(os.getenv("MARIA_DB_PORT", 3306))
+        self.user = os.getenv("MARIA_DB_USER")
+        self.password = os.getenv("MARIA_DB_PASSWORD")
+        self.schema = os.getenv("MARIA_DB_SCHEMA")
+        self.charset = os.getenv("MARIA_DB_CHARSET", "utf8")
+
+        # 읽기 전용 복제본 (선택)
+        self.read_host = os.getenv("MARIA_DB_READ_HOST")
+        self.read_port = int(os.getenv("MARIA_DB_READ_PORT", self.port))
+
+        self.pool_size = int(os.getenv("MARIA_DB_ASYNC_POOL_SIZE", 10))
+        self.max_overflow = int(os.getenv("MARIA_DB_ASYNC_MAX_OVERFLOW", 10))
+        self.pool_recycle = int(os.getenv("MARIA_DB_ASYNC_POOL_RECYCLE", 120))
+        self.pool_timeout = int(os.getenv("MARIA_DB_ASYNC_POOL_TIMEOUT", 30))
+
+        self._metrics: Dict[str, Dict[str, int]] = {}
+
+        self.engine = self._create_engine("primary", self.host, self.port)
+        self.read_engine = self._create_engine("replica", self.read_host, self.read_port) if self.read_host else self.engine
+
+        self.pre_session = async_sessionmaker(self.engine, expire_on_commit=False, autoflush=False)
+        self.read_session = async_sessionmaker(self.read_engine, expire_on_commit=False, autoflush=False)
+
+    def _create_engine(self, label: str, host: str, port: int) -> AsyncEngine:
+        engine = create_async_engine(
+            f"mysql+aiomysql://{self.user}:"+
+            f"{self.password}@{host}:{port}/"+
+            f"{self.schema}?charset={self.charset}",
+            pool_size=self.pool_size,
+            max_overflow=self.max_overflow,
+            pool_recycle=self.pool_recycle,
+            pool_timeout=self.pool_timeout,
+            pool_pre_ping=True,
+            echo=False
+        )
+
+        metrics = self._metrics[label] = {"checkouts": 0, "checked_out": 0, "peak_checked_out": 0}
+
+        @event.listens_for(engine.sync_engine, "checkout")
+        def on_checkout(dbapi_connection, connection_record, connection_proxy):
+            metrics["checkouts"] += 1
+            metrics["checked_out"] += 1
+            metrics["peak_checked_out"] = max(metrics["peak_checked_out"], metrics["checked_out"])
+
+        @event.listens_for(engine.sync_engine, "checkin")
+        def on_checkin(dbapi_connection, connection_record):
+            metrics["checked_out"] = max(0, metrics["checked_out"] - 1)
+
+        return engine
+
+    def session(self, read_only: bool = False) -> AsyncSession:
+        """
+        비동기 세션 생성 (async with로 사용)
+
+        Args:
+            read_only: True면 읽기 복제본(설정된 경우)으로 라우팅
+        """
+        return self.read_session() if read_only else self.pre_session()
+
+    async def run_read(self, fn: Callable[..., Any], *args) -> Any:
+        """
+        동기 Session을 받는 기존 조회 함수를 비동기 엔진의 읽기 세션에서 실행
+
+        Args:
+            fn: 첫 번째 인자로 Session을 받는 함수 (예: area_analysis_service.get_sales_detail)
+        """
+        async with self.session(read_only=True) as db:
+            return await db.run_sync(fn, *args)
+
+    def pool_stats(self) -> Dict[str, Dict[str, Any]]:
+        """엔진별 커넥션 풀 사용 현황"""
+        engines = {"primary": self.engine}
+        if self.read_engine is not self.engine:
+            engines["replica"] = self.read_engine
+
+        stats = {}
+        for label, engine in engines.items():
+            pool = engine.sync_engine.pool
+            capacity = self.pool_size + self.max_overflow
+            checked_out = pool.checkedout()
+            stats[label] = {
+                "pool_size": pool.size(),
+                "max_overflow": self.max_overflow,
+                "checked_in": pool.checkedin(),
+                "checked_out": checked_out,
+                "overflow": pool.overflow(),
+                "utilization": round(checked_out / capacity, 3) if capacity else None,
+                **self._metrics[label]
+            }
+        return stats
+
+    async def dispose(self):
+        await self.engine.dispose()
+        if self.read_engine is not self.engine:
+            await self.read_engine.dispose()
+
+async_database_instance = AsyncDatabase()
@@ -0,0 +1,76 @@
+# database/async_mongo_connector.py
+
+from motor.motor_asyncio import AsyncIOMotorClient
+import os
+from dotenv import load_dotenv
+import logging
+
+logger = logging.getLogger(__name__)
+
+class AsyncMongoDatabase:
+    """
+    이벤트 루프를 막지 않는 MongoDB 접근 계층 (Motor)
+
+    mongo_connector.MongoDatabase와 같은 DB/컬렉션을 노출하며,
+    async 라우터/서비스의 조회·저장은 이쪽을 사용한다.
+    """
+
+    def __init__(self):
+        load_dotenv("./config/.env")
+
+        self.username = os.getenv("MONGO_USER")
+        self.password = os.getenv("MONGO_PASSWORD")
+        self.host = os.getenv("MONGO_HOST")
+        self.database_name = os.getenv("MONGO_DB")
+
+        self.connection_string = os.getenv(
+            "MONGO_URI",
+            f"mongodb+srv://{self.username}:{self.password}@{self.host}/{self.database_name}?authSource=admin"
+        )
+
+        self.max_pool_size = int(os.getenv("MONGO_ASYNC_MAX_POOL_SIZE", 50))
+        self.min_pool_size = int(os.getenv("MONGO_ASYNC_MIN_POOL_SIZE", 0))
+        self.max_idle_time_ms = int(os.getenv("MONGO_ASYNC_MAX_IDLE_TIME_MS", 60000))
+        self.wait_queue_timeout_ms = int(os.getenv("MONGO_ASYNC_WAIT_QUEUE_TIMEOUT_MS", 5000))
+
+        # 클라이언트는 첫 사용 시점의 이벤트 루프에 연결되도록 지연 생성
+        self.client = None
+        self.db = None
+
+    def _get_db(self):
+        if self.client is None:
+            self.client = AsyncIOMotorClient(
+                self.connection_string,
+                maxPoolSize=self.max_pool_size,
+                minPoolSize=self.min_pool_size,
+                maxIdleTimeMS=self.max_idle_time_ms,
+                waitQueueTimeoutMS=self.wait_queue_timeout_ms,
+                serverSelectionTimeoutMS=3000
+            )
+            self.db = self.client[self.database_name]
+            logger.info(f"비동기 MongoDB 클라이언트 생성 (maxPoolSize={self.max_pool_size})")
+        return self.db
+
+    def get_collection(self, collection_name):
+        """
+        지정된 이름의 비동기 MongoDB 컬렉션을 반환.
+
+        Args:
+            collection_name: 컬렉션 이름
+
+        Returns:
+            AsyncIOMotorCollection: Motor 컬렉션 객체
+        """
+        return self._get_db()[collection_name]
+
+    def close(self):
+        """
+        비동기 MongoDB 연결을 닫음.
+        """
+        if self.client is not None:
+            self.client.close()
+            self.client = None
+            self.db = None
+            logger.info("비동기 MongoDB 연결이 닫혔습니다.")
+
+async_mongo_instance = AsyncMongoDatabase()
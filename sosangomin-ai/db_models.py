@@ -2,7 +2,7 @@
 import os
 import logging
 import datetime
-from sqlalchemy import create_engine, event, Column, String, DateTime, Integer, Text, ForeignKey, Date, Enum, Float, BigInteger, INTEGER, Boolean
+from sqlalchemy import create_engine, event, Column, String, DateTime, Integer, Text, ForeignKey, Date, Enum, Float, BigInteger, INTEGER, Boolean, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
@@ -37,6 +37,13 @@ class News(Base):
     created_at = Column(DateTime)
     updated_at = Column(DateTime)
 
+    __table_args__ = (
+        Index('ix_news_category_pub_date', 'category', 'pub_date'),
+        Index('ix_news_pub_date', 'pub_date'),
+        # TEXT 컬럼이므로 앞 512자 기준 unique
+        Index('ux_news_link', 'link', unique=True, mysql_length=512),
+    )
+
 class ChatSession(Base):
     __tablename__ = 'chat_sessions'
     uid = Column(String(36), primary_key=True)
@@ -2,6 +2,7 @@
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+import asyncio
 import logging
 from dotenv import load_dotenv
 import os
@@ -16,6 +17,21 @@ from schedulers.area_analysis_scheduler import start_area_scheduler
 from schedulers.transport_scheduler import start_subway_station_scheduler
 from schedulers.weather_scheduler import start_weather_scheduler
 
+from services.webdriver_pool import webdriver_pool
+from services.review_fetcher import review_fetcher
+from services.naver_api_client import naver_api_client
+from services.place_id_resolver import place_id_resolver
+from services.review_cache import place_review_cache
+from services.chat_context_cache import chat_context_cache
+from services.news_query_service import news_query_service
+from services.data_listing_service import data_listing_service
+from services.analysis_artifact_store import analysis_artifact_store
+from services.final_report_service import final_report_service
+from database.connector import database_instance
+from database.async_mongo_connector import async_mongo_instance
+from database.async_connector import async_database_instance
+from services.review_service import review_service
+
 is_windows = platform.system() == "Windows"
 if not is_windows:
     import fcntl
@@ -64,8 +80,27 @@ app.include_router(location_recommendation_router.router)
 def read_root():
     return {"message": "소상공인을 위한 API 서비스가 실행 중입니다."}
 
+@app.get("/api/metrics/db-pool")
+def db_pool_metrics():
+    """비동기 MariaDB 엔진의 커넥션 풀 사용 현황"""
+    return async_database_instance.pool_stats()
+
 @app.on_event("startup")
 async def startup_event():
+    # WebDriver 풀은 워커 프로세스마다 존재하므로 스케줄러 락과 무관하게 예열
+    asyncio.create_task(webdriver_pool.warm_up())
+
+    # news 목록 조회용 인덱스 (이미 있으면 건너뜀)
+    await asyncio.get_running_loop().run_in_executor(None, news_query_service.ensure_indexes, database_instance.engine)
+
+    # DataSources / AnalysisResults 목록 조회용 인덱스
+    await data_listing_service.ensure_indexes()
+    await analysis_artifact_store.ensure_indexes()
+    await final_report_service.report_engine.ensure_indexes()
+    await place_id_resolver.ensure_indexes()
+    await place_review_cache.ensure_indexes()
+    await chat_context_cache.ensure_indexes()
+
     if is_windows:
         # Windows 환경에서는 스케줄러를 단순히 시작
         logger.info("Windows 환경에서 스케줄러 시작 (파일 잠금 없음)")
@@ -114,6 +149,14 @@ async def startup_event():
 
 @app.on_event("shutdown")
 async def shutdown_event():
+    await webdriver_pool.close()
+    await review_fetcher.close()
+    await naver_api_client.close()
+    await place_id_resolver.close()
+    review_service.close_analysis_pool()
+    async_mongo_instance.close()
+    await async_database_instance.dispose()
+
     if is_windows:
         logger.info("Windows 환경에서 애플리케이션 종료")
         return
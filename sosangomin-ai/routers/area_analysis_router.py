@@ -1,5 +1,6 @@
 from fastapi import APIRouter, HTTPException, Path, Query, Form
-from database.connector import database_instance
+import asyncio
+from database.async_connector import async_database_instance
 from services.area_analysis_service import area_analysis_service
 import logging
 
@@ -12,53 +13,54 @@ router = APIRouter(
 )
 
 @router.get("/summary")
-def summary_view(region_name: str = Query(..., description="행정동 이름"), industry_name: str = Query(..., description="업종 이름")):
-    db = database_instance.pre_session()
-    try:
-        return area_analysis_service.get_summary_analysis(db, region_name, industry_name)
-    finally:
-        db.close()
+async def summary_view(region_name: str = Query(..., description="행정동 이름"), industry_name: str = Query(..., description="업종 이름")):
+    return await async_database_instance.run_read(area_analysis_service.get_summary_analysis, region_name, industry_name)
 
 @router.get("/population")
-def population_analysis(region_name: str = Query(..., description="행정동 이름")):
-    db = database_instance.pre_session()
-    try:
-        result = {
-            "resident_pop": area_analysis_service.get_resident_population_analysis(db, region_name),
-            "working_pop": area_analysis_service.get_working_population_analysis(db, region_name),
-            "floating_pop": area_analysis_service.get_floating_population_analysis(db, region_name)
-        }
-        return result
-    finally:
-        db.close()
+async def population_analysis(region_name: str = Query(..., description="행정동 이름")):
+    resident_pop, working_pop, floating_pop = await asyncio.gather(
+        async_database_instance.run_read(area_analysis_service.get_resident_population_analysis, region_name),
+        async_database_instance.run_read(area_analysis_service.get_working_population_analysis, region_name),
+        async_database_instance.run_read(area_analysis_service.get_floating_population_analysis, region_name)
+    )
+    result = {
+        "resident_pop": resident_pop,
+        "working_pop": working_pop,
+        "floating_pop": floating_pop
+    }
+    return result
 
 @router.get("/category")
-def category_analysis(region_name: str = Query(..., description="행정동 이름"), industry_name: str = Query(..., description="업종 이름")):
-    db = database_instance.pre_session()
-    try:
-        result = {
-            "main_category_store_count": area_analysis_service.get_main_category_store_count(db, region_name),
-            "food_category_stats": area_analysis_service.get_food_store_category_stats(db, region_name, industry_name),
-            "store_open_close": area_analysis_service.get_store_open_close_trend(db, region_name, industry_name),
-            "operation_duration_summary": area_analysis_service.get_store_operation_duration_summary(db, region_name)
-        }
-        return result
-    finally:
-        db.close()
+async def category_analysis(region_name: str = Query(..., description="행정동 이름"), industry_name: str = Query(..., description="업종 이름")):
+    store_count, category_stats, open_close, duration = await asyncio.gather(
+        async_database_instance.run_read(area_analysis_service.get_main_category_store_count, region_name),
+        async_database_instance.run_read(area_analysis_service.get_food_store_category_stats, region_name, industry_name),
+        async_database_instance.run_read(area_analysis_service.get_store_open_close_trend, region_name, industry_name),
+        async_database_instance.run_read(area_analysis_service.get_store_operation_duration_summary, region_name)
+    )
+    result = {
+        "main_category_store_count": store_count,
+        "food_category_stats": category_stats,
+        "store_open_close": open_close,
+        "operation_duration_summary": duration
+    }
+    return result
 
 @router.get("/sales")
-def sales_analysis(region_name: str = Query(..., description="행정동 이름"), industry_name: str = Query(..., description="업종 이름")):
-    db = database_instance.pre_session()
-    try:
-        result = {
-            "main_category_sales_count": area_analysis_service.get_main_category_sales_count(db, region_name),
-            "food_sales_stats": area_analysis_service.get_food_store_sales_stats(db, region_name, industry_name),
-            "sales_comparison": area_analysis_service.get_industry_sales_comparison(db, industry_name, region_name),
-            "sales_detail": area_analysis_service.get_sales_detail(db, region_name, industry_name)
-        }
-        return result
-    finally:
-        db.close()
+async def sales_analysis(region_name: str = Query(..., description="행정동 이름"), industry_name: str = Query(..., description="업종 이름")):
+    sales_count, sales_stats, comparison, detail = await asyncio.gather(
+        async_database_instance.run_read(area_analysis_service.get_main_category_sales_count, region_name),
+        async_database_instance.run_read(area_analysis_service.get_food_store_sales_stats, region_name, industry_name),
+        async_database_instance.run_read(area_analysis_service.get_industry_sales_comparison, industry_name, region_name),
+        async_database_instance.run_read(area_analysis_service.get_sales_detail, region_name, industry_name)
+    )
+    result = {
+        "main_category_sales_count": sales_count,
+        "food_sales_stats": sales_stats,
+        "sales_comparison": comparison,
+        "sales_detail": detail
+    }
+    return result
 
 # 테스트 전용 실행 
 if __name__ == "__main__":
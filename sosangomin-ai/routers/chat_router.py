@@ -1,6 +1,8 @@
 # routers/chat_router.py
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+import json
 import logging
 from typing import Optional
 from pydantic import BaseModel
@@ -39,3 +41,35 @@ async def chat(request: ChatRequest):
     except Exception as e:
         logger.error(f"챗팅 처리 중 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
+
+@router.post("/chat/stream")
+async def chat_stream(request: ChatRequest):
+    """
+    통합 챗봇 스트리밍 API (Server-Sent Events)
+    
+    `start`(session_id, message_type) → `token`(text) 반복 → `done`(전체 답변, TTFT) 순서로 전송
+    """
+    async def event_stream():
+        try:
+            async for event in chat_service.process_chat_stream(
+                user_id=request.user_id,
+                user_message=request.message,
+                session_id=request.session_id,
+                store_id=request.store_id
+            ):
+                event_name = event.pop("event")
+                yield f"event: {event_name}\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+        except Exception as e:
+            logger.error(f"스트리밍 챗팅 처리 중 오류: {str(e)}")
+            yield f"event: error\ndata: {json.dumps({'message': str(e)}, ensure_ascii=False)}\n\n"
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.get("/chat/metrics")
+async def chat_stream_metrics():
+    """스트리밍 챗봇 응답 지표 (요청 수, 오류 수, TTFT/전체 응답 시간 p50·p95)"""
+    return chat_service.stream_metrics()
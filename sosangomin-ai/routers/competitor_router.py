@@ -1,7 +1,7 @@
 # routers/competitor_router.py
 
 from fastapi import APIRouter, HTTPException, Path, Body, Query
-from typing import Optional
+from typing import Optional, List
 import logging
 from pydantic import BaseModel
 from services.competitor_service import competitor_service
@@ -23,6 +23,12 @@ class CompetitorComparisonRequest(BaseModel):
     competitor_place_id: str
     analysis_id: Optional[str] = None  
 
+class CompetitorMultiComparisonRequest(BaseModel):
+    store_id: int
+    competitor_names: List[str]
+
+MAX_COMPETITORS_PER_REQUEST = 10
+
 @router.post("/search")
 async def search_competitor(request: CompetitorAnalysisRequest):
     """
@@ -95,6 +101,36 @@ async def compare_with_competitor(request: CompetitorComparisonRequest):
         logger.error(f"리뷰 비교 분석 중 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=f"리뷰 비교 분석 중 오류가 발생했습니다: {str(e)}")
 
+@router.post("/compare-many")
+async def compare_with_competitors(request: CompetitorMultiComparisonRequest):
+    """
+    내 점포와 여러 경쟁사 일괄 비교 분석 API
+    
+    경쟁사들을 동시에 검색/분석하여 하나의 비교 문서로 저장.
+    경쟁사별 소요 시간과 실패한 경쟁사 목록을 함께 반환.
+    """
+    try:
+        if len(request.competitor_names) > MAX_COMPETITORS_PER_REQUEST:
+            raise HTTPException(
+                status_code=400,
+                detail=f"경쟁사는 한 번에 최대 {MAX_COMPETITORS_PER_REQUEST}곳까지 비교할 수 있습니다."
+            )
+        
+        result = await competitor_service.compare_with_competitors(
+            request.store_id,
+            request.competitor_names
+        )
+        
+        if result.get("status") == "error":
+            raise HTTPException(status_code=400, detail=result.get("message"))
+        
+        return result
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"다중 경쟁사 비교 분석 중 오류: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"다중 경쟁사 비교 분석 중 오류가 발생했습니다: {str(e)}")
+
 @router.get("/comparison/{comparison_id}")
 async def get_comparison_result(comparison_id: str = Path(..., description="비교 분석 결과 ID")):
     """
@@ -4,7 +4,8 @@ from fastapi import APIRouter, HTTPException, Path, Form
 import logging
 from bson import ObjectId
 from typing import List
-from database.mongo_connector import mongo_instance
+from database.async_mongo_connector import async_mongo_instance
+from services.analysis_artifact_store import analysis_artifact_store
 from services.s3_service import (
     download_file_from_s3, 
     get_s3_presigned_url,
@@ -60,11 +61,11 @@ async def get_auto_analysis_result(
         except:
             raise HTTPException(status_code=400, detail="유효하지 않은 분석 결과 ID입니다.")
 
-        collection = mongo_instance.get_collection("AnalysisResults")
-        result = collection.find_one({"_id": ObjectId(result_id), "analysis_type": "autoanalysis"})
+        collection = async_mongo_instance.get_collection("AnalysisResults")
+        result = await collection.find_one({"_id": ObjectId(result_id), "analysis_type": "autoanalysis"})
         if not result:
             raise HTTPException(status_code=404, detail="해당 ID의 AutoAnalysis 결과를 찾을 수 없습니다.")
-        return result
+        return await analysis_artifact_store.hydrate(result)
     except Exception as e:
         logger.error(f"AutoAnalysis 결과 조회 중 오류: {str(e)}")
         raise HTTPException(status_code=500, detail="AutoAnalysis 결과 조회 중 오류가 발생했습니다.")
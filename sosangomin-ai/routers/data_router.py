@@ -6,7 +6,9 @@ import logging
 from bson import ObjectId
 from datetime import datetime
 
-from database.mongo_connector import mongo_instance
+from database.async_mongo_connector import async_mongo_instance
+from services.data_listing_service import data_listing_service
+from services.analysis_artifact_store import analysis_artifact_store
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -20,31 +22,25 @@ router = APIRouter(
 
 @router.get("/datasources")
 async def list_datasources(
-    store_id: Optional[int] = Query(None, description="특정 상점의 데이터만 조회")
+    store_id: Optional[int] = Query(None, description="특정 상점의 데이터만 조회"),
+    limit: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor")
 ):
     """
-    데이터소스 목록을 조회.
+    데이터소스 요약 목록을 최신 업로드순으로 조회.
     """
     try:
-        data_sources = mongo_instance.get_collection("DataSources")
-        
-        filter_query = {}
-        if store_id is not None:
-            filter_query["store_id"] = store_id
-        
-        cursor = data_sources.find(filter_query).sort("upload_date", -1)
-        
-        sources = []
-        for source in cursor:
-            source["_id"] = str(source["_id"])
-            sources.append(source)
+        page = await data_listing_service.list_datasources(store_id, limit, cursor)
         
         return {
             "status": "success",
-            "count": len(sources),
-            "datasources": sources
+            "count": len(page["items"]),
+            "datasources": page["items"],
+            "next_cursor": page["next_cursor"]
         }
     
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"데이터소스 목록 조회 중 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=f"데이터소스 목록 조회 중 오류가 발생했습니다: {str(e)}")
@@ -60,8 +56,8 @@ async def get_datasource(source_id: str):
         except:
             raise HTTPException(status_code=400, detail="유효하지 않은 데이터소스 ID입니다.")
             
-        data_sources = mongo_instance.get_collection("DataSources")
-        source = data_sources.find_one({"_id": obj_id})
+        data_sources = async_mongo_instance.get_collection("DataSources")
+        source = await data_sources.find_one({"_id": obj_id})
         
         if not source:
             raise HTTPException(status_code=404, detail=f"ID가 {source_id}인 데이터소스를 찾을 수 없습니다.")
@@ -81,37 +77,34 @@ async def get_datasource(source_id: str):
     
 @router.get("/analysis")
 async def list_analysis_results(
-    source_id: Optional[str] = Query(None, description="특정 데이터소스의 분석 결과만 조회")
+    source_id: Optional[str] = Query(None, description="특정 데이터소스의 분석 결과만 조회"),
+    limit: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor")
 ):
     """
-    분석 결과 목록을 조회.
+    분석 결과 요약 목록을 최신순으로 조회. 전체 결과는 /analysis/{analysis_id}로 조회.
     """
     try:
-        analysis_results = mongo_instance.get_collection("AnalysisResults")
-        
-        filter_query = {}
+        source_obj_id = None
         if source_id:
             try:
-                filter_query["source_id"] = ObjectId(source_id)
+                source_obj_id = ObjectId(source_id)
             except:
                 raise HTTPException(status_code=400, detail="유효하지 않은 데이터소스 ID입니다.")
         
-        cursor = analysis_results.find(filter_query).sort("created_at", -1)
-        
-        results = []
-        for result in cursor:
-            result["_id"] = str(result["_id"])
-            result["source_id"] = str(result["source_id"])
-            results.append(result)
+        page = await data_listing_service.list_analysis_results(source_obj_id, limit, cursor)
         
         return {
             "status": "success",
-            "count": len(results),
-            "analysis_results": results
+            "count": len(page["items"]),
+            "analysis_results": page["items"],
+            "next_cursor": page["next_cursor"]
         }
     
     except HTTPException:
         raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"분석 결과 목록 조회 중 오류: {str(e)}")
         raise HTTPException(status_code=500, detail=f"분석 결과 목록 조회 중 오류가 발생했습니다: {str(e)}")
@@ -127,12 +120,13 @@ async def get_analysis_result(analysis_id: str):
         except:
             raise HTTPException(status_code=400, detail="유효하지 않은 분석 결과 ID입니다.")
             
-        analysis_results = mongo_instance.get_collection("AnalysisResults")
-        result = analysis_results.find_one({"_id": obj_id})
+        analysis_results = async_mongo_instance.get_collection("AnalysisResults")
+        result = await analysis_results.find_one({"_id": obj_id})
         
         if not result:
             raise HTTPException(status_code=404, detail=f"ID가 {analysis_id}인 분석 결과를 찾을 수 없습니다.")
         
+        result = await analysis_artifact_store.hydrate(result)
         result["_id"] = str(result["_id"])
         result["source_id"] = str(result["source_id"])
         
@@ -161,8 +155,8 @@ async def get_datasource_download_url(
         except:
             raise HTTPException(status_code=400, detail="유효하지 않은 데이터소스 ID입니다.")
             
-        data_sources = mongo_instance.get_collection("DataSources")
-        source = data_sources.find_one({"_id": obj_id})
+        data_sources = async_mongo_instance.get_collection("DataSources")
+        source = await data_sources.find_one({"_id": obj_id})
         
         if not source:
             raise HTTPException(status_code=404, detail=f"ID가 {source_id}인 데이터소스를 찾을 수 없습니다.")
@@ -174,7 +168,7 @@ async def get_datasource_download_url(
         from services.s3_service import get_s3_presigned_url
         url = get_s3_presigned_url(s3_key, expiration)
         
-        data_sources.update_one(
+        await data_sources.update_one(
             {"_id": obj_id},
             {"$set": {"last_accessed": datetime.now()}}
         )
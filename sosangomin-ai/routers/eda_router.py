@@ -8,7 +8,8 @@ from datetime import datetime, timedelta
 from bson import ObjectId
 from pydantic import BaseModel
 from services.eda_service import eda_service
-from database.mongo_connector import mongo_instance
+from database.async_mongo_connector import async_mongo_instance
+from services.analysis_artifact_store import analysis_artifact_store
 
 # 로거 설정
 logger = logging.getLogger(__name__)
@@ -43,10 +44,10 @@ async def perform_combined_analysis(request: CombinedAnalysisRequest):
             except Exception:
                 raise HTTPException(status_code=400, detail=f"유효하지 않은 source_id: {sid}")
         
-        analysis_results = mongo_instance.get_collection("AnalysisResults")
+        analysis_results = async_mongo_instance.get_collection("AnalysisResults")
         time_threshold = datetime.now() - timedelta(hours=12)
         
-        recent_result = analysis_results.find_one({
+        recent_result = await analysis_results.find_one({
             "store_id": request.store_id,
             "analysis_type": "combined_analysis",
             "created_at": {"$gte": time_threshold},
@@ -54,6 +55,7 @@ async def perform_combined_analysis(request: CombinedAnalysisRequest):
         }, sort=[("created_at", -1)])
         
         if recent_result:            
+            recent_result = await analysis_artifact_store.hydrate(recent_result)
             source_ids_str = [str(sid) for sid in recent_result["source_ids"]]
             logger.info(f'EDA 30 ---------')
             await asyncio.sleep(30)
@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Path, Body
+from fastapi.responses import StreamingResponse
 from typing import Dict, Any, List, Optional
 from pydantic import BaseModel
 from services.final_report_service import final_report_service
 import re
+import json
 from datetime import datetime
 
 router = APIRouter(
@@ -106,4 +108,26 @@ async def generate_final_report(
     result["status"] = "success"
     result["message"] = "SWOT 분석 보고서가 성공적으로 생성되었습니다."
     
-    return result
\ No newline at end of file
+    return result
+
+@router.post("/stream")
+async def generate_final_report_stream(
+    request: FinalReportRequest = Body(..., description="생성 요청")
+):
+    """
+    매장의 종합 SWOT 분석 보고서 생성 (Server-Sent Events)
+    
+    영역(리뷰, 매출, 경쟁사, 위치)별 분석이 끝날 때마다 `section` 이벤트를 보내고,
+    마지막에 저장된 보고서를 `report` 이벤트로 보냅니다.
+    입력이 바뀌지 않은 영역은 이전 분석 결과를 재사용합니다.
+    """
+    async def event_stream():
+        async for event in final_report_service.generate_final_report_stream(request.store_id):
+            event_name = event.pop("event")
+            yield f"event: {event_name}\ndata: {json.dumps(event, ensure_ascii=False, default=str)}\n\n"
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
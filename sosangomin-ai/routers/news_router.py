@@ -1,8 +1,11 @@
 # routers/news_router.py
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
+from typing import Optional
 import logging
+from database.connector import database_instance
 from services.news_service import news_service
+from services.news_query_service import news_query_service
 
 logger = logging.getLogger(__name__)
 
@@ -20,4 +23,28 @@ async def trigger_news_update():
         return {"status": "success", "message": f"{len(news)}개의 뉴스가 업데이트되었습니다."}
     except Exception as e:
         logger.error(f"수동 뉴스 업데이트 중 오류: {e}")
-        return {"status": "error", "message": str(e)}
\ No newline at end of file
+        return {"status": "error", "message": str(e)}
+
+@router.get("/news")
+def list_news(
+    category: Optional[str] = Query(None, description="뉴스 카테고리 (미지정 또는 '전체'면 전체)"),
+    limit: int = Query(20, ge=1, le=100, description="페이지 크기"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor")
+):
+    """최신순 뉴스 목록 조회 (커서 기반 페이지네이션)"""
+    db = database_instance.pre_session()
+    try:
+        page = news_query_service.list_news(db, category, limit, cursor)
+        return {"status": "success", **page}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"뉴스 목록 조회 중 오류: {e}")
+        raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
+    finally:
+        db.close()
+
+@router.get("/news/categories")
+def list_news_categories():
+    """뉴스 카테고리 목록 조회"""
+    return {"status": "success", "categories": news_service.get_news_categories()}
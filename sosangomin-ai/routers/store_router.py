@@ -109,7 +109,7 @@ async def get_analysis_list(store_id: int = Path(..., description="가게 ID")):
         cursor = collection.find({
             "store_id": store_id,
             "status": "completed"
-        }).sort("created_at", -1)
+        }, {"created_at": 1}).sort("created_at", -1)
 
         results = []
         for doc in cursor:
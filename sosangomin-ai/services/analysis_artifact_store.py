@@ -0,0 +1,168 @@
+# services/analysis_artifact_store.py
+
+import logging
+from datetime import datetime
+from typing import Dict, List, Any, Optional
+from bson import ObjectId
+from database.async_mongo_connector import async_mongo_instance
+
+logger = logging.getLogger(__name__)
+
+# analysis_type별로 AnalysisResults 본문에서 떼어낼 경로
+# ".*"로 끝나면 하위 키마다 별도 섹션으로 저장 (차트별 지연 로딩)
+ARTIFACT_PATHS = {
+    "combined_analysis": [
+        "eda_result.result_data.*",
+        "auto_analysis_results.predict",
+        "auto_analysis_results.cluster",
+        "chat_context"
+    ],
+    "autoanalysis": [
+        "results.predict",
+        "results.cluster"
+    ]
+}
+
+# 서비스 내부에서만 쓰는 섹션 (전체 hydrate 시 제외, 명시적으로 요청해야 로드)
+INTERNAL_SECTIONS = ["chat_context"]
+
+_MISSING = object()
+
+def _detach_path(doc: Dict[str, Any], path: str) -> Any:
+    """
+    path까지의 중첩 dict를 얕은 복사본으로 바꿔 끼움
+
+    호출부가 응답 등에 그대로 쓰는 원본 dict에서 섹션이 빠지지 않도록 복사본에서만 pop한다.
+    """
+    current = doc
+    for part in path.split("."):
+        child = current.get(part)
+        if not isinstance(child, dict):
+            return _MISSING
+        child = dict(child)
+        current[part] = child
+        current = child
+    return current
+
+def _set_path(doc: Dict[str, Any], path: str, value: Any):
+    parts = path.split(".")
+    current = doc
+    for part in parts[:-1]:
+        current = current.setdefault(part, {})
+    current[parts[-1]] = value
+
+class AnalysisArtifactStore:
+    """
+    분석 결과의 대용량 섹션(차트 데이터, 예측, 클러스터 등) 저장소
+
+    AnalysisResults에는 메타데이터/요약과 섹션 목록(artifact_sections)만 남기고,
+    각 섹션은 AnalysisArtifacts 컬렉션에 (analysis_id, section) 단위 문서로 저장한다.
+    호출부는 hydrate()로 필요한 섹션만 골라 본문에 다시 채운다.
+    artifact_sections가 없는 기존 문서는 이미 전체가 들어 있으므로 그대로 사용한다.
+    """
+
+    def __init__(self):
+        self.collection_name = "AnalysisArtifacts"
+
+    def _collection(self):
+        return async_mongo_instance.get_collection(self.collection_name)
+
+    async def ensure_indexes(self):
+        """(analysis_id, section) 유니크 인덱스 생성 (애플리케이션 시작 시 호출)"""
+        try:
+            await self._collection().create_index(
+                [("analysis_id", 1), ("section", 1)], unique=True, name="ux_analysis_section"
+            )
+        except Exception as e:
+            logger.warning(f"{self.collection_name} 인덱스 생성 실패: {e}")
+
+    def split(self, result_doc: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        분석 문서에서 대용량 섹션을 떼어내고 artifact_sections 목록을 기록
+
+        result_doc 최상위는 변경되지만, 섹션을 떼어내는 중첩 dict는 복사본으로 교체되므로
+        호출부가 따로 들고 있는 중첩 dict(예: eda_result_data)는 그대로 유지된다.
+
+        Returns:
+            Dict: 섹션 경로 -> 데이터
+        """
+        sections = {}
+        for pattern in ARTIFACT_PATHS.get(result_doc.get("analysis_type"), []):
+            if pattern.endswith(".*"):
+                container = _detach_path(result_doc, pattern[:-2])
+                if isinstance(container, dict):
+                    for key in list(container):
+                        sections[f"{pattern[:-2]}.{key}"] = container.pop(key)
+            else:
+                parent_path, _, key = pattern.rpartition(".")
+                parent = _detach_path(result_doc, parent_path) if parent_path else result_doc
+                if isinstance(parent, dict) and key in parent:
+                    sections[pattern] = parent.pop(key)
+
+        result_doc["artifact_sections"] = list(sections)
+        return sections
+
+    async def save(self, analysis_results, result_doc: Dict[str, Any]) -> ObjectId:
+        """
+        섹션을 먼저 저장한 뒤 가벼워진 분석 문서를 저장
+
+        Args:
+            analysis_results: AnalysisResults Motor 컬렉션
+            result_doc: _id가 채워진 분석 문서 (대용량 섹션이 제거된 상태로 변경됨)
+
+        Returns:
+            ObjectId: 저장된 분석 문서 ID
+        """
+        sections = self.split(result_doc)
+        now = datetime.now()
+
+        if sections:
+            await self._collection().insert_many([
+                {
+                    "analysis_id": result_doc["_id"],
+                    "section": section,
+                    "data": data,
+                    "created_at": now
+                }
+                for section, data in sections.items()
+            ], ordered=False)
+
+        return (await analysis_results.insert_one(result_doc)).inserted_id
+
+    def resolve_sections(self, result_doc: Dict[str, Any], prefixes: Optional[List[str]] = None) -> List[str]:
+        """prefixes(예: "eda_result.result_data")에 해당하는 실제 섹션 목록. None이면 내부용 섹션을 뺀 전체"""
+        available = result_doc.get("artifact_sections") or []
+        if prefixes is None:
+            return [section for section in available if section not in INTERNAL_SECTIONS]
+        return [
+            section for section in available
+            if any(section == prefix or section.startswith(prefix + ".") for prefix in prefixes)
+        ]
+
+    async def hydrate(self, result_doc: Dict[str, Any], prefixes: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        필요한 섹션만 조회하여 분석 문서 본문에 채움
+
+        Args:
+            result_doc: AnalysisResults 문서
+            prefixes: 불러올 섹션 경로 접두사 목록 (None이면 내부용 섹션을 뺀 전체)
+
+        Returns:
+            Dict: 섹션이 채워진 분석 문서 (artifact_sections 필드는 제거)
+        """
+        sections = self.resolve_sections(result_doc, prefixes)
+        result_doc.pop("artifact_sections", None)
+
+        if not sections:
+            return result_doc
+
+        cursor = self._collection().find(
+            {"analysis_id": ObjectId(str(result_doc["_id"])), "section": {"$in": sections}},
+            {"_id": 0, "section": 1, "data": 1}
+        )
+        async for artifact in cursor:
+            _set_path(result_doc, artifact["section"], artifact["data"])
+
+        return result_doc
+
+analysis_artifact_store = AnalysisArtifactStore()
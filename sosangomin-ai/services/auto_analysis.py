@@ -16,6 +16,8 @@ from sklearn.metrics import mean_absolute_percentage_error, mean_squared_error,
 from services.weather_service import weather_service
 
 from database.mongo_connector import mongo_instance
+from database.async_mongo_connector import async_mongo_instance
+from services.analysis_artifact_store import analysis_artifact_store
 from services.s3_service import download_file_from_s3
 from services.auto_analysis_chat_service import autoanalysis_chat_service
 
@@ -226,13 +228,13 @@ class AutoAnalysisService:
             # 날씨
             weather_df = await weather_service.process_weather(start_date, end_date, "서울") # TODO : 장소 받아오는 로직 짜기
 
-            merged_df = pd.merge(
-                df, 
-                weather_df, 
-                left_on=['년', '월', '일', '시'],
-                right_on=['year', 'month', 'day', 'hour'],
-                how='left'
-            ).drop(columns=['year', 'month', 'day', 'hour'])
+            # 정수 YYYYMMDDHH 키로 조인 (weather_df는 같은 키를 인덱스로 가짐)
+            sale_time = df['매출 일시']
+            df['_weather_key'] = (sale_time.dt.year * 1000000 + sale_time.dt.month * 10000
+                                  + sale_time.dt.day * 100 + sale_time.dt.hour).astype('int64')
+            merged_df = df.join(weather_df, on='_weather_key')\
+                .drop(columns=['_weather_key'])\
+                .reset_index(drop=True)
             
             merged_df = merged_df.rename(columns={
                 'ta': '기온',
@@ -534,7 +536,6 @@ class AutoAnalysisService:
                 raise ValueError(f"지원하지 않는 POS 유형입니다: {pos_type}")
             
             data_sources = mongo_instance.get_collection("DataSources")
-            analysis_results = mongo_instance.get_collection("AnalysisResults")
 
             preprocessed_data = []
             local_files = []
@@ -588,7 +589,10 @@ class AutoAnalysisService:
                 }
             }
 
-            result_id = analysis_results.insert_one(result_doc).inserted_id
+            # 예측/클러스터 원본은 AnalysisArtifacts에 섹션별로 분리 저장
+            result_id = await analysis_artifact_store.save(
+                async_mongo_instance.get_collection("AnalysisResults"), result_doc
+            )
 
             data_sources.update_many(
                 {"_id": {"$in": [ObjectId(sid) for sid in source_ids]}},
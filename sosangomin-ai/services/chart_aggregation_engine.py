@@ -0,0 +1,275 @@
+# services/chart_aggregation_engine.py
+
+import logging
+import numpy as np
+import pandas as pd
+from typing import Dict, Any, List
+
+logger = logging.getLogger(__name__)
+
+# 날짜(일)에만 의존하는 파생 열 / 시각(시)에만 의존하는 파생 열 (auto_analysis.preprocess_data에서 생성)
+DATE_ATTRIBUTES = ['요일', '공휴일', '계절', '년', '월']
+HOUR_ATTRIBUTES = ['시', '시간대']
+
+# 큐브 셀별로 합산하는 값 열
+VALUE_COLUMNS = ['매출', '수량', '고객 수']
+
+# 날씨 차트에 필요한 열 (날씨는 날짜-시각 단위로 조인되므로 셀 안에서 값이 같음)
+WEATHER_COLUMNS = ['기온', '강수량', '습도']
+
+HOURS_PER_DAY = 24
+
+DAY_ORDER = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
+class ChartAggregationEngine:
+    """
+    EDA 차트 데이터 집계 엔진
+
+    전처리된 POS 데이터를 정수 코드(날짜, 시, 상품 명칭) 기준의 일별 x 시간 x 상품 큐브로
+    한 번에 줄인 뒤(해시 factorize + bincount), 모든 차트를 이 작은 큐브에서 계산한다.
+    요일/공휴일/계절/년/월은 날짜별, 시/시간대는 시각별 첫 값을 조회표로 붙인다.
+    구매 금액대 차트만 전표 번호 단위 합계가 필요하므로 별도로 bincount한다.
+    """
+
+    def _first_by_code(self, df: pd.DataFrame, codes: np.ndarray, columns: List[str]) -> pd.DataFrame:
+        """코드별 첫 행의 파생 열 값 (코드 -> 속성 조회표)"""
+        columns = [col for col in columns if col in df.columns]
+        first_rows = pd.Series(codes).drop_duplicates()
+        # 전체 열을 복사하지 않도록 행을 먼저 고른 뒤 열 선택
+        table = df.iloc[first_rows.index.to_numpy(), [df.columns.get_loc(col) for col in columns]]
+        table.index = first_rows.to_numpy()
+        return table
+
+    def _cell_sum(self, values: pd.Series, cell_codes: np.ndarray, cell_count: int) -> np.ndarray:
+        """셀별 합계 (결측 제외). 정수 열은 정수로 돌려주어 기존 groupby 합계와 같은 타입 유지"""
+        numeric = pd.to_numeric(values)
+        weights = numeric.to_numpy(dtype=np.float64)
+        if pd.api.types.is_integer_dtype(numeric.dtype):
+            return np.rint(np.bincount(cell_codes, weights=weights, minlength=cell_count)).astype(np.int64)
+        return np.bincount(cell_codes, weights=np.nan_to_num(weights), minlength=cell_count)
+
+    def build_cube(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """
+        일별 x 시간 x 상품 큐브 생성
+
+        Returns:
+            Dict: cube(셀별 합계), dates(날짜 코드 -> 날짜 속성), hours(시 코드 -> 시 속성),
+                  products(상품 코드 -> 상품 명칭), has_weather
+        """
+        sale_time = df['매출 일시']
+
+        # 결측 날짜/시/상품은 별도 코드로 모아 두고 차트 계산 시 속성이 NaN이 되어 제외됨
+        date_codes, _ = pd.factorize(sale_time.dt.normalize())
+        hour_codes = sale_time.dt.hour.fillna(-1).to_numpy(dtype=np.int16)
+        if '상품 명칭' in df.columns:
+            product_codes, products = pd.factorize(df['상품 명칭'])
+        else:
+            product_codes, products = np.full(len(df), -1, dtype=np.int64), pd.Index([])
+
+        date_table = self._first_by_code(df, date_codes, DATE_ATTRIBUTES)
+        hour_table = self._first_by_code(df, hour_codes, HOUR_ATTRIBUTES)
+
+        # (날짜, 시, 상품) 조합을 int64 키 하나로 합친 뒤 해시 factorize로 셀 번호 부여 (결측 코드 -1은 +1하여 0번 슬롯)
+        # 행 수만큼의 임시 배열이 쌓이지 않도록 제자리 연산 사용
+        hour_slots = HOURS_PER_DAY + 1
+        product_slots = len(products) + 1
+        combined = date_codes.astype(np.int64)
+        del date_codes
+        combined += 1
+        combined *= hour_slots
+        combined += hour_codes
+        combined += 1
+        combined *= product_slots
+        combined += product_codes
+        combined += 1
+        del hour_codes, product_codes
+
+        cell_codes, cell_keys = pd.factorize(combined)
+        del combined
+        cell_count = len(cell_keys)
+
+        cube = pd.DataFrame({
+            'd': (cell_keys // (hour_slots * product_slots) - 1).astype(np.int32),
+            'h': (cell_keys // product_slots % hour_slots - 1).astype(np.int16),
+            'p': (cell_keys % product_slots - 1).astype(np.int32)
+        })
+
+        for col in VALUE_COLUMNS:
+            if col in df.columns:
+                cube[col] = self._cell_sum(df[col], cell_codes, cell_count)
+        if '매출' in df.columns:
+            cube['매출_count'] = np.bincount(cell_codes[df['매출'].notna().to_numpy()], minlength=cell_count)
+
+        # 일별 평균 기온은 행 가중 평균이므로 합계와 건수를 따로 보관
+        has_weather = all(col in df.columns for col in WEATHER_COLUMNS)
+        if has_weather:
+            temperature = pd.to_numeric(df['기온']).to_numpy(dtype=np.float64)
+            cube['기온_sum'] = np.bincount(cell_codes, weights=np.nan_to_num(temperature), minlength=cell_count)
+            cube['기온_count'] = np.bincount(cell_codes[~np.isnan(temperature)], minlength=cell_count)
+
+            rainfall_max = np.full(cell_count, -np.inf)
+            np.fmax.at(rainfall_max, cell_codes, pd.to_numeric(df['강수량']).to_numpy(dtype=np.float64))
+            cube['강수량_max'] = np.where(np.isneginf(rainfall_max), np.nan, rainfall_max)
+
+        return {
+            "cube": cube,
+            "dates": date_table,
+            "hours": hour_table,
+            "products": products,
+            "has_weather": has_weather
+        }
+
+    def _rollup(self, cube: pd.DataFrame, key: str, table: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+        """큐브를 한 축으로 합산하고 그 축의 속성을 붙임"""
+        rolled = cube.groupby(key, sort=False)[columns].sum()
+        return rolled.join(table, how='left')
+
+    def generate(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """Chart.js에 적합한 데이터 구조 생성 (열별 groupby로 계산하던 기존 결과와 동일)"""
+        chart_data = {}
+
+        built = self.build_cube(df)
+        cube = built["cube"]
+        value_columns = [col for col in VALUE_COLUMNS if col in cube.columns]
+        has_sales = '매출' in cube.columns
+
+        # 1. 기본 통계량
+        total_sales = cube['매출'].sum() if has_sales else 0
+        avg_transaction = 0
+        if has_sales:
+            sales_count = cube['매출_count'].sum()
+            avg_transaction = total_sales / sales_count if sales_count else np.nan
+        chart_data["basic_stats"] = {
+            "total_sales": float(total_sales),
+            "avg_transaction": float(avg_transaction),
+            "total_transactions": len(df),
+            "unique_products": len(built["products"])
+        }
+
+        by_date = self._rollup(cube, 'd', built["dates"], value_columns) if value_columns else None
+        by_hour = self._rollup(cube, 'h', built["hours"], value_columns) if value_columns else None
+
+        # 2. 요일별 매출
+        if has_sales and '요일' in by_date.columns:
+            logger.info(f"데이터에 존재하는 요일: {by_date['요일'].dropna().unique().tolist()}")
+            weekday_sales = by_date.groupby('요일')['매출'].sum()
+            chart_data["weekday_sales"] = {day: float(weekday_sales[day]) if day in weekday_sales else 0 for day in DAY_ORDER}
+
+        # 3. 시간대별 매출
+        if has_sales and '시간대' in by_hour.columns:
+            chart_data["time_period_sales"] = by_hour.groupby('시간대')['매출'].sum().to_dict()
+
+        # 4. 시간별 매출
+        if has_sales and '시' in by_hour.columns:
+            hourly_dict = by_hour.groupby('시')['매출'].sum().to_dict()
+            chart_data["hourly_sales"] = {str(k): float(v) for k, v in hourly_dict.items()}
+
+        # 상품별 합계 (상품 명칭 순으로 정렬해 두어 동률일 때 기존과 같은 순서 유지)
+        by_product = None
+        if len(built["products"]) and value_columns:
+            by_product = cube[cube['p'] >= 0].groupby('p')[value_columns].sum()
+            by_product.index = built["products"].take(by_product.index.to_numpy())
+            by_product = by_product.sort_index()
+
+        # 5. 상위 상품
+        if by_product is not None and has_sales:
+            chart_data["top_products"] = by_product['매출'].sort_values(ascending=False).head(5).to_dict()
+
+        # 6. 평일/휴일 매출
+        if has_sales and '공휴일' in by_date.columns:
+            chart_data["holiday_sales"] = by_date.groupby('공휴일')['매출'].sum().to_dict()
+
+        # 7. 계절별 매출
+        if has_sales and '계절' in by_date.columns:
+            chart_data["season_sales"] = by_date.groupby('계절')['매출'].sum().to_dict()
+
+        # 9. 고객당 평균 매출
+        if has_sales and '고객 수' in cube.columns and cube['고객 수'].sum() > 0:
+            chart_data["basic_stats"]["customer_avg"] = float(cube['매출'].sum() / cube['고객 수'].sum())
+
+        # 날짜별 기온 및 날씨 기준 하루 평균 매출
+        if has_sales and built["has_weather"]:
+            self._add_weather_charts(chart_data, cube)
+
+        # 12. 요일 + 시간대 교차 분석
+        if has_sales and '요일' in by_date.columns and '시간대' in by_hour.columns:
+            by_date_hour = cube.groupby(['d', 'h'], sort=False)['매출'].sum().reset_index()
+            by_date_hour = by_date_hour \
+                .join(built["dates"][['요일']], on='d') \
+                .join(built["hours"][['시간대']], on='h')
+            cross_dict = by_date_hour.pivot_table(index='요일', columns='시간대', values='매출', aggfunc='sum').fillna(0).to_dict()
+            chart_data["weekday_time_sales"] = {k: {str(inner_k): float(inner_v) for inner_k, inner_v in v.items()}
+                                                for k, v in cross_dict.items()}
+
+        # 13. 월별 매출 추세
+        if has_sales and '년' in by_date.columns and '월' in by_date.columns:
+            yearly_monthly_sales = by_date.groupby(['년', '월'])['매출'].sum()
+            chart_data["monthly_sales"] = {
+                f"{year}-{month}": float(sales) for (year, month), sales in yearly_monthly_sales.items()
+            }
+
+        # 14. 상품별 판매 비중
+        if by_product is not None and '수량' in by_product.columns:
+            product_qty = by_product['수량']
+            total_qty = product_qty.sum()
+
+            # 상위 10개 품목과 기타로 분류
+            top_products = product_qty.sort_values(ascending=False).head(10)
+            others = pd.Series([product_qty.sum() - top_products.sum()], index=['기타 상품'])
+
+            product_share = pd.concat([top_products, others]) / total_qty * 100
+            chart_data["product_share"] = {str(k): float(v) for k, v in product_share.to_dict().items()}
+
+        # 15. 구매 금액대별 거래 건수 (같은 전표 번호끼리 합산)
+        if has_sales and '전표 번호' in df.columns:
+            receipt_codes, receipts = pd.factorize(df['전표 번호'])
+            sales = np.nan_to_num(df['매출'].to_numpy(dtype=np.float64))
+            valid = receipt_codes >= 0
+            if not valid.all():
+                receipt_codes, sales = receipt_codes[valid], sales[valid]
+            transaction_amounts = pd.Series(np.bincount(receipt_codes, weights=sales, minlength=len(receipts)))
+
+            bins = [0, 10000, 20000, 30000, 50000, 100000, float('inf')]
+            labels = ['1만원 미만', '1~2만원', '2~3만원', '3~5만원', '5~10만원', '10만원 이상']
+
+            transaction_ranges = pd.cut(transaction_amounts, bins=bins, labels=labels)
+            transaction_counts = transaction_ranges.value_counts().to_dict()
+            chart_data["transaction_amounts"] = {str(k): int(v) for k, v in transaction_counts.items()}
+
+        return chart_data
+
+    def _add_weather_charts(self, chart_data: Dict[str, Any], cube: pd.DataFrame):
+        """기온 구간/강수 강도별 하루 평균 매출 (일별 기온은 행 가중 평균, 강수량은 최대값)"""
+        daily = cube[cube['d'] >= 0].groupby('d').agg(
+            매출=('매출', 'sum'),
+            기온_sum=('기온_sum', 'sum'),
+            기온_count=('기온_count', 'sum'),
+            강수량=('강수량_max', 'max')
+        )
+        daily_df = pd.DataFrame({
+            '매출': daily['매출'],
+            '기온': daily['기온_sum'] / daily['기온_count'].replace(0, np.nan),
+            '강수량': daily['강수량']
+        })
+
+        daily_df['기온_구간'] = (daily_df['기온'] // 5) * 5
+        temp_sales = daily_df.groupby('기온_구간')['매출'].agg(['mean', 'count']).reset_index()
+        temp_sales_filtered = temp_sales[temp_sales['count'] >= 5]
+        chart_data["temperature_sales"] = {
+            f"{int(row['기온_구간'])}~{int(row['기온_구간']) + 5}°C": float(row['mean'])
+            for _, row in temp_sales_filtered.iterrows()
+        }
+
+        daily_df['날씨_상세'] = pd.cut(
+            daily_df['강수량'],
+            bins=[0, 0.1, 5, 20, float('inf')],
+            labels=['맑음', '이슬비', '보통비', '폭우']
+        )
+        weather_sales = daily_df.groupby('날씨_상세')['매출'].agg(['mean', 'count']).reset_index()
+        weather_filtered = weather_sales[weather_sales['count'] >= 3]
+        chart_data["weather_sales"] = {
+            str(row['날씨_상세']): float(row['mean'])
+            for _, row in weather_filtered.iterrows()
+        }
+
+chart_aggregation_engine = ChartAggregationEngine()
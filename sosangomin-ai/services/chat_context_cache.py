@@ -0,0 +1,117 @@
+# services/chat_context_cache.py
+
+import os
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, List, Any, Optional
+from dotenv import load_dotenv
+from database.async_mongo_connector import async_mongo_instance
+
+logger = logging.getLogger(__name__)
+
+class ChatContextCache:
+    """
+    채팅 컨텍스트 캐시 (MongoDB ChatContextCache 컬렉션, Motor)
+
+    - chat:session:{session_id}: user_id, 최근 대화 창(history), 확인된 메인 매장 ID
+    - chat:eda:{store_id}: 최신 종합 분석 ID와 미리 컴파일한 EDA 컨텍스트 인덱스
+
+    문서는 키를 _id로 저장하고 expires_at TTL 인덱스로 만료시킨다. TTL 삭제는 주기적으로
+    실행되므로 조회 시에도 expires_at을 확인한다. 세션 문서에는 user_id를 함께 저장하여
+    메인 매장 변경 시 사용자의 세션을 한 번에 지운다.
+    세션 컨텍스트는 채팅 내역 커밋 직후 새 대화 창으로 덮어쓴다(write-through).
+    조회/저장 오류는 캐시 미스로 취급하여 DB 조회 경로로 동작하게 한다.
+    """
+
+    def __init__(self):
+        load_dotenv("./config/.env")
+
+        self.session_ttl = int(os.getenv("CHAT_CONTEXT_CACHE_TTL", 1800))
+        self.eda_ttl = int(os.getenv("CHAT_EDA_CONTEXT_CACHE_TTL", 3600))
+        self.history_window = 5
+        self.collection_name = "ChatContextCache"
+
+    def _collection(self):
+        return async_mongo_instance.get_collection(self.collection_name)
+
+    async def ensure_indexes(self):
+        """만료 TTL 인덱스와 사용자별 세션 무효화용 인덱스 생성 (애플리케이션 시작 시 호출)"""
+        try:
+            await self._collection().create_index("expires_at", expireAfterSeconds=0, name="ttl_expires_at")
+            await self._collection().create_index("user_id", name="ix_user_id", sparse=True)
+        except Exception as e:
+            logger.warning(f"{self.collection_name} 인덱스 생성 실패: {e}")
+
+    @staticmethod
+    def _session_key(session_id: str) -> str:
+        return f"chat:session:{session_id}"
+
+    @staticmethod
+    def _eda_key(store_id: int) -> str:
+        return f"chat:eda:{store_id}"
+
+    async def _get_value(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            doc = await self._collection().find_one(
+                {"_id": key, "expires_at": {"$gt": datetime.now()}},
+                {"value": 1}
+            )
+            return doc.get("value") if doc else None
+        except Exception as e:
+            logger.warning(f"채팅 컨텍스트 캐시 조회 실패 ({key}): {e}")
+            return None
+
+    async def _set_value(self, key: str, value: Dict[str, Any], ttl: int, **fields):
+        await self._collection().replace_one(
+            {"_id": key},
+            {"value": value, "expires_at": datetime.now() + timedelta(seconds=ttl), **fields},
+            upsert=True
+        )
+
+    async def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """
+        세션 컨텍스트 조회
+
+        Returns:
+            Dict: user_id, main_store_id, history([{user_message, bot_message}], 오래된 순). 없으면 None
+        """
+        return await self._get_value(self._session_key(session_id))
+
+    async def save_session(self, session_id: str, user_id: int, history: List[Dict[str, str]],
+                           main_store_id: Optional[int] = None):
+        """대화 창을 최근 history_window개로 잘라 세션 컨텍스트 저장"""
+        context = {
+            "user_id": user_id,
+            "main_store_id": main_store_id,
+            "history": history[-self.history_window:]
+        }
+        try:
+            await self._set_value(self._session_key(session_id), context, self.session_ttl, user_id=user_id)
+        except Exception as e:
+            logger.warning(f"채팅 세션 컨텍스트 저장 실패 ({session_id}): {e}")
+
+    async def invalidate_user_sessions(self, user_id: int):
+        """사용자의 모든 세션 컨텍스트 제거 (메인 매장 변경 시 호출)"""
+        try:
+            await self._collection().delete_many({"user_id": user_id})
+        except Exception as e:
+            logger.warning(f"사용자 {user_id}의 채팅 세션 컨텍스트 무효화 실패: {e}")
+
+    async def get_eda_context(self, store_id: int) -> Optional[Dict[str, Any]]:
+        """매장의 EDA 컨텍스트 조회"""
+        return await self._get_value(self._eda_key(store_id))
+
+    async def save_eda_context(self, store_id: int, eda_context: Dict[str, Any]):
+        try:
+            await self._set_value(self._eda_key(store_id), eda_context, self.eda_ttl)
+        except Exception as e:
+            logger.warning(f"EDA 컨텍스트 캐시 저장 실패 (store_id: {store_id}): {e}")
+
+    async def invalidate_store(self, store_id: int):
+        """새 분석 결과 저장 후 해당 매장의 EDA 컨텍스트 제거"""
+        try:
+            await self._collection().delete_one({"_id": self._eda_key(store_id)})
+        except Exception as e:
+            logger.warning(f"EDA 컨텍스트 캐시 무효화 실패 (store_id: {store_id}): {e}")
+
+chat_context_cache = ChatContextCache()
@@ -1,19 +1,23 @@
 # services/chat_service.py
 
 import os
+import time
+import asyncio
 import logging
+from collections import deque
 from datetime import datetime, timezone
-from typing import Optional, Dict, List, Any
-from anthropic import Anthropic
+from typing import Optional, Dict, List, Any, AsyncIterator
+from anthropic import AsyncAnthropic
 import uuid
-import json
-import re
 from bson import ObjectId
 from dotenv import load_dotenv
 
 from db_models import ChatHistory, ChatSession, Store
 from database.connector import database_instance
-from database.mongo_connector import mongo_instance
+from database.async_mongo_connector import async_mongo_instance
+from services.analysis_artifact_store import analysis_artifact_store
+from services.chat_context_cache import chat_context_cache
+from services.eda_context_index import eda_context_index, DATA_KEYWORDS, INDEX_VERSION
 from services.rag_service import rag_service
 
 logger = logging.getLogger(__name__)
@@ -26,7 +30,19 @@ class ChatService:
             logger.error("Anthropic API 키가 설정되지 않았습니다. 환경 변수를 확인하세요.")
             raise ValueError("API 키가 설정되지 않았습니다.")
         
-        self.client = Anthropic(api_key=api_key)
+        # 응답 생성 동안 이벤트 루프를 막지 않도록 비동기 클라이언트 사용
+        self.async_client = AsyncAnthropic(api_key=api_key)
+        self.chat_model = "claude-3-haiku-20240307"
+        self.chat_max_tokens = 700
+        self.fallback_message = "죄송합니다, 현재 응답을 생성하는 데 문제가 발생했습니다. 잠시 후 다시 시도해 주세요."
+        
+        # 스트리밍 응답 지표 (최근 500건)
+        self._stream_stats = {"requests": 0, "errors": 0}
+        self._ttft_samples = deque(maxlen=500)
+        self._total_samples = deque(maxlen=500)
+        
+        # 클라이언트 연결이 끊겨도 끝까지 실행되는 채팅 내역 저장 태스크
+        self._pending_saves = set()
         
         # 시스템 프롬프트 설정
         self.system_prompt = """
@@ -45,15 +61,100 @@ class ChatService:
         검색 결과가 없거나 관련이 없는 경우 솔직하게 모른다고 답변하세요.
         """
         
-        # 데이터 분석 관련 키워드
-        self.data_keywords = [
-            "매출", "데이터", "분석", "통계", "차트", "그래프", "매출액", 
-            "고객수", "고객 수", "판매량", "점심", "저녁", "시간대", "요일", 
-            "상품", "시간별", "시즌", "공휴일", "매장", "가게", "메뉴",
-            "매출 현황", "성과", "실적", "인기 메뉴", "매출 추이", "영업",
-            '우리', '가게', '프로모션', '마케팅',
-        ]
+        # 데이터 분석 관련 키워드 (EDA 스니펫 태그와 같은 어휘)
+        self.data_keywords = DATA_KEYWORDS
+        
+    async def _prepare_chat(self, db, user_id: int, user_message: str, session_id: Optional[str] = None,
+                            store_id: Optional[int] = None) -> Dict[str, Any]:
+        """세션 확보, 메시지 분류, RAG/EDA 컨텍스트를 포함한 Claude 요청 메시지 준비"""
+        # 캐시된 세션이면 세션/대화 내역/메인 매장 조회를 건너뜀
+        context = await chat_context_cache.get_session(session_id) if session_id else None
+        if context and context.get("user_id") != user_id:
+            context = None
+
+        if context:
+            history = context["history"]
+            main_store_id = context.get("main_store_id")
+            logger.debug(f"세션 컨텍스트 캐시 사용: {session_id}")
+        else:
+            session_id = self._get_or_create_session(db, user_id, session_id)
+            history = [
+                {"user_message": h.user_message, "bot_message": h.bot_message}
+                for h in self._get_chat_history(db, session_id)
+            ]
+            main_store_id = None
+        
+        msg_type = self._classify_message(user_message)
+        logger.info(f"메시지 분류 결과: {msg_type}")
+
+        augmented_content = ""
+        analysis_id = None
+
+        # 질문 임베딩은 한 번만 계산하여 RAG 검색과 EDA 스니펫 선택에 함께 사용
+        query_embedding = rag_service.encode(user_message)
+        retrieval_results = rag_service.retrieve(
+            user_message, top_k_stage1=10, top_k_stage2=3, query_embedding=query_embedding
+        )
+        if retrieval_results:
+            augmented_content = self._prepare_rag_content(retrieval_results)
+            logger.info("RAG 검색 결과 적용")
         
+        if not store_id and msg_type == "data_analysis":
+            if not main_store_id:
+                main_store = db.query(Store).filter(Store.user_id == user_id, Store.is_main == True).first()
+                if main_store:
+                    main_store_id = main_store.store_id
+                    logger.info(f"사용자 {user_id}의 메인 매장(ID: {main_store_id}) 찾음")
+            store_id = main_store_id
+
+        if msg_type == "data_analysis" and store_id:
+            eda_context = await self._get_eda_context(store_id)
+            if eda_context:
+                analysis_id = eda_context["analysis_id"]
+                eda_content = eda_context_index.select(eda_context["index"], user_message, query_embedding)
+                if eda_content:
+                    if augmented_content:
+                        augmented_content += "\n\n" + eda_content
+                    else:
+                        augmented_content = eda_content
+                    logger.info("EDA 결과 적용")
+        
+        return {
+            "session_id": session_id,
+            "message_type": msg_type,
+            "analysis_id": analysis_id,
+            "history": history,
+            "main_store_id": main_store_id,
+            "messages": self._prepare_messages(history, user_message, augmented_content)
+        }
+
+    async def _commit_turn(self, db, prepared: Dict[str, Any], user_id: int, user_message: str, bot_message: str):
+        """채팅 내역 저장/커밋 후 세션 컨텍스트 캐시에 새 대화 창을 기록 (write-through)"""
+        session_id = prepared["session_id"]
+        self._save_chat_history(db, session_id, user_id, user_message, bot_message, prepared["analysis_id"])
+        db.commit()
+
+        history = prepared["history"] + [{"user_message": user_message, "bot_message": bot_message}]
+        await chat_context_cache.save_session(session_id, user_id, history, prepared["main_store_id"])
+
+    async def _get_eda_context(self, store_id: int) -> Optional[Dict[str, Any]]:
+        """매장의 최신 종합 분석 EDA 스니펫 인덱스 (캐시 우선, 새 분석 저장 시 무효화됨)"""
+        eda_context = await chat_context_cache.get_eda_context(store_id)
+        if eda_context and eda_context.get("index", {}).get("version") == INDEX_VERSION:
+            return eda_context
+
+        analysis_id = await self._get_latest_analysis_id(store_id)
+        if not analysis_id:
+            return None
+
+        index = await self._load_eda_context_index(analysis_id)
+        if not index:
+            return None
+
+        eda_context = {"analysis_id": analysis_id, "index": index}
+        await chat_context_cache.save_eda_context(store_id, eda_context)
+        return eda_context
+
     async def process_chat(self, user_id: int, user_message: str, session_id: Optional[str] = None, store_id: Optional[int] = None) -> Dict:
         """통합된 챗팅 메시지 처리 메인 함수"""
         db = database_instance.pre_session()
@@ -61,52 +162,18 @@ class ChatService:
         try:
             logger.info(f"사용자 {user_id}의 챗팅 처리 시작")
             
-            session_id = self._get_or_create_session(db, user_id, session_id)
-            
-            history = self._get_chat_history(db, session_id)
-            
-            msg_type = self._classify_message(user_message)
-            logger.info(f"메시지 분류 결과: {msg_type}")
-
-            augmented_content = ""
-            analysis_id = None
-
-            retrieval_results = rag_service.retrieve(user_message, top_k_stage1=10, top_k_stage2=3)
-            if retrieval_results:
-                augmented_content = self._prepare_rag_content(retrieval_results)
-                logger.info("RAG 검색 결과 적용")
-            
-            if not store_id and msg_type == "data_analysis":
-                main_store = db.query(Store).filter(Store.user_id == user_id, Store.is_main == True).first()
-                if main_store:
-                    store_id = main_store.store_id
-                    logger.info(f"사용자 {user_id}의 메인 매장(ID: {store_id}) 찾음")
-
-            if msg_type == "data_analysis" and store_id:
-                analysis_id = await self._get_latest_analysis_id(store_id)
-                if analysis_id:
-                    eda_result = await self._load_eda_result(analysis_id)
-                    if eda_result:
-                        eda_content = self._prepare_eda_content(eda_result, user_message)
-                        if eda_content:
-                            if augmented_content:
-                                augmented_content += "\n\n" + eda_content
-                            else:
-                                augmented_content = eda_content
-                            logger.info("EDA 결과 적용")
-            
-            messages = self._prepare_messages(history, user_message, augmented_content)
-            response = await self._get_claude_response(messages)
+            prepared = await self._prepare_chat(db, user_id, user_message, session_id, store_id)
+            session_id = prepared["session_id"]
             
-            self._save_chat_history(db, session_id, user_id, user_message, response, analysis_id)
+            response = await self._get_claude_response(prepared["messages"])
             
-            db.commit()
+            await self._commit_turn(db, prepared, user_id, user_message, response)
             
             logger.info(f"사용자 {user_id}의 챗팅 처리 완료")
             return {
                 "session_id": session_id,
                 "bot_message": response,
-                "message_type": msg_type
+                "message_type": prepared["message_type"]
             }
         except Exception as e:
             db.rollback()
@@ -115,12 +182,143 @@ class ChatService:
         finally:
             db.close()
 
+    async def process_chat_stream(self, user_id: int, user_message: str, session_id: Optional[str] = None,
+                                  store_id: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        스트리밍 챗팅 처리
+
+        응답 생성 중에는 DB 커넥션을 잡고 있지 않도록 세션 생성/컨텍스트 준비 후 바로 커밋하고,
+        스트림이 끝난 뒤 새 세션으로 채팅 내역을 저장한다.
+        저장은 finally에서 분리된 태스크로 예약하므로 클라이언트가 중간에 연결을 끊어
+        제너레이터가 닫히거나 취소되어도 그때까지 생성된 답변으로 끝까지 실행된다.
+
+        Yields:
+            {"event": "start", session_id, message_type}
+            {"event": "token", text}: 생성되는 텍스트 조각
+            {"event": "done", session_id, message_type, bot_message, ttft_ms, total_ms}
+        """
+        started = time.perf_counter()
+        db = database_instance.pre_session()
+        try:
+            logger.info(f"사용자 {user_id}의 스트리밍 챗팅 처리 시작")
+            prepared = await self._prepare_chat(db, user_id, user_message, session_id, store_id)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"챗팅 처리 중 오류 발생: {str(e)}")
+            raise
+        finally:
+            db.close()
+
+        session_id = prepared["session_id"]
+
+        user_assistant_messages = [msg for msg in prepared["messages"] if msg["role"] != "system"]
+        system_message = next((msg["content"] for msg in prepared["messages"] if msg["role"] == "system"), "")
+
+        chunks: List[str] = []
+        ttft = None
+        failed = False
+        try:
+            yield {"event": "start", "session_id": session_id, "message_type": prepared["message_type"]}
+            try:
+                async with self.async_client.messages.stream(
+                    model=self.chat_model,
+                    max_tokens=self.chat_max_tokens,
+                    temperature=0.1,
+                    system=system_message,
+                    messages=user_assistant_messages
+                ) as stream:
+                    async for text in stream.text_stream:
+                        if ttft is None:
+                            ttft = time.perf_counter() - started
+                        chunks.append(text)
+                        yield {"event": "token", "text": text}
+            except Exception as e:
+                logger.error(f"Claude 스트리밍 API 오류: {str(e)}")
+                failed = True
+                if not chunks:
+                    chunks.append(self.fallback_message)
+                    yield {"event": "token", "text": self.fallback_message}
+        finally:
+            bot_message = "".join(chunks)
+            total = time.perf_counter() - started
+            self._record_stream_metrics(ttft, total, failed)
+            save_task = self._schedule_turn_save(prepared, user_id, user_message, bot_message)
+
+        # 정상 종료 시에는 저장이 끝난 뒤 done 이벤트 전송 (취소되어도 저장 태스크는 계속 실행)
+        if save_task:
+            await asyncio.shield(save_task)
+
+        ttft_ms = round(ttft * 1000, 1) if ttft is not None else None
+        logger.info(f"사용자 {user_id}의 스트리밍 챗팅 처리 완료 (TTFT {ttft_ms}ms, 전체 {total * 1000:.1f}ms)")
+        yield {
+            "event": "done",
+            "session_id": session_id,
+            "message_type": prepared["message_type"],
+            "bot_message": bot_message,
+            "ttft_ms": ttft_ms,
+            "total_ms": round(total * 1000, 1)
+        }
+
+    def _schedule_turn_save(self, prepared: Dict[str, Any], user_id: int, user_message: str,
+                            bot_message: str) -> Optional[asyncio.Task]:
+        """
+        스트리밍 채팅 내역 저장을 분리된 태스크로 예약
+
+        응답이 한 글자도 생성되지 않은 채 연결이 끊긴 경우에는 저장하지 않는다.
+        태스크는 완료될 때까지 _pending_saves에 참조를 유지한다.
+        """
+        if not bot_message:
+            logger.info(f"사용자 {user_id}의 스트리밍 응답이 생성되기 전에 연결이 끊겨 채팅 내역을 저장하지 않습니다")
+            return None
+
+        task = asyncio.ensure_future(self._save_stream_turn(prepared, user_id, user_message, bot_message))
+        self._pending_saves.add(task)
+        task.add_done_callback(self._pending_saves.discard)
+        return task
+
+    async def _save_stream_turn(self, prepared: Dict[str, Any], user_id: int, user_message: str, bot_message: str):
+        """새 DB 세션으로 스트리밍 채팅 내역 저장"""
+        db = database_instance.pre_session()
+        try:
+            await self._commit_turn(db, prepared, user_id, user_message, bot_message)
+        except Exception as e:
+            db.rollback()
+            logger.error(f"스트리밍 채팅 내역 저장 중 오류: {str(e)}")
+        finally:
+            db.close()
+
+    def _record_stream_metrics(self, ttft: Optional[float], total: float, failed: bool):
+        self._stream_stats["requests"] += 1
+        if failed:
+            self._stream_stats["errors"] += 1
+        if ttft is not None:
+            self._ttft_samples.append(ttft)
+        self._total_samples.append(total)
+
+    def stream_metrics(self) -> Dict[str, Any]:
+        """스트리밍 채팅의 최근 TTFT/전체 응답 시간 분포 (ms)"""
+        def percentile(samples, q):
+            if not samples:
+                return None
+            ordered = sorted(samples)
+            return round(ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))] * 1000, 1)
+
+        return {
+            **self._stream_stats,
+            "ttft_p50_ms": percentile(self._ttft_samples, 50),
+            "ttft_p95_ms": percentile(self._ttft_samples, 95),
+            "total_p50_ms": percentile(self._total_samples, 50),
+            "total_p95_ms": percentile(self._total_samples, 95)
+        }
+
     async def _get_latest_analysis_id(self, store_id: int) -> Optional[str]:
         """가장 최근 분석 결과의 ID 가져오기"""
         try:
-            analysis_results = mongo_instance.get_collection("AnalysisResults")
-            result = analysis_results.find_one(
+            analysis_results = async_mongo_instance.get_collection("AnalysisResults")
+            result = await analysis_results.find_one(
                 {"store_id": store_id, "analysis_type": "combined_analysis"},
+                {"_id": 1},
                 sort=[("created_at", -1)]  
             )
             
@@ -190,9 +388,9 @@ class ChatService:
             user_assistant_messages = [msg for msg in messages if msg["role"] != "system"]
             system_message = next((msg["content"] for msg in messages if msg["role"] == "system"), "")
             
-            response = self.client.messages.create(
-                model="claude-3-haiku-20240307",
-                max_tokens=700,
+            response = await self.async_client.messages.create(
+                model=self.chat_model,
+                max_tokens=self.chat_max_tokens,
                 temperature=0.1,
                 system=system_message,  
                 messages=user_assistant_messages  
@@ -205,15 +403,15 @@ class ChatService:
             return text
         except Exception as e:
             logger.error(f"Claude API 오류: {str(e)}")
-            return "죄송합니다, 현재 응답을 생성하는 데 문제가 발생했습니다. 잠시 후 다시 시도해 주세요."
+            return self.fallback_message
     
-    def _prepare_messages(self, history: List[ChatHistory], user_message: str, augmented_content: str = "") -> list:
+    def _prepare_messages(self, history: List[Dict[str, str]], user_message: str, augmented_content: str = "") -> list:
         """Claude API 요청을 위한 메시지 준비 (RAG 또는 EDA 결과 포함)"""
         messages = [{"role": "system", "content": self.system_prompt}]
         
         for h in history:
-            messages.append({"role": "user", "content": h.user_message})
-            messages.append({"role": "assistant", "content": h.bot_message})
+            messages.append({"role": "user", "content": h["user_message"]})
+            messages.append({"role": "assistant", "content": h["bot_message"]})
         
         if augmented_content:
             augmented_user_message = (
@@ -241,6 +439,8 @@ class ChatService:
                 updated_at=current_time
             )
             db.add(chat_history)
+            # 캐시된 세션은 조회를 건너뛰므로 세션 갱신 시각도 여기서 함께 기록
+            db.query(ChatSession).filter(ChatSession.uid == session_id).update({"updated_at": current_time})
             db.flush()
             logger.debug(f"채팅 내역 저장 완료: 세션 {session_id}")
         except Exception as e:
@@ -277,94 +477,35 @@ class ChatService:
             logger.error(f"RAG 콘텐츠 준비 중 오류: {str(e)}")
             return ""
     
-    async def _load_eda_result(self, analysis_id: str) -> Optional[Dict]:
+    async def _load_eda_context_index(self, analysis_id: str) -> Optional[Dict]:
+        """분석 완료 시 컴파일된 EDA 스니펫 인덱스 로드 (없는 과거 분석은 EDA 결과로 즉석 컴파일)"""
         try:
-            analysis_results = mongo_instance.get_collection("AnalysisResults")
-            result = analysis_results.find_one({
-                "_id": ObjectId(analysis_id),
-                "analysis_type": "combined_analysis" 
-            })
+            analysis_results = async_mongo_instance.get_collection("AnalysisResults")
+            # 채팅에는 EDA 결과만 필요하므로 예측/클러스터 결과는 읽지 않음
+            result = await analysis_results.find_one(
+                {"_id": ObjectId(analysis_id), "analysis_type": "combined_analysis"},
+                {"auto_analysis_results": 0}
+            )
             
             if not result:
                 logger.warning(f"ID가 {analysis_id}인 EDA 결과를 찾을 수 없습니다.")
                 return None
             
-            result["_id"] = str(result["_id"])
-            
-            if "source_ids" in result and isinstance(result["source_ids"], list):
-                result["source_ids"] = [str(source_id) for source_id in result["source_ids"]]
+            artifact_sections = result.get("artifact_sections")
+            if analysis_artifact_store.resolve_sections(result, ["chat_context"]):
+                result = await analysis_artifact_store.hydrate(result, ["chat_context"])
+                index = result.pop("chat_context", None)
+                if index and index.get("version") == INDEX_VERSION:
+                    logger.info(f"EDA 스니펫 인덱스 로드 성공: {analysis_id}")
+                    return index
+                result["artifact_sections"] = artifact_sections
             
-            logger.info(f"EDA 결과 로드 성공: {analysis_id}")
-            return result
+            result = await analysis_artifact_store.hydrate(result, ["eda_result.result_data"])
+            index = await asyncio.to_thread(eda_context_index.compile, result.get("eda_result", result))
+            logger.info(f"EDA 스니펫 인덱스 컴파일: {analysis_id}")
+            return index
         except Exception as e:
-            logger.error(f"EDA 결과 로드 중 오류: {str(e)}")
+            logger.error(f"EDA 스니펫 인덱스 로드 중 오류: {str(e)}")
             return None
-    
-    def _prepare_eda_content(self, eda_result: Dict, user_message: str) -> str:
-        try:
-            if "eda_result" in eda_result and "result_data" in eda_result["eda_result"]:
-                actual_result_data = eda_result["eda_result"]["result_data"]
-                overall_summary = eda_result["eda_result"].get("summary", "")
-            elif "result_data" in eda_result:  # 이전 구조도 지원
-                actual_result_data = eda_result["result_data"]
-                overall_summary = eda_result.get("summary", "")
-            else:
-                logger.warning("EDA 결과에 result_data가 없습니다.")
-                return ""
-            
-            keywords = self._extract_keywords_from_message(user_message)
-            logger.info(f"추출된 키워드: {keywords}")
-            
-            content = "데이터 분석 결과:\n\n"
-            
-            if overall_summary:
-                content += f"전체 요약:\n{overall_summary[:500]}...\n\n"
-            
-            if "basic_stats" in actual_result_data:
-                content += "기본 통계:\n"
-                content += f"{json.dumps(actual_result_data['basic_stats']['data'], ensure_ascii=False, indent=2)}\n\n"
-            
-            for chart_name, chart_data in actual_result_data.items():
-                if chart_name == "basic_stats":
-                    continue
-                
-                is_relevant = False
-                for keyword in keywords:
-                    if keyword in chart_name.lower() or self._check_relevance(keyword, chart_data):
-                        is_relevant = True
-                        break
-                
-                if is_relevant or not keywords:
-                    content += f"{chart_name} 데이터:\n"
-                    content += f"{json.dumps(chart_data['data'], ensure_ascii=False, indent=2)}\n"
-                    
-                    if "summary" in chart_data:
-                        summary_extract = chart_data["summary"].split("\n")
-                        content += f"요약: {' '.join(summary_extract)}\n\n"
-            
-            logger.info(f"EDA 컨텐츠 준비 완료: {len(content)} 바이트")
-            return content
-        except Exception as e:
-            logger.error(f"EDA 콘텐츠 준비 중 오류: {str(e)}")
-            return ""
-    
-    def _extract_keywords_from_message(self, message: str) -> List[str]:
-        """사용자 메시지에서 관련 키워드 추출"""
-        try:
-            words = re.findall(r'\b\w+\b', message.lower())
-            
-            return [word for word in words if word in [kw.lower() for kw in self.data_keywords]]
-        except Exception as e:
-            logger.error(f"키워드 추출 중 오류: {str(e)}")
-            return []
-    
-    def _check_relevance(self, keyword: str, chart_data: Dict) -> bool:
-        """키워드와 차트 데이터 간의 관련성 확인"""
-        try:
-            data_str = json.dumps(chart_data, ensure_ascii=False).lower()
-            return keyword in data_str
-        except Exception as e:
-            logger.error(f"관련성 확인 중 오류: {str(e)}")
-            return False
 
 chat_service = ChatService()
\ No newline at end of file
@@ -1,20 +1,23 @@
 # services/competitor_service.py
 
 import os
+import time
+import asyncio
 import logging
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 from bson import ObjectId
-from database.mongo_connector import mongo_instance
+from database.async_mongo_connector import async_mongo_instance
 from services.store_service import simple_store_service as store_service
 from services.review_service import review_service
 from services.eda_chat_service import eda_chat_service
+from services.report_input_assembler import report_input_assembler
 
 logger = logging.getLogger(__name__)
 
 class CompetitorService:
     def __init__(self):
-        pass
+        self.fanout_concurrency = int(os.getenv("COMPETITOR_FANOUT_CONCURRENCY", 3))
 
     async def search_competitor(self, competitor_name: str) -> Dict[str, Any]:
         """
@@ -35,14 +38,7 @@ class CompetitorService:
                     "message": f"'{competitor_name}' 검색 결과가 없습니다."
                 }
             
-            place_id = search_result.get("place_id")
-            
-            if not place_id or place_id == search_result.get("place_url"):
-                place_id = await store_service._get_place_id_with_selenium(competitor_name)
-                
-                if place_id:
-                    search_result["place_id"] = place_id
-                    logger.info(f"Selenium으로 place_id 추출 성공: {place_id}")
+            await store_service._resolve_place_id(search_result, competitor_name)
             
             return {
                 "status": "success",
@@ -91,15 +87,14 @@ class CompetitorService:
                     "message": "경쟁사의 네이버 플레이스 ID를 찾을 수 없습니다."
                 }
             
-            reviews = await review_service.fetch_reviews_with_selenium(place_id)
+            analyzed_reviews = await review_service.get_analyzed_reviews(place_id)
             
-            if not reviews:
+            if not analyzed_reviews:
                 return {
                     "status": "error",
                     "message": "경쟁사의 리뷰를 가져올 수 없습니다."
                 }
             
-            analyzed_reviews = await review_service.analyze_sentiment(reviews)
             word_cloud_data = await review_service.generate_word_cloud_data(analyzed_reviews)
             insights = await review_service.generate_insights(analyzed_reviews, place_id)
             
@@ -155,13 +150,13 @@ class CompetitorService:
             
         """
         try:
-            reviews_collection = mongo_instance.get_collection("StoreReviews")
+            reviews_collection = async_mongo_instance.get_collection("StoreReviews")
             
             my_analysis = None
             if analysis_id:
-                my_analysis = reviews_collection.find_one({"_id": ObjectId(analysis_id), "store_id": store_id})
+                my_analysis = await reviews_collection.find_one({"_id": ObjectId(analysis_id), "store_id": store_id})
             else:
-                my_analysis = reviews_collection.find_one({"store_id": store_id}, sort=[("created_at", -1)])
+                my_analysis = await reviews_collection.find_one({"store_id": store_id}, sort=[("created_at", -1)])
             
             if not my_analysis:
                 return {
@@ -170,73 +165,28 @@ class CompetitorService:
                 }
             
             if not competitor_analyzed_reviews:
-                competitor_reviews = await review_service.fetch_reviews_with_selenium(competitor_place_id)
+                competitor_analyzed_reviews = await review_service.get_analyzed_reviews(competitor_place_id)
                 
-                if not competitor_reviews:
+                if not competitor_analyzed_reviews:
                     return {
                         "status": "error",
                         "message": "경쟁사의 리뷰를 가져올 수 없습니다."
                     }
-                
-                competitor_analyzed_reviews = await review_service.analyze_sentiment(competitor_reviews)
             
             competitor_word_cloud = await review_service.generate_word_cloud_data(competitor_analyzed_reviews)
             
-            my_review_count = my_analysis.get("review_count", 0)
-            my_sentiment = my_analysis.get("sentiment_distribution", {})
-            my_avg_rating = my_analysis.get("average_rating", 0)
-            my_word_cloud = my_analysis.get("word_cloud_data", {})
-            
-            my_reviews = my_analysis.get("reviews", [])
-            my_positive_reviews = [r for r in my_reviews if r.get("sentiment") == "positive"][:5]
-            my_negative_reviews = [r for r in my_reviews if r.get("sentiment") == "negative"][:5]
-            
-            competitor_positive_reviews = [r for r in competitor_analyzed_reviews if r.get("sentiment") == "positive"][:5]
-            competitor_negative_reviews = [r for r in competitor_analyzed_reviews if r.get("sentiment") == "negative"][:5]
-            
-            competitor_review_count = len(competitor_analyzed_reviews)
-            competitor_sentiment = {
-                "positive": sum(1 for r in competitor_analyzed_reviews if r.get("sentiment") == "positive"),
-                "neutral": sum(1 for r in competitor_analyzed_reviews if r.get("sentiment") == "neutral"),
-                "negative": sum(1 for r in competitor_analyzed_reviews if r.get("sentiment") == "negative")
-            }
-            
-            if competitor_review_count > 0:
-                pos_ratio = competitor_sentiment.get("positive", 0) / competitor_review_count
-                competitor_avg_rating = 3.0 + (pos_ratio - 0.5) * 2
-                competitor_avg_rating = max(1.0, min(5.0, round(competitor_avg_rating, 1)))
-            
             comparison_data = {
-                "my_store": {
-                    "review_count": my_review_count,
-                    "average_rating": my_avg_rating,
-                    "sentiment_distribution": my_sentiment,
-                    "positive_rate": (my_sentiment.get("positive", 0) / my_review_count * 100) if my_review_count > 0 else 0,
-                    "sample_reviews": {
-                        "positive": my_positive_reviews,
-                        "negative": my_negative_reviews
-                    }
-                },
-                "competitor": {
-                    "name": competitor_name,
-                    "review_count": competitor_review_count,
-                    "average_rating": competitor_avg_rating,
-                    "sentiment_distribution": competitor_sentiment,
-                    "positive_rate": (competitor_sentiment.get("positive", 0) / competitor_review_count * 100) if competitor_review_count > 0 else 0,
-                    "sample_reviews": {
-                        "positive": competitor_positive_reviews,
-                        "negative": competitor_negative_reviews
-                    }
-                },
+                "my_store": self._summarize_my_store(my_analysis),
+                "competitor": self._summarize_competitor(competitor_name, competitor_analyzed_reviews),
                 "word_cloud_comparison": {
-                    "my_store": my_word_cloud,
+                    "my_store": my_analysis.get("word_cloud_data", {}),
                     "competitor": competitor_word_cloud
                 }
             }
             
             comparison_insight = await self._generate_comparison_insight(comparison_data)
             
-            comparison_collection = mongo_instance.get_collection("CompetitorComparisons")
+            comparison_collection = async_mongo_instance.get_collection("CompetitorComparisons")
             
             comparison_doc = {
                 "store_id": store_id,
@@ -248,7 +198,8 @@ class CompetitorService:
                 "created_at": datetime.now()
             }
             
-            comparison_id = comparison_collection.insert_one(comparison_doc).inserted_id
+            comparison_id = (await comparison_collection.insert_one(comparison_doc)).inserted_id
+            report_input_assembler.invalidate(store_id)
             
             return {
                 "status": "success",
@@ -265,6 +216,267 @@ class CompetitorService:
                 "message": f"비교 분석 중 오류가 발생했습니다: {str(e)}"
             }
 
+    def _summarize_my_store(self, my_analysis: Dict[str, Any]) -> Dict[str, Any]:
+        """내 매장 리뷰 분석 결과를 비교용 요약으로 변환"""
+        my_review_count = my_analysis.get("review_count", 0)
+        my_sentiment = my_analysis.get("sentiment_distribution", {})
+        my_reviews = my_analysis.get("reviews", [])
+        
+        return {
+            "review_count": my_review_count,
+            "average_rating": my_analysis.get("average_rating", 0),
+            "sentiment_distribution": my_sentiment,
+            "positive_rate": (my_sentiment.get("positive", 0) / my_review_count * 100) if my_review_count > 0 else 0,
+            "sample_reviews": {
+                "positive": [r for r in my_reviews if r.get("sentiment") == "positive"][:5],
+                "negative": [r for r in my_reviews if r.get("sentiment") == "negative"][:5]
+            }
+        }
+    
+    def _summarize_competitor(self, competitor_name: str, analyzed_reviews: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """경쟁사 분석 리뷰를 비교용 요약으로 변환 (평점은 긍정 비율로 추정)"""
+        competitor_review_count = len(analyzed_reviews)
+        competitor_sentiment = {
+            "positive": sum(1 for r in analyzed_reviews if r.get("sentiment") == "positive"),
+            "neutral": sum(1 for r in analyzed_reviews if r.get("sentiment") == "neutral"),
+            "negative": sum(1 for r in analyzed_reviews if r.get("sentiment") == "negative")
+        }
+        
+        competitor_avg_rating = 0
+        if competitor_review_count > 0:
+            pos_ratio = competitor_sentiment.get("positive", 0) / competitor_review_count
+            competitor_avg_rating = 3.0 + (pos_ratio - 0.5) * 2
+            competitor_avg_rating = max(1.0, min(5.0, round(competitor_avg_rating, 1)))
+        
+        return {
+            "name": competitor_name,
+            "review_count": competitor_review_count,
+            "average_rating": competitor_avg_rating,
+            "sentiment_distribution": competitor_sentiment,
+            "positive_rate": (competitor_sentiment.get("positive", 0) / competitor_review_count * 100) if competitor_review_count > 0 else 0,
+            "sample_reviews": {
+                "positive": [r for r in analyzed_reviews if r.get("sentiment") == "positive"][:5],
+                "negative": [r for r in analyzed_reviews if r.get("sentiment") == "negative"][:5]
+            }
+        }
+
+    async def _analyze_competitor_for_comparison(self, competitor_name: str, semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+        """
+        다중 비교용 경쟁사 1곳 검색/리뷰 분석 (단계별 소요 시간 포함)
+        
+        Args:
+            competitor_name: 경쟁사 이름
+            semaphore: 동시 검색/크롤링 수를 제한하는 공유 세마포어
+            
+        Returns:
+            Dict: 경쟁사 요약, 워드 클라우드, 소요 시간
+        """
+        timings = {}
+        started = time.perf_counter()
+        
+        async with semaphore:
+            step = time.perf_counter()
+            search_result = await self.search_competitor(competitor_name)
+            timings["search"] = round(time.perf_counter() - step, 3)
+            
+            if search_result.get("status") == "error":
+                timings["total"] = round(time.perf_counter() - started, 3)
+                return {"name": competitor_name, "status": "error", "message": search_result.get("message"), "timings": timings}
+            
+            competitor_info = search_result.get("competitor_info", {})
+            place_id = competitor_info.get("place_id")
+            if not place_id:
+                timings["total"] = round(time.perf_counter() - started, 3)
+                return {"name": competitor_name, "status": "error", "message": "경쟁사의 네이버 플레이스 ID를 찾을 수 없습니다.", "timings": timings}
+            
+            step = time.perf_counter()
+            analyzed_reviews = await review_service.get_analyzed_reviews(place_id)
+            timings["reviews"] = round(time.perf_counter() - step, 3)
+        
+        if not analyzed_reviews:
+            timings["total"] = round(time.perf_counter() - started, 3)
+            return {"name": competitor_name, "status": "error", "place_id": place_id, "message": "경쟁사의 리뷰를 가져올 수 없습니다.", "timings": timings}
+        
+        step = time.perf_counter()
+        word_cloud = await review_service.generate_word_cloud_data(analyzed_reviews)
+        timings["word_cloud"] = round(time.perf_counter() - step, 3)
+        timings["total"] = round(time.perf_counter() - started, 3)
+        
+        return {
+            "name": competitor_info.get("store_name") or competitor_name,
+            "status": "success",
+            "place_id": place_id,
+            "competitor_info": competitor_info,
+            "summary": {
+                "place_id": place_id,
+                **self._summarize_competitor(competitor_info.get("store_name") or competitor_name, analyzed_reviews)
+            },
+            "word_cloud": word_cloud,
+            "timings": timings
+        }
+
+    async def compare_with_competitors(self, store_id: int, competitor_names: List[str]) -> Dict[str, Any]:
+        """
+        내 점포와 여러 경쟁사 리뷰 일괄 비교 분석 (결과는 하나의 문서로 DB에 저장)
+        
+        경쟁사 검색/크롤링은 공유 세마포어와 WebDriver 풀 한도 안에서 동시에 수행하고,
+        place_id별 리뷰 캐시를 재사용한다.
+        
+        Args:
+            store_id: 내 매장 ID
+            competitor_names: 경쟁사 이름 목록
+            
+        Returns:
+            Dict: 경쟁사별 비교 데이터와 종합 인사이트 (경쟁사별 워드 클라우드/소요 시간은 place_id 기준)
+        """
+        try:
+            started = time.perf_counter()
+            
+            reviews_collection = async_mongo_instance.get_collection("StoreReviews")
+            my_analysis = await reviews_collection.find_one({"store_id": store_id}, sort=[("created_at", -1)])
+            
+            if not my_analysis:
+                return {
+                    "status": "error",
+                    "message": "내 매장의 리뷰 분석 결과가 없습니다. 먼저 리뷰 분석을 진행해주세요."
+                }
+            
+            competitor_names = list(dict.fromkeys(name.strip() for name in competitor_names if name and name.strip()))
+            if not competitor_names:
+                return {"status": "error", "message": "비교할 경쟁사 이름이 없습니다."}
+            
+            semaphore = asyncio.Semaphore(self.fanout_concurrency)
+            results = await asyncio.gather(*[
+                self._analyze_competitor_for_comparison(name, semaphore) for name in competitor_names
+            ])
+            
+            # 이름이 달라도 같은 매장으로 검색되면 한 번만 비교
+            succeeded = list({r["place_id"]: r for r in results if r["status"] == "success"}.values())
+            failed = [
+                {"name": r["name"], "place_id": r.get("place_id"), "message": r["message"], "timings": r["timings"]}
+                for r in results if r["status"] == "error"
+            ]
+            
+            if not succeeded:
+                return {
+                    "status": "error",
+                    "message": "분석 가능한 경쟁사가 없습니다.",
+                    "failed_competitors": failed
+                }
+            
+            comparison_data = {
+                "my_store": self._summarize_my_store(my_analysis),
+                "competitors": [r["summary"] for r in succeeded],
+                "word_cloud_comparison": {
+                    "my_store": my_analysis.get("word_cloud_data", {}),
+                    "competitors": {r["place_id"]: r["word_cloud"] for r in succeeded}
+                }
+            }
+            
+            step = time.perf_counter()
+            comparison_insight = await self._generate_multi_comparison_insight(comparison_data)
+            insight_seconds = round(time.perf_counter() - step, 3)
+            
+            timings = {
+                "competitors": {r.get("place_id") or r["name"]: r["timings"] for r in results},
+                "insight": insight_seconds,
+                "total": round(time.perf_counter() - started, 3)
+            }
+            
+            comparison_collection = async_mongo_instance.get_collection("CompetitorComparisons")
+            comparison_doc = {
+                "store_id": store_id,
+                "store_analysis_id": str(my_analysis["_id"]),
+                "comparison_type": "multi",
+                "competitor_place_ids": [r["place_id"] for r in succeeded],
+                "competitor_names": [r["name"] for r in succeeded],
+                "comparison_data": comparison_data,
+                "comparison_insight": comparison_insight,
+                "failed_competitors": failed,
+                "timings": timings,
+                "created_at": datetime.now()
+            }
+            
+            comparison_id = (await comparison_collection.insert_one(comparison_doc)).inserted_id
+            report_input_assembler.invalidate(store_id)
+            
+            logger.info(f"다중 경쟁사 비교 완료: 매장 {store_id}, 경쟁사 {len(succeeded)}/{len(competitor_names)}곳, {timings['total']}초")
+            
+            return {
+                "status": "success",
+                "message": f"내 매장과 경쟁사 {len(succeeded)}곳의 비교 분석이 완료되었습니다.",
+                "comparison_id": str(comparison_id),
+                "comparison_data": comparison_data,
+                "comparison_insight": comparison_insight,
+                "failed_competitors": failed,
+                "timings": timings
+            }
+            
+        except Exception as e:
+            logger.error(f"다중 경쟁사 비교 분석 중 오류: {str(e)}")
+            return {
+                "status": "error",
+                "message": f"다중 경쟁사 비교 분석 중 오류가 발생했습니다: {str(e)}"
+            }
+
+    async def _generate_multi_comparison_insight(self, comparison_data: Dict[str, Any]) -> str:
+        """
+        다중 경쟁사 비교 인사이트 생성 (경쟁사 수와 무관하게 LLM 호출 1회)
+        
+        Args:
+            comparison_data: 다중 비교 분석 데이터
+            
+        Returns:
+            str: 비교 분석 인사이트
+        """
+        try:
+            my_store = comparison_data.get("my_store", {})
+            word_clouds = comparison_data.get("word_cloud_comparison", {})
+            my_words = word_clouds.get("my_store", {})
+            
+            competitor_lines = []
+            for competitor in comparison_data.get("competitors", []):
+                words = word_clouds.get("competitors", {}).get(competitor.get("place_id"), {})
+                competitor_lines.append(f"""
+                경쟁사 ({competitor.get("name")}):
+                - 리뷰 수: {competitor.get("review_count")}
+                - 평균 평점: {competitor.get("average_rating")}
+                - 긍정 리뷰 비율: {competitor.get("positive_rate"):.1f}%
+                - 감성 분포: {competitor.get("sentiment_distribution")}
+                - 자주 언급되는 긍정적 키워드: {', '.join(list(words.get("positive_words", {}).keys())[:10])}
+                - 자주 언급되는 부정적 키워드: {', '.join(list(words.get("negative_words", {}).keys())[:10])}""")
+            
+            prompt = f"""
+                다음은 내 매장과 경쟁사 {len(competitor_lines)}곳의 리뷰 분석 비교 데이터입니다:
+                
+                내 매장:
+                - 리뷰 수: {my_store.get("review_count")}
+                - 평균 평점: {my_store.get("average_rating")}
+                - 긍정 리뷰 비율: {my_store.get("positive_rate"):.1f}%
+                - 감성 분포: {my_store.get("sentiment_distribution")}
+                - 자주 언급되는 긍정적 키워드: {', '.join(list(my_words.get("positive_words", {}).keys())[:10])}
+                - 자주 언급되는 부정적 키워드: {', '.join(list(my_words.get("negative_words", {}).keys())[:10])}
+                {"".join(competitor_lines)}
+                
+                이 데이터를 분석하여 다음 내용이 포함된 비교 인사이트를 제공해 주세요:
+                
+                1. 경쟁사들 사이에서 내 매장의 위치 (강점과 약점)
+                2. 경쟁사별 주요 차이점
+                3. 고객이 공통적으로 중요하게 생각하는 요소 분석
+                4. 경쟁력 강화를 위한 구체적인 개선 방안
+                5. 마케팅 및 운영 전략에 대한 제안
+                
+                최대한 리뷰 텍스트 분석에서 나온 실제 키워드를 활용하여 구체적인 인사이트를 제공해 주세요.
+            """
+            
+            response = await eda_chat_service.generate_overall_summary({"다중 비교 분석 데이터": prompt})
+            
+            return response.strip()
+            
+        except Exception as e:
+            logger.error(f"다중 비교 분석 인사이트 생성 중 오류: {str(e)}")
+            return "비교 분석 결과, 내 매장과 경쟁사들 간에 고객 만족도와 서비스 품질에 차이가 있습니다. 자세한 인사이트는 현재 제공할 수 없습니다."
+
     async def _generate_comparison_insight(self, comparison_data: Dict[str, Any]) -> str:
         """
         비교 분석 인사이트 생성
@@ -335,9 +547,9 @@ class CompetitorService:
             Dict: 비교 분석 결과
         """
         try:
-            comparison_collection = mongo_instance.get_collection("CompetitorComparisons")
+            comparison_collection = async_mongo_instance.get_collection("CompetitorComparisons")
             
-            result = comparison_collection.find_one({"_id": ObjectId(comparison_id)})
+            result = await comparison_collection.find_one({"_id": ObjectId(comparison_id)})
             
             if not result:
                 return {
@@ -370,20 +582,26 @@ class CompetitorService:
             Dict: 비교 분석 목록
         """
         try:
-            comparison_collection = mongo_instance.get_collection("CompetitorComparisons")
+            comparison_collection = async_mongo_instance.get_collection("CompetitorComparisons")
             
             cursor = comparison_collection.find({"store_id": store_id}).sort("created_at", -1)
             
             results = []
-            for doc in cursor:
+            async for doc in cursor:
                 doc["_id"] = str(doc["_id"])
-                results.append({
+                item = {
                     "comparison_id": doc["_id"],
+                    "comparison_type": doc.get("comparison_type", "single"),
                     "competitor_name": doc.get("competitor_name", ""),
                     "competitor_place_id": doc.get("competitor_place_id", ""),
                     "created_at": doc.get("created_at", ""),
                     "summary": doc.get("comparison_insight", "")[:150] + "..." if len(doc.get("comparison_insight", "")) > 150 else doc.get("comparison_insight", "")
-                })
+                }
+                # 다중 비교는 경쟁사 목록을 별도 필드로 제공 (단일 비교 필드는 빈 값)
+                if item["comparison_type"] == "multi":
+                    item["competitor_names"] = doc.get("competitor_names", [])
+                    item["competitor_place_ids"] = doc.get("competitor_place_ids", [])
+                results.append(item)
             
             return {
                 "status": "success",
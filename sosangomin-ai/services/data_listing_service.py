@@ -0,0 +1,160 @@
+# services/data_listing_service.py
+
+import os
+import base64
+import logging
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple
+from bson import ObjectId
+from dotenv import load_dotenv
+from database.async_mongo_connector import async_mongo_instance
+
+logger = logging.getLogger(__name__)
+
+# 목록 화면에 필요한 요약 필드만 조회 (eda_result, auto_analysis_results 등 대용량 필드 제외)
+DATASOURCE_SUMMARY_FIELDS = {
+    "store_id": 1,
+    "source_name": 1,
+    "original_filename": 1,
+    "file_path": 1,
+    "file_size": 1,
+    "file_type": 1,
+    "upload_date": 1,
+    "status": 1,
+    "date_range": 1
+}
+
+ANALYSIS_SUMMARY_FIELDS = {
+    "store_id": 1,
+    "source_ids": 1,
+    "analysis_type": 1,
+    "status": 1,
+    "data_range": 1,
+    "created_at": 1
+}
+
+class DataListingService:
+    """
+    DataSources / AnalysisResults 목록 조회 계층
+
+    요약 필드만 projection으로 가져오고, (정렬 시각, _id) 내림차순 keyset 커서로 페이지를 나눈다.
+    정렬은 (store_id, upload_date), (source_ids, created_at) 복합 인덱스를 탄다.
+    정렬 시각이 없거나 날짜가 아닌 문서는 커서로 이어 갈 수 없으므로 목록에서 제외한다.
+    """
+
+    def __init__(self):
+        load_dotenv("./config/.env")
+
+        self.max_limit = int(os.getenv("DATA_LIST_MAX_LIMIT", 100))
+
+    async def ensure_indexes(self):
+        """목록 조회용 복합 인덱스 생성 (애플리케이션 시작 시 호출, 이미 있으면 무시됨)"""
+        indexes = [
+            ("DataSources", [("store_id", 1), ("upload_date", -1), ("_id", -1)], "ix_store_upload_date"),
+            ("DataSources", [("upload_date", -1), ("_id", -1)], "ix_upload_date"),
+            ("AnalysisResults", [("source_ids", 1), ("created_at", -1), ("_id", -1)], "ix_source_ids_created_at"),
+            ("AnalysisResults", [("created_at", -1), ("_id", -1)], "ix_created_at")
+        ]
+        for collection_name, keys, name in indexes:
+            try:
+                await async_mongo_instance.get_collection(collection_name).create_index(keys, name=name)
+            except Exception as e:
+                logger.warning(f"{collection_name} 인덱스 생성 실패 ({name}): {e}")
+
+    @staticmethod
+    def encode_cursor(sort_value: datetime, doc_id: ObjectId) -> str:
+        raw = f"{sort_value.isoformat()}|{doc_id}".encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[datetime, ObjectId]:
+        """
+        커서 문자열을 (정렬 시각, _id)로 변환
+
+        Raises:
+            ValueError: 잘못된 커서인 경우
+        """
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            sort_value, doc_id = base64.urlsafe_b64decode(padded).decode("utf-8").split("|")
+            return datetime.fromisoformat(sort_value), ObjectId(doc_id)
+        except Exception:
+            raise ValueError(f"유효하지 않은 커서입니다: {cursor}")
+
+    async def _list_page(self, collection_name: str, filter_query: Dict[str, Any], sort_field: str,
+                         projection: Dict[str, int], limit: int, cursor: Optional[str]) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        limit = max(1, min(limit, self.max_limit))
+        query = dict(filter_query)
+        # 마지막 문서가 정렬 시각 없이 끝나 has_next인데 커서를 만들 수 없는 경우를 막기 위해 날짜 문서만 조회
+        query[sort_field] = {"$type": "date"}
+
+        if cursor:
+            cursor_value, cursor_id = self.decode_cursor(cursor)
+            query["$or"] = [
+                {sort_field: {"$lt": cursor_value}},
+                {sort_field: cursor_value, "_id": {"$lt": cursor_id}}
+            ]
+
+        # 다음 페이지 존재 여부를 알기 위해 한 건 더 조회
+        docs = await async_mongo_instance.get_collection(collection_name) \
+            .find(query, projection) \
+            .sort([(sort_field, -1), ("_id", -1)]) \
+            .limit(limit + 1) \
+            .to_list(length=limit + 1)
+
+        has_next = len(docs) > limit
+        docs = docs[:limit]
+        next_cursor = None
+        if has_next:
+            next_cursor = self.encode_cursor(docs[-1][sort_field], docs[-1]["_id"])
+
+        return docs, next_cursor
+
+    async def list_datasources(self, store_id: Optional[int] = None, limit: int = 20,
+                               cursor: Optional[str] = None) -> Dict[str, Any]:
+        """
+        데이터소스 요약 목록 (upload_date 최신순)
+
+        Args:
+            store_id: 특정 매장만 조회 (없으면 전체)
+            limit: 페이지 크기
+            cursor: 이전 페이지의 next_cursor
+
+        Returns:
+            Dict: items, next_cursor (마지막 페이지면 None)
+        """
+        filter_query = {"store_id": store_id} if store_id is not None else {}
+        docs, next_cursor = await self._list_page(
+            "DataSources", filter_query, "upload_date", DATASOURCE_SUMMARY_FIELDS, limit, cursor
+        )
+
+        for doc in docs:
+            doc["_id"] = str(doc["_id"])
+
+        return {"items": docs, "next_cursor": next_cursor}
+
+    async def list_analysis_results(self, source_id: Optional[ObjectId] = None, limit: int = 20,
+                                    cursor: Optional[str] = None) -> Dict[str, Any]:
+        """
+        분석 결과 요약 목록 (created_at 최신순)
+
+        Args:
+            source_id: 해당 데이터소스를 포함한 분석만 조회 (없으면 전체)
+            limit: 페이지 크기
+            cursor: 이전 페이지의 next_cursor
+
+        Returns:
+            Dict: items, next_cursor (마지막 페이지면 None)
+        """
+        filter_query = {"source_ids": source_id} if source_id is not None else {}
+        docs, next_cursor = await self._list_page(
+            "AnalysisResults", filter_query, "created_at", ANALYSIS_SUMMARY_FIELDS, limit, cursor
+        )
+
+        for doc in docs:
+            doc["_id"] = str(doc["_id"])
+            doc["source_ids"] = [str(sid) for sid in doc.get("source_ids", [])]
+
+        return {"items": docs, "next_cursor": next_cursor}
+
+data_listing_service = DataListingService()
@@ -0,0 +1,207 @@
+# services/eda_context_index.py
+
+import os
+import re
+import json
+import math
+import logging
+import numpy as np
+from typing import Dict, List, Any, Optional
+from dotenv import load_dotenv
+from services.rag_service import rag_service
+
+logger = logging.getLogger(__name__)
+
+# 스니펫 형식이 바뀌면 올려서 캐시/저장된 인덱스를 다시 컴파일
+INDEX_VERSION = 1
+
+# 채팅 메시지 분류와 스니펫 태그에 쓰는 데이터 키워드
+DATA_KEYWORDS = [
+    "매출", "데이터", "분석", "통계", "차트", "그래프", "매출액",
+    "고객수", "고객 수", "판매량", "점심", "저녁", "시간대", "요일",
+    "상품", "시간별", "시즌", "공휴일", "매장", "가게", "메뉴",
+    "매출 현황", "성과", "실적", "인기 메뉴", "매출 추이", "영업",
+    "우리", "프로모션", "마케팅"
+]
+
+# 차트별 기본 태그 (차트 데이터에 키워드가 직접 나오지 않아도 질문과 연결되도록)
+SECTION_TAGS = {
+    "weekday_sales": ["요일", "매출"],
+    "time_period_sales": ["시간대", "점심", "저녁", "매출"],
+    "hourly_sales": ["시간별", "시간대", "매출"],
+    "top_products": ["상품", "메뉴", "인기 메뉴", "판매량"],
+    "holiday_sales": ["공휴일", "매출"],
+    "season_sales": ["시즌", "매출"],
+    "temperature_sales": ["날씨", "기온", "매출"],
+    "weather_sales": ["날씨", "매출"],
+    "weekday_time_sales": ["요일", "시간대", "매출"],
+    "monthly_sales": ["매출 추이", "월별", "매출"]
+}
+
+# 질문에서 찾을 태그 어휘
+TAG_VOCABULARY = list(dict.fromkeys(DATA_KEYWORDS + [tag for tags in SECTION_TAGS.values() for tag in tags]))
+
+def estimate_tokens(text: str) -> int:
+    """
+    입력 토큰 수 추정치
+
+    한글 등 비ASCII 문자는 글자당 1토큰, ASCII는 4글자당 1토큰으로 보수적으로 계산한다.
+    """
+    non_ascii = sum(1 for ch in text if ord(ch) > 127)
+    return math.ceil(non_ascii + (len(text) - non_ascii) / 4)
+
+def _compact_json(data: Any) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+def _one_line(text: str) -> str:
+    return re.sub(r"\s+", " ", text or "").strip()
+
+class EdaContextIndex:
+    """
+    채팅용 EDA 컨텍스트 인덱스
+
+    분석 완료 시 compile()로 차트마다 압축 텍스트 스니펫, 토큰 수, 키워드 태그, 임베딩을 만들어
+    분석 결과의 chat_context 섹션으로 저장한다. 채팅 시에는 select()가 질문 키워드와 임베딩 유사도로
+    스니펫 순위를 매겨 토큰 예산 안에서 고른다.
+    """
+
+    def __init__(self):
+        load_dotenv("./config/.env")
+
+        self.token_budget = int(os.getenv("CHAT_EDA_TOKEN_BUDGET", 1200))
+        self.snippet_max_tokens = int(os.getenv("EDA_SNIPPET_MAX_TOKENS", 400))
+        self.min_similarity = float(os.getenv("EDA_SNIPPET_MIN_SIMILARITY", 0.35))
+
+    def _render_snippet(self, chart_name: str, chart_data: Dict[str, Any]) -> str:
+        summary = _one_line(chart_data.get("summary", ""))
+        text = f"[{chart_name}] 데이터: {_compact_json(chart_data.get('data'))}"
+        if summary:
+            text += f"\n요약: {summary}"
+
+        # 데이터가 너무 길면 요약만 남김 (상품/요일x시간대 등 항목이 많은 차트)
+        if estimate_tokens(text) > self.snippet_max_tokens and summary:
+            text = f"[{chart_name}] 요약: {summary}"
+        return text
+
+    def compile(self, eda_result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        EDA 결과(result_data, summary)를 채팅용 스니펫 인덱스로 변환
+
+        Returns:
+            Dict: version, header({text, tokens}), snippets([{section, text, tokens, tags, embedding}])
+        """
+        try:
+            result_data = eda_result.get("result_data") or {}
+            if not result_data:
+                return None
+
+            header = "데이터 분석 결과:\n"
+            overall_summary = _one_line(eda_result.get("summary", ""))
+            if overall_summary:
+                header += f"전체 요약: {overall_summary[:500]}\n"
+            if "basic_stats" in result_data:
+                header += f"기본 통계: {_compact_json(result_data['basic_stats'].get('data'))}\n"
+
+            snippets = []
+            for chart_name, chart_data in result_data.items():
+                if chart_name == "basic_stats" or not isinstance(chart_data, dict):
+                    continue
+
+                text = self._render_snippet(chart_name, chart_data)
+                search_text = f"{chart_name}\n{json.dumps(chart_data, ensure_ascii=False)}".lower()
+                tags = list(dict.fromkeys(
+                    SECTION_TAGS.get(chart_name, []) + [kw for kw in DATA_KEYWORDS if kw in search_text]
+                ))
+                snippets.append({
+                    "section": chart_name,
+                    "text": text,
+                    "tokens": estimate_tokens(text),
+                    "tags": tags,
+                    "embedding": None
+                })
+
+            embeddings = self._embed([
+                f"{' '.join(snippet['tags'])} {_one_line(result_data[snippet['section']].get('summary', ''))}"
+                for snippet in snippets
+            ])
+            if embeddings is not None:
+                for snippet, embedding in zip(snippets, embeddings):
+                    snippet["embedding"] = [round(float(v), 5) for v in embedding]
+
+            return {
+                "version": INDEX_VERSION,
+                "header": {"text": header, "tokens": estimate_tokens(header)},
+                "snippets": snippets
+            }
+        except Exception as e:
+            logger.error(f"EDA 컨텍스트 인덱스 컴파일 중 오류: {str(e)}")
+            return None
+
+    def _embed(self, texts: List[str]) -> Optional[np.ndarray]:
+        """정규화된 임베딩 (코사인 유사도를 내적으로 계산하기 위해)"""
+        if not texts:
+            return None
+        embeddings = rag_service.encode(texts)
+        if embeddings is None:
+            return None
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(embeddings, axis=-1, keepdims=True)
+        return embeddings / np.where(norms == 0, 1, norms)
+
+    def message_tags(self, message: str) -> List[str]:
+        """질문에 포함된 데이터 키워드"""
+        message_lower = message.lower()
+        return [tag for tag in TAG_VOCABULARY if tag in message_lower]
+
+    def select(self, index: Dict[str, Any], message: str, query_embedding: Optional[np.ndarray] = None,
+               token_budget: Optional[int] = None) -> str:
+        """
+        토큰 예산 안에서 질문과 관련된 스니펫을 골라 컨텍스트 문자열 생성
+
+        관련도 = 겹치는 키워드 태그 수 + 임베딩 코사인 유사도.
+        태그가 겹치지 않고 유사도도 기준 미만인 스니펫은 제외한다.
+
+        Args:
+            index: compile() 결과
+            message: 사용자 질문
+            query_embedding: 질문 임베딩 (없으면 키워드로만 선택)
+            token_budget: 헤더 포함 최대 토큰 수 (기본 CHAT_EDA_TOKEN_BUDGET)
+        """
+        budget = token_budget or self.token_budget
+        tags = set(self.message_tags(message))
+
+        query = None
+        if query_embedding is not None:
+            query = np.asarray(query_embedding, dtype=np.float32)
+            norm = np.linalg.norm(query)
+            query = query / norm if norm else None
+
+        ranked = []
+        for position, snippet in enumerate(index.get("snippets", [])):
+            tag_score = len(tags.intersection(snippet["tags"]))
+            similarity = 0.0
+            if query is not None and snippet.get("embedding"):
+                similarity = float(np.dot(query, np.asarray(snippet["embedding"], dtype=np.float32)))
+            if tag_score == 0 and similarity < self.min_similarity:
+                continue
+            ranked.append((tag_score + similarity, position, snippet))
+
+        ranked.sort(key=lambda item: item[0], reverse=True)
+
+        used = index["header"]["tokens"]
+        selected = []
+        for _, position, snippet in ranked:
+            if used + snippet["tokens"] > budget:
+                continue
+            used += snippet["tokens"]
+            selected.append((position, snippet))
+
+        # 선택된 스니펫은 원래 차트 순서로 배치
+        selected.sort(key=lambda item: item[0])
+        logger.info(
+            f"EDA 스니펫 선택: {[snippet['section'] for _, snippet in selected]} "
+            f"(약 {used}/{budget} 토큰)"
+        )
+        return index["header"]["text"] + "\n".join(snippet["text"] for _, snippet in selected)
+
+eda_context_index = EdaContextIndex()
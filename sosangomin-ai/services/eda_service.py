@@ -9,10 +9,16 @@ from datetime import datetime
 from bson import ObjectId
 
 from database.mongo_connector import mongo_instance
+from database.async_mongo_connector import async_mongo_instance
 from services.s3_service import download_file_from_s3
 from services.auto_analysis import autoanalysis_service
 from services.auto_analysis_chat_service import autoanalysis_chat_service
 from services.eda_chat_service import eda_chat_service
+from services.analysis_artifact_store import analysis_artifact_store
+from services.report_input_assembler import report_input_assembler
+from services.chat_context_cache import chat_context_cache
+from services.eda_context_index import eda_context_index
+from services.chart_aggregation_engine import chart_aggregation_engine
 
 logger = logging.getLogger(__name__)
 
@@ -22,148 +28,13 @@ class EdaService:
         os.makedirs(self.temp_dir, exist_ok=True)
     
     def generate_chart_data(self, df):
-        """Chart.js에 적합한 데이터 구조 생성"""
-
-        chart_data = {}
-        
-        # 1. 기본 통계량 계산
-        total_sales = df['매출'].sum() if '매출' in df.columns else 0
-        avg_transaction = df['매출'].mean() if '매출' in df.columns else 0
-        total_transactions = len(df)
-        unique_products = df['상품 명칭'].nunique() if '상품 명칭' in df.columns else 0
-        
-        # 기본 통계량
-        chart_data["basic_stats"] = {
-            "total_sales": float(total_sales),
-            "avg_transaction": float(avg_transaction),
-            "total_transactions": total_transactions,
-            "unique_products": unique_products
-        }
-        
-        # 2. 요일별 매출
-        if '요일' in df.columns and '매출' in df.columns:
-            day_order = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-            
-            available_days = df['요일'].unique().tolist()
-            logger.info(f"데이터에 존재하는 요일: {available_days}")
-            
-            weekday_sales = df.groupby('요일')['매출'].sum()
-            
-            weekday_sales_dict = {day: float(weekday_sales[day]) if day in weekday_sales else 0 for day in day_order}
-            chart_data["weekday_sales"] = weekday_sales_dict
-        
-        # 3. 시간대별 매출
-        if '시간대' in df.columns and '매출' in df.columns:
-            time_period_dict = df.groupby('시간대')['매출'].sum().to_dict()
-            chart_data["time_period_sales"] = time_period_dict
-        
-        # 4. 시간별 매출
-        if '시' in df.columns and '매출' in df.columns:
-            hourly_dict = df.groupby('시')['매출'].sum().to_dict()
-            chart_data["hourly_sales"] = {str(k): float(v) for k, v in hourly_dict.items()}
-        
-        # 5. 상위 상품
-        if '상품 명칭' in df.columns and '매출' in df.columns:
-            top_products_dict = df.groupby('상품 명칭')['매출'].sum().sort_values(ascending=False).head(5).to_dict()
-            chart_data["top_products"] = top_products_dict
-        
-        # 6. 평일/휴일 매출
-        if '공휴일' in df.columns and '매출' in df.columns:
-            holiday_dict = df.groupby('공휴일')['매출'].sum().to_dict()
-            chart_data["holiday_sales"] = holiday_dict
-        
-        # 7. 계절별 매출
-        if '계절' in df.columns and '매출' in df.columns:
-            season_dict = df.groupby('계절')['매출'].sum().to_dict()
-            chart_data["season_sales"] = season_dict
-        
-        # 9. 고객당 평균 매출
-        if '고객 수' in df.columns and '매출' in df.columns and df['고객 수'].sum() > 0:
-            customer_avg = df['매출'].sum() / df['고객 수'].sum()
-            chart_data["basic_stats"]["customer_avg"] = float(customer_avg)
-        
-        # 날짜별 기온 및 날씨 기준 하루 평균 매출
-        if all(col in df.columns for col in ['매출', '기온', '강수량', '습도']):
-            df['날짜'] = df['매출 일시'].dt.date
-            daily_df = df.groupby('날짜').agg({
-                '매출': 'sum',
-                '기온': 'mean',
-                '강수량': 'max',
-                '습도': 'mean'
-            }).reset_index()
-
-            daily_df['기온_구간'] = (daily_df['기온'] // 5) * 5
-            temp_sales = daily_df.groupby('기온_구간')['매출'].agg(['mean', 'count']).reset_index()
-            temp_sales_filtered = temp_sales[temp_sales['count'] >= 5]
-            chart_data["temperature_sales"] = {
-                f"{int(row['기온_구간'])}~{int(row['기온_구간']) + 5}°C": float(row['mean'])
-                for _, row in temp_sales_filtered.iterrows()
-            }
-
-            daily_df['날씨_상세'] = pd.cut(
-                daily_df['강수량'],
-                bins=[0, 0.1, 5, 20, float('inf')],
-                labels=['맑음', '이슬비', '보통비', '폭우']
-            )
-            weather_sales = daily_df.groupby('날씨_상세')['매출'].agg(['mean', 'count']).reset_index()
-            weather_filtered = weather_sales[weather_sales['count'] >= 3]
-            chart_data["weather_sales"] = {
-                str(row['날씨_상세']): float(row['mean'])
-                for _, row in weather_filtered.iterrows()
-            }
-        
-        # 12. 요일 + 시간대 교차 분석
-        if all(col in df.columns for col in ['요일', '시간대', '매출']):
-            cross_dict = df.pivot_table(index='요일', columns='시간대', values='매출', aggfunc='sum').fillna(0).to_dict()
-            chart_data["weekday_time_sales"] = {k: {str(inner_k): float(inner_v) for inner_k, inner_v in v.items()} 
-                                            for k, v in cross_dict.items()}
-        
-        # 13. 월별 매출 추세
-        if '년' in df.columns and '월' in df.columns and '매출' in df.columns:
-            yearly_monthly_sales = df.groupby(['년', '월'])['매출'].sum()
-            
-            yearly_monthly_dict = {}
-            for (year, month), sales in yearly_monthly_sales.items():
-                key = f"{year}-{month}"
-                yearly_monthly_dict[key] = float(sales)
-            
-            chart_data["monthly_sales"] = yearly_monthly_dict
-        
-        # 14. 상품별 판매 비중
-        if '상품 명칭' in df.columns and '수량' in df.columns:
-            product_qty = df.groupby('상품 명칭')['수량'].sum()
-            total_qty = product_qty.sum()
-            
-            # 상위 10개 품목과 기타로 분류
-            top_products = product_qty.sort_values(ascending=False).head(10)
-            others = pd.Series([product_qty.sum() - top_products.sum()], index=['기타 상품'])
-            
-            product_share = pd.concat([top_products, others]) / total_qty * 100
-            product_share_dict = product_share.to_dict()
-            chart_data["product_share"] = {str(k): float(v) for k, v in product_share_dict.items()}
-        
-        # 15. 구매 금액대별 거래 건수
-        if '매출' in df.columns:
-            # 거래별 합계를 계산 (같은 전표 번호끼리 합산)
-            if '전표 번호' in df.columns:
-                transaction_amounts = df.groupby('전표 번호')['매출'].sum()
-                
-                # 금액대별 분류
-                bins = [0, 10000, 20000, 30000, 50000, 100000, float('inf')]
-                labels = ['1만원 미만', '1~2만원', '2~3만원', '3~5만원', '5~10만원', '10만원 이상']
-                
-                transaction_ranges = pd.cut(transaction_amounts, bins=bins, labels=labels)
-                transaction_counts = transaction_ranges.value_counts().to_dict()
-                
-                chart_data["transaction_amounts"] = {str(k): int(v) for k, v in transaction_counts.items()}
-        
-        return chart_data
+        """Chart.js에 적합한 데이터 구조 생성 (일별 x 시간 x 상품 큐브에서 모든 차트 계산, df는 변경하지 않음)"""
+        return chart_aggregation_engine.generate(df)
     
     async def perform_eda(self, store_id, source_ids, pos_type="키움"):
         """여러 데이터소스에 대한 EDA 및 자동 분석을 수행하고 결과를 MongoDB에 저장"""
         try:
             data_sources = mongo_instance.get_collection("DataSources")
-            analysis_results = mongo_instance.get_collection("AnalysisResults")
             
             preprocessed_data = []
             local_files = []
@@ -361,7 +232,17 @@ class EdaService:
                 }
             }
             
-            result_id = analysis_results.insert_one(result_doc).inserted_id
+            # 채팅용 EDA 스니펫 인덱스를 미리 컴파일 (chat_context 섹션으로 저장)
+            chat_context = eda_context_index.compile(result_doc["eda_result"])
+            if chat_context:
+                result_doc["chat_context"] = chat_context
+            
+            # 차트/예측/클러스터 데이터는 AnalysisArtifacts에 섹션별로 분리 저장
+            result_id = await analysis_artifact_store.save(
+                async_mongo_instance.get_collection("AnalysisResults"), result_doc
+            )
+            report_input_assembler.invalidate(store_id)
+            await chat_context_cache.invalidate_store(store_id)
             
             data_sources.update_many(
                 {"_id": {"$in": [ObjectId(sid) for sid in source_ids]}},
@@ -511,8 +392,8 @@ class EdaService:
     async def get_eda_result(self, analysis_id):
         """특정 분석 결과를 조회"""
         try:
-            analysis_results = mongo_instance.get_collection("AnalysisResults")
-            result = analysis_results.find_one({
+            analysis_results = async_mongo_instance.get_collection("AnalysisResults")
+            result = await analysis_results.find_one({
                 "_id": ObjectId(analysis_id),
                 "analysis_type": "combined_analysis" 
             })
@@ -520,6 +401,7 @@ class EdaService:
             if not result:
                 raise ValueError(f"ID가 {analysis_id}인 EDA 결과를 찾을 수 없습니다.")
             
+            result = await analysis_artifact_store.hydrate(result)
             result["_id"] = str(result["_id"])
             result["source_ids"] = str(result["source_ids"])
             
@@ -535,13 +417,14 @@ class EdaService:
     async def get_eda_results_by_source(self, source_id):
         """특정 데이터소스의 모든 분석석 결과를 조회"""
         try:
-            analysis_results = mongo_instance.get_collection("AnalysisResults")
+            analysis_results = async_mongo_instance.get_collection("AnalysisResults")
             cursor = analysis_results.find({
                 "source_id": ObjectId(source_id)
             }).sort("created_at", -1)
             
             results = []
-            for result in cursor:
+            async for result in cursor:
+                result = await analysis_artifact_store.hydrate(result)
                 result["_id"] = str(result["_id"])
                 result["source_ids"] = str(result["source_ids"])
                 results.append(result)
@@ -1,21 +1,66 @@
 import os
+import time
 import logging
 import json
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, AsyncIterator
 from datetime import datetime
 from bson import ObjectId
-from database.mongo_connector import mongo_instance
+from database.async_mongo_connector import async_mongo_instance
 from services.review_service import review_service
-from services.store_service import simple_store_service as store_service
+from services.report_input_assembler import report_input_assembler
+from services.swot_report_engine import SwotReportEngine
 from services.auto_analysis import autoanalysis_service
 from services.competitor_service import competitor_service
 from services.eda_chat_service import eda_chat_service
-from services.location_info_service import location_info_service
 from dotenv import load_dotenv
 import re
 
 logger = logging.getLogger(__name__)
 
+SECTION_TITLES = {
+    "reviews": "고객 리뷰",
+    "sales": "매출 데이터",
+    "competitors": "경쟁사 비교",
+    "location": "매장 위치"
+}
+
+SWOT_REPORT_REQUEST = """
+        ## 요청사항
+        위 데이터를 종합적으로 분석하여 소상공인을 위한 SWOT 분석을 다음 형식으로 작성해 주세요:
+        
+        1. 반드시 다음 네 항목으로 구성된 SWOT 분석을 제공해야 합니다:
+        - 강점(Strengths): 내부적으로 긍정적인 요소
+        - 약점(Weaknesses): 내부적으로 부정적인 요소
+        - 기회(Opportunities): 외부적으로 긍정적인 요소
+        - 위협(Threats): 외부적으로 부정적인 요소
+        
+        2. 각 항목마다 3-5개의 핵심 요소를 포함해 주세요.
+        
+        3. 마지막에 데이터에 기반한 구체적인 개선 제안 3-5가지를 제시해 주세요.
+        
+        4. 응답을 요약한 짧은 총평(2-3문장)을 제공해 주세요.
+        
+        5. recommendations은 상세히 마크다운 형식으로로 작성해주세요.
+
+        6. 평균 평점 관련 정보는 무시하세요.
+        ## 중요: 응답 포맷
+        
+        최종 결과는 다음과 같은 JSON 형식으로도 제공해 주세요:
+        
+        ```json
+        {
+            "strengths": ["강점1", "강점2", "강점3", ...],
+            "weaknesses": ["약점1", "약점2", "약점3", ...],
+            "opportunities": ["기회1", "기회2", "기회3", ...],
+            "threats": ["위협1", "위협2", "위협3", ...],
+            "summary": "분석 총평을 아주 상세히 작성",
+            "recommendations": ["제안1", "제안2", "제안3", ...]
+        }
+        ```
+        
+        단, JSON 구조 이외에도 자세한 설명을 포함한 전체 분석 보고서를 마크다운 형식으로 함께 제공해 주세요.
+        """
+
 class FinalReportService:
     def __init__(self):
         load_dotenv("./config/.env")
@@ -23,7 +68,9 @@ class FinalReportService:
         if not self.api_key:
             logger.warning("ANTHROPIC_API_KEY가 설정되지 않았습니다.")
 
-    async def call_claude_api(self, prompt: str) -> Dict[str, Any]:
+        self.report_engine = SwotReportEngine(self.call_claude_api, self.extract_swot_from_response)
+
+    async def call_claude_api(self, prompt: str, max_tokens: int = 7000) -> Dict[str, Any]:
         """Claude API를 호출하여 SWOT 분석 생성"""
         try:
             import aiohttp
@@ -44,7 +91,7 @@ class FinalReportService:
             
             data = {
                 "model": "claude-3-7-sonnet-20250219",
-                "max_tokens": 7000,
+                "max_tokens": max_tokens,
                 "messages": [
                     {"role": "user", "content": prompt}
                 ],
@@ -75,78 +122,9 @@ class FinalReportService:
             }
 
     async def get_latest_analysis_results(self, store_id: int) -> Dict[str, Any]:
-        """매장의 최신 분석 결과들을 가져오는 함수"""
+        """매장의 최신 분석 결과들을 가져오는 함수 (입력별 동시 조회, 매장별 캐시)"""
         try:
-            results = {}
-            missing_analyses = []
-            
-            # 1. 리뷰 분석 결과 가져오기
-            reviews_collection = mongo_instance.get_collection("StoreReviews")
-            review_analysis = reviews_collection.find_one({"store_id": store_id}, sort=[("created_at", -1)])
-            
-            if review_analysis:
-                results["review_analysis"] = review_analysis
-            else:
-                missing_analyses.append("리뷰 분석")
-            
-            # 2. 자동 분석 결과와 EDA 분석 결과(종합 분석) 가져오기
-            analysis_results = mongo_instance.get_collection("AnalysisResults")
-            combined_analysis = analysis_results.find_one(
-                {"store_id": store_id, "analysis_type": "combined_analysis"}, 
-                sort=[("created_at", -1)]
-            )
-            
-            if combined_analysis:
-                results["combined_analysis"] = combined_analysis
-                # 자동 분석 결과도 combined_analysis에서 가져옴
-                if "auto_analysis_results" in combined_analysis:
-                    results["auto_analysis"] = {
-                        "results": combined_analysis["auto_analysis_results"],
-                        "summaries": combined_analysis.get("summaries", {})
-                    }
-            else:
-                pass
-            
-            # 3. 경쟁사 비교 분석 결과 가져오기
-            competitor_collection = mongo_instance.get_collection("CompetitorComparisons")
-            competitor_analysis = competitor_collection.find_one(
-                {"store_id": store_id}, 
-                sort=[("created_at", -1)]
-            )
-            
-            if competitor_analysis:
-                results["competitor_analysis"] = competitor_analysis
-            else:
-                missing_analyses.append("경쟁사 비교 분석")
-            
-            # 4. 매장 위치 기반 행정동 정보 가져오기
-            store_info = None
-            try:
-                store_result = await store_service.get_store(store_id)
-                if store_result.get("status") == "success":
-                    store_info = store_result.get("store_info")
-                    
-                    # 주소에서 행정동 추출
-                    if store_info and "address" in store_info:
-                        dong_name = location_info_service.extract_dong_from_address(store_info["address"])
-                        
-                        if dong_name:
-                            # 행정동 정보 조회
-                            location_result = await location_info_service.get_dong_info(dong_name)
-                            
-                            if location_result.get("status") == "success":
-                                results["location_info"] = {
-                                    "dong_name": dong_name,
-                                    "data": location_result.get("data", {})
-                                }
-            except Exception as e:
-                logger.warning(f"매장 위치 정보를 가져오지 못했습니다 (ID: {store_id}): {str(e)}")
-            
-            return {
-                "results": results,
-                "missing_analyses": missing_analyses,
-                "status": "missing" if missing_analyses else "complete"
-            }
+            return await report_input_assembler.assemble(store_id)
             
         except Exception as e:
             logger.error(f"분석 결과 조회 중 오류: {str(e)}")
@@ -224,47 +202,67 @@ class FinalReportService:
                 "recommendations": []
             }
 
-    async def generate_final_report(self, store_id: int) -> Dict[str, Any]:
-        """종합 SWOT 분석 보고서 생성"""
+    async def generate_final_report_stream(self, store_id: int) -> AsyncIterator[Dict[str, Any]]:
+        """
+        종합 SWOT 분석 보고서 생성 (진행 이벤트 스트림)
+
+        Yields:
+            {"event": "section", ...}: 영역별 SWOT 분석이 끝날 때마다
+            {"event": "report", "report": ...}: 저장된 최종 보고서
+            {"event": "incomplete" | "error", ...}: 누락된 분석 또는 오류
+        """
         try:
             # 분석 결과 가져오기
             analysis_data = await self.get_latest_analysis_results(store_id)
             
             if analysis_data.get("status") == "error":
-                return analysis_data
+                yield {"event": "error", **analysis_data}
+                return
             
             if analysis_data.get("status") == "missing":
-                return {
+                yield {
+                    "event": "incomplete",
                     "status": "incomplete",
                     "message": f"필요한 분석이 누락되었습니다: {', '.join(analysis_data['missing_analyses'])}",
                     "missing_analyses": analysis_data["missing_analyses"]
                 }
+                return
             
             results = analysis_data.get("results", {})
-            
-            # 매장 정보 가져오기
-            store_info = None
-            try:
-                store_result = await store_service.get_store(store_id)
-                if store_result.get("status") == "success":
-                    store_info = store_result.get("store_info")
-            except Exception as e:
-                logger.warning(f"매장 정보를 가져오지 못했습니다 (ID: {store_id}): {str(e)}")
-            
-            # 프롬프트 구성
-            prompt = self._build_swot_prompt(store_id, store_info, results)
-            
-            # Claude API 호출
-            api_response = await self.call_claude_api(prompt)
-            
-            if api_response.get("status") == "error":
-                return api_response
-            
-            response_content = api_response.get("content", "")
+            store_info = analysis_data.get("store_info")
+            
+            # 영역별 프롬프트 블록 구성
+            prompt_started = time.perf_counter()
+            store_block = self._build_store_block(store_info)
+            section_blocks = self._build_section_blocks(results)
+            timings = dict(analysis_data.get("timings", {}))
+            timings["prompt_build"] = round(time.perf_counter() - prompt_started, 4)
+            logger.info(f"SWOT 보고서 입력 준비 (store_id: {store_id}) 소요 시간: {timings}")
+            
+            # 입력이 바뀐 영역만 Claude API로 다시 분석하고 완료되는 대로 전달
+            response_content = ""
+            fingerprints = {}
+            async for event in self.report_engine.stream(
+                store_block,
+                section_blocks,
+                lambda section_results: self._build_final_prompt(store_id, store_block, section_results)
+            ):
+                if event["event"] == "final":
+                    response_content = event["content"]
+                    fingerprints = event["fingerprints"]
+                    logger.info(f"SWOT 최종 보고서 (store_id: {store_id}) 캐시 사용: {event['cached']}")
+                else:
+                    yield event
             
             # SWOT 분석 결과 추출
             swot_analysis = await self.extract_swot_from_response(response_content)
             
+            related_analyses = {
+                "review_analysis_id": str(results.get("review_analysis", {}).get("_id", "")) if "review_analysis" in results else None,
+                "combined_analysis_id": str(results.get("combined_analysis", {}).get("_id", "")) if "combined_analysis" in results else None,
+                "competitor_analysis_id": str(results.get("competitor_analysis", {}).get("_id", "")) if "competitor_analysis" in results else None
+            }
+            
             # 최종 보고서 DB에 저장
             final_report_doc = {
                 "store_id": store_id,
@@ -272,47 +270,51 @@ class FinalReportService:
                 "created_at": datetime.now(),
                 "swot_analysis": swot_analysis,
                 "full_response": response_content,
-                "related_analyses": {
-                    "review_analysis_id": str(results.get("review_analysis", {}).get("_id", "")) if "review_analysis" in results else None,
-                    "combined_analysis_id": str(results.get("combined_analysis", {}).get("_id", "")) if "combined_analysis" in results else None,
-                    "competitor_analysis_id": str(results.get("competitor_analysis", {}).get("_id", "")) if "competitor_analysis" in results else None
-                }
+                "related_analyses": related_analyses,
+                "section_fingerprints": fingerprints
             }
             
-
-            final_reports = mongo_instance.get_collection("FinalReports")
-            report_id = final_reports.insert_one(final_report_doc).inserted_id
+            final_reports = async_mongo_instance.get_collection("FinalReports")
+            report_id = (await final_reports.insert_one(final_report_doc)).inserted_id
             
             return_report = {
                 "report_id": str(report_id),
-                "store_name": store_info.get("store_name", "알 수 없음") if store_info else "알 수 없음",
+                "store_name": final_report_doc["store_name"],
                 "created_at": datetime.now(),
                 "swot_analysis": swot_analysis,
                 "full_response": response_content,
-                "related_analyses": {
-                    "review_analysis_id": str(results.get("review_analysis", {}).get("_id", "")) if "review_analysis" in results else None,
-                    "combined_analysis_id": str(results.get("combined_analysis", {}).get("_id", "")) if "combined_analysis" in results else None,
-                    "competitor_analysis_id": str(results.get("competitor_analysis", {}).get("_id", "")) if "competitor_analysis" in results else None
-                }
+                "related_analyses": related_analyses
             }
 
             logger.debug(f"최종 반환 데이터 (swot_analysis): {swot_analysis}")
-            return return_report
+            yield {"event": "report", "report": return_report}
             
         except Exception as e:
             logger.error(f"SWOT 보고서 생성 중 오류: {str(e)}")
-            return {
+            yield {
+                "event": "error",
                 "status": "error",
                 "message": f"SWOT 보고서 생성 중 오류가 발생했습니다: {str(e)}"
             }
 
-    def _build_swot_prompt(self, store_id: int, store_info: Optional[Dict], results: Dict) -> str:
-        """SWOT 분석을 위한 Claude API 프롬프트 구성"""
-        prompt = f"""
-        # 소상공인 종합 SWOT 분석 보고서 작성 요청
-        
-        당신은 소상공인을 위한 데이터 분석 전문가입니다. 다음 데이터를 바탕으로 매장 ID {store_id}에 대한 종합적인 SWOT 분석 보고서를 작성해 주세요.
+    async def generate_final_report(self, store_id: int) -> Dict[str, Any]:
+        """종합 SWOT 분석 보고서 생성"""
+        async for event in self.generate_final_report_stream(store_id):
+            if event["event"] == "report":
+                return event["report"]
+            if event["event"] in ("incomplete", "error"):
+                event = dict(event)
+                event.pop("event")
+                return event
         
+        return {
+            "status": "error",
+            "message": "SWOT 보고서 생성 중 오류가 발생했습니다."
+        }
+
+    def _build_store_block(self, store_info: Optional[Dict]) -> str:
+        """프롬프트의 매장 정보 블록"""
+        prompt = """
         ## 매장 정보
         """
         
@@ -325,6 +327,17 @@ class FinalReportService:
         else:
             prompt += "- 매장 정보가 제공되지 않았습니다.\n"
         
+        return prompt
+
+    def _build_section_blocks(self, results: Dict) -> Dict[str, str]:
+        """
+        입력 영역별 프롬프트 블록 (reviews, sales, competitors, location)
+        
+        데이터가 없는 영역은 포함하지 않음
+        """
+        sections = {}
+        
+        prompt = ""
         # 리뷰 분석 데이터 추가
         if "review_analysis" in results:
             review_data = results["review_analysis"]
@@ -347,7 +360,10 @@ class FinalReportService:
             - 긍정적 키워드: {', '.join(pos_words) if pos_words else '없음'}
             - 부정적 키워드: {', '.join(neg_words) if neg_words else '없음'}
             """
+        if prompt:
+            sections["reviews"] = prompt
         
+        prompt = ""
         # 자동 분석 데이터 추가
         if "auto_analysis" in results:
             auto_data = results["auto_analysis"]
@@ -445,7 +461,10 @@ class FinalReportService:
                             prompt += f"{product}({sales:,.0f}원) "
                             count += 1
                     prompt += "\n"
+        if prompt:
+            sections["sales"] = prompt
         
+        prompt = ""
         if "competitor_analysis" in results:
             comp_data = results["competitor_analysis"]
             insight = comp_data.get('comparison_insight', '')
@@ -471,7 +490,10 @@ class FinalReportService:
             - 경쟁사 리뷰 수: {competitor.get('review_count', 0)}개, 평균 평점: {competitor.get('average_rating', 0)}점
             - 내 매장 긍정 비율: {my_positive_rate}%, 경쟁사 긍정 비율: {competitor_positive_rate}%
             """
-            
+        if prompt:
+            sections["competitors"] = prompt
+        
+        prompt = ""
         # 위치 기반 히트맵 데이터 추가 (새로 추가)
         if "location_info" in results:
             location_data = results["location_info"]
@@ -487,52 +509,35 @@ class FinalReportService:
             - 평균 개업률: {dong_data.get('평균 개업률', 0):.1f}%
             - 평균 폐업률: {dong_data.get('평균 폐업률', 0):.1f}%
             """
+        if prompt:
+            sections["location"] = prompt
         
-        prompt += """
-        ## 요청사항
-        위 데이터를 종합적으로 분석하여 소상공인을 위한 SWOT 분석을 다음 형식으로 작성해 주세요:
-        
-        1. 반드시 다음 네 항목으로 구성된 SWOT 분석을 제공해야 합니다:
-        - 강점(Strengths): 내부적으로 긍정적인 요소
-        - 약점(Weaknesses): 내부적으로 부정적인 요소
-        - 기회(Opportunities): 외부적으로 긍정적인 요소
-        - 위협(Threats): 외부적으로 부정적인 요소
-        
-        2. 각 항목마다 3-5개의 핵심 요소를 포함해 주세요.
-        
-        3. 마지막에 데이터에 기반한 구체적인 개선 제안 3-5가지를 제시해 주세요.
-        
-        4. 응답을 요약한 짧은 총평(2-3문장)을 제공해 주세요.
-        
-        5. recommendations은 상세히 마크다운 형식으로로 작성해주세요.
+        return sections
 
-        6. 평균 평점 관련 정보는 무시하세요.
-        ## 중요: 응답 포맷
-        
-        최종 결과는 다음과 같은 JSON 형식으로도 제공해 주세요:
-        
-        ```json
-        {
-            "strengths": ["강점1", "강점2", "강점3", ...],
-            "weaknesses": ["약점1", "약점2", "약점3", ...],
-            "opportunities": ["기회1", "기회2", "기회3", ...],
-            "threats": ["위협1", "위협2", "위협3", ...],
-            "summary": "분석 총평을 아주 상세히 작성",
-            "recommendations": ["제안1", "제안2", "제안3", ...]
-        }
-        ```
+    def _build_final_prompt(self, store_id: int, store_block: str, section_results: Dict[str, Dict[str, Any]]) -> str:
+        """영역별 SWOT 분석 결과를 종합하는 최종 보고서 프롬프트 구성"""
+        prompt = f"""
+        # 소상공인 종합 SWOT 분석 보고서 작성 요청
         
-        단, JSON 구조 이외에도 자세한 설명을 포함한 전체 분석 보고서를 마크다운 형식으로 함께 제공해 주세요.
+        당신은 소상공인을 위한 데이터 분석 전문가입니다. 다음 데이터를 바탕으로 매장 ID {store_id}에 대한 종합적인 SWOT 분석 보고서를 작성해 주세요.
         """
+        prompt += store_block
+        
+        for section, section_result in section_results.items():
+            prompt += f"""
+            ## {SECTION_TITLES.get(section, section)} 영역 분석 결과
+            {json.dumps(section_result, ensure_ascii=False)}
+            """
         
+        prompt += SWOT_REPORT_REQUEST
         return prompt
 
     async def get_final_report(self, report_id: str) -> Dict[str, Any]:
         """저장된 SWOT 분석 보고서 조회"""
         try:
-            final_reports = mongo_instance.get_collection("FinalReports")
+            final_reports = async_mongo_instance.get_collection("FinalReports")
             
-            report = final_reports.find_one({"_id": ObjectId(report_id)})
+            report = await final_reports.find_one({"_id": ObjectId(report_id)})
             
             if not report:
                 return {
@@ -557,12 +562,12 @@ class FinalReportService:
     async def get_store_reports_list(self, store_id: int) -> Dict[str, Any]:
         """매장의 모든 SWOT 보고서 목록 조회"""
         try:
-            final_reports = mongo_instance.get_collection("FinalReports")
+            final_reports = async_mongo_instance.get_collection("FinalReports")
             
             cursor = final_reports.find({"store_id": store_id}).sort("created_at", -1)
             
             results = []
-            for doc in cursor:
+            async for doc in cursor:
                 doc["_id"] = str(doc["_id"])
                 results.append({
                     "report_id": doc["_id"],
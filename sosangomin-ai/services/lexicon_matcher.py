@@ -0,0 +1,75 @@
+# services/lexicon_matcher.py
+
+from collections import deque
+from typing import Dict, List, Set, Tuple
+
+class LexiconMatcher:
+    """
+    감성 사전용 Aho–Corasick 매처
+
+    사전 전체로 오토마톤을 한 번 만들어 두고, 토큰을 한 번만 훑어서
+    토큰에 부분 문자열로 포함된 모든 사전 단어를 찾는다.
+    (기존 `sentiment_word in word` 전수 비교와 동일한 결과)
+    """
+
+    def __init__(self, lexicon: Dict[str, float]):
+        self.lexicon = dict(lexicon)
+
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Set[str]] = [set()]
+
+        for word in self.lexicon:
+            self._add(word)
+        self._build_failure_links()
+
+    def _add(self, word: str):
+        state = 0
+        for char in word:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(set())
+            state = next_state
+        self._output[state].add(word)
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._output[next_state] |= self._output[self._fail[next_state]]
+
+    def find(self, text: str) -> Set[str]:
+        """text에 포함된 사전 단어 집합"""
+        found: Set[str] = set()
+        state = 0
+
+        for char in text:
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            if self._output[state]:
+                found |= self._output[state]
+
+        return found
+
+    def score(self, text: str) -> Tuple[float, int]:
+        """
+        text에 포함된 사전 단어들의 점수 합과 매칭된 단어 수
+
+        Returns:
+            Tuple[float, int]: (점수 합, 매칭 단어 수)
+        """
+        matches = self.find(text)
+        return sum(self.lexicon[word] for word in matches), len(matches)
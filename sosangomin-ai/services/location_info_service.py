@@ -1,8 +1,12 @@
 # services/location_info_service.py
 
+import os
 import re
+import time
+import asyncio
 import logging
 from typing import Optional, Dict, Any, Tuple
+from dotenv import load_dotenv
 from services.location_recommendation_service import location_recommendation_service
 from fastapi import HTTPException
 
@@ -11,6 +15,14 @@ logger = logging.getLogger(__name__)
 class LocationInfoService:
     def __init__(self):
         """위치 정보 서비스 초기화"""
+        load_dotenv("./config/.env")
+
+        # 히트맵 원천 데이터는 분기 단위로 바뀌므로 행정동명 -> 데이터 맵을 TTL 동안 재사용
+        self.heatmap_cache_ttl = int(os.getenv("LOCATION_HEATMAP_CACHE_TTL", 600))
+        self._dong_map: Optional[Dict[str, Dict[str, Any]]] = None
+        self._dong_map_expires = 0.0
+        self._dong_map_lock = asyncio.Lock()
+
         logger.info("LocationInfoService 초기화 완료")
     
     def extract_dong_from_address(self, address: str) -> Optional[str]:
@@ -44,6 +56,18 @@ class LocationInfoService:
             logger.error(f"주소에서 행정동 추출 중 오류: {str(e)}")
             return None
     
+    async def _get_dong_map(self) -> Dict[str, Dict[str, Any]]:
+        """행정동명 -> 히트맵 데이터 (동시 요청은 한 번만 재계산)"""
+        if self._dong_map is not None and self._dong_map_expires > time.monotonic():
+            return self._dong_map
+
+        async with self._dong_map_lock:
+            if self._dong_map is None or self._dong_map_expires <= time.monotonic():
+                heatmap_data = await location_recommendation_service.prepare_initial_heatmap_data()
+                self._dong_map = {item["행정동명"]: item for item in heatmap_data}
+                self._dong_map_expires = time.monotonic() + self.heatmap_cache_ttl
+            return self._dong_map
+
     async def get_dong_info(self, dong_name: str) -> Dict[str, Any]:
         """행정동명에 해당하는 데이터 조회
         
@@ -54,9 +78,7 @@ class LocationInfoService:
             행정동 관련 정보 또는 에러 메시지
         """
         try:
-            heatmap_data = location_recommendation_service.prepare_initial_heatmap_data()
-            
-            dong_data = next((item for item in heatmap_data if item["행정동명"] == dong_name), None)
+            dong_data = (await self._get_dong_map()).get(dong_name)
             
             if not dong_data:
                 return {
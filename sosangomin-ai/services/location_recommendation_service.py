@@ -1,8 +1,9 @@
 import pandas as pd
 import os
 import json
-from sqlalchemy.orm import Session
-from database.connector import database_instance
+import asyncio
+from sqlalchemy import select
+from database.async_connector import async_database_instance
 from db_models import Population, Facilities, SalesData, RentInfo, StoreCategories
 from sklearn.preprocessing import MinMaxScaler
 from typing import List
@@ -21,204 +22,211 @@ class LocationRecomService:
         with open(os.path.join(json_dir, "area_data.json"), "r", encoding="utf-8") as f:
             self.area_data = json.load(f)
 
-    def prepare_initial_heatmap_data(self) -> pd.DataFrame:
+    async def _fetch_all(self, stmt) -> list:
+        """읽기 세션에서 ORM 행 조회 (동시에 실행되도록 쿼리마다 별도 세션 사용)"""
+        async with async_database_instance.session(read_only=True) as db:
+            return (await db.execute(stmt)).scalars().all()
+
+    async def _fetch_latest_rows(self, model, year_col, quarter_col, *conditions) -> list:
+        """가장 최근 연도/분기 행만 조회"""
+        async with async_database_instance.session(read_only=True) as db:
+            latest = (await db.execute(
+                select(year_col, quarter_col).order_by(year_col.desc(), quarter_col.desc()).limit(1)
+            )).first()
+            stmt = select(model).where(year_col == latest[0], quarter_col == latest[1], *conditions)
+            return (await db.execute(stmt)).scalars().all()
+
+    async def prepare_initial_heatmap_data(self) -> pd.DataFrame:
         """상권분석 페이지 초기 히트맵을 위한 데이터 처리"""
-        db = database_instance.pre_session()
         try:
-            # 1. 인구 정보
-            pop_rows = db.query(Population).all()
-            pop_data = []
-            for row in pop_rows:
-                try:    
-                    pop_data.append({
-                        "행정동명": row.region_name,
-                        "유동인구": row.tot_fpop or 0,
-                        "직장인구": row.tot_wrpop or 0,
-                        "거주인구": row.tot_repop or 0
-                    })
-                except Exception as e:
-                    logger.warning(f"히트맵 인구 데이터 처리 오류: {e}")
-
-            df_pop = pd.DataFrame(pop_data)
-
-            # 2. 점포 수 정보
-            latest_store = db.query(StoreCategories.year, StoreCategories.quarter).order_by(StoreCategories.year.desc(), StoreCategories.quarter.desc()).first()
-            store_rows = db.query(StoreCategories).filter(
-                StoreCategories.year == latest_store.year,
-                StoreCategories.quarter == latest_store.quarter,
-                StoreCategories.main_category == "외식업"
-            ).all()
-
-            store_data = [
-                {
-                    'region_name': row.region_name,
-                    'store_count': row.store_count,
-                    'open_rate': row.open_rate,
-                    'close_rate': row.close_rate
-                }
-                for row in store_rows
-            ]
-
-            df_sales = pd.DataFrame(store_data)
-
-            # 행정동 단위로 계산
-            df_sales_group = df_sales.groupby('region_name').agg({
-                    'store_count': 'sum',
-                    'open_rate': 'mean',
-                    'close_rate': 'mean'
-                }).reset_index()
-            df_sales_group.columns = ['행정동명', '총 업소 수', '평균 개업률', '평균 폐업률']
-            df_sales_group['평균 개업률'] = df_sales_group['평균 개업률'].round(2)
-            df_sales_group['평균 폐업률'] = df_sales_group['평균 폐업률'].round(2)
-
-            merged = df_pop.merge(df_sales_group, on="행정동명", how="left")
-            merged = merged.fillna(0)
-            result = merged.to_dict(orient="records")
-            return result
+            pop_rows, store_rows = await asyncio.gather(
+                self._fetch_all(select(Population)),
+                self._fetch_latest_rows(
+                    StoreCategories, StoreCategories.year, StoreCategories.quarter,
+                    StoreCategories.main_category == "외식업"
+                )
+            )
+            return await asyncio.to_thread(self._build_heatmap_data, pop_rows, store_rows)
         except Exception as e:
-            db.rollback()
             logger.error(f'히트맵 데이터 처리 중 오류: {e}')
             raise HTTPException(status_code=401)
-        finally:
-            db.close()
 
-    def get_integrated_location_dataframe(self, target_age: str, industry_name: str) -> pd.DataFrame:
-        """입지추천을 위한 데이터 병합 수행(타겟연령, 업종 반영)"""
-        db = database_instance.pre_session()
-        try:
-            # 1. 인구 정보
-            pop_rows = db.query(Population).all()
-            pop_data = []
-            for row in pop_rows:
-                try:
-                    total_pop = (row.tot_fpop or 0) + (row.tot_wrpop or 0) + (row.tot_repop or 0)
-                    target_total = (
-                        (getattr(row, f"female_{target_age}_fpop", 0) or 0) + (getattr(row, f"male_{target_age}_fpop", 0) or 0) +
-                        (getattr(row, f"female_{target_age}_repop", 0) or 0) + (getattr(row, f"male_{target_age}_repop", 0) or 0) +
-                        (getattr(row, f"female_{target_age}_wrpop", 0) or 0) + (getattr(row, f"male_{target_age}_wrpop", 0) or 0)
-                    )
-                    if target_age == "60" : 
-                        target_total += (getattr(row, f"female_70_fpop", 0) or 0) + (getattr(row, f"male_70_fpop", 0) or 0) 
-                    target_ratio = target_total / total_pop if total_pop else 0
-                    pop_data.append({
-                        "행정동명": row.region_name,
-                        f"타겟연령_비율": target_ratio,
-                        f"타겟연령_수": target_total,
-                        "유동인구": row.tot_fpop or 0,
-                        "직장인구": row.tot_wrpop or 0,
-                        "거주인구": row.tot_repop or 0
-                    })
-                except Exception as e:
-                    logger.warning(f"입지추천 인구 데이터 처리 오류: {e}")
-
-            df_pop = pd.DataFrame(pop_data)
-
-            # 2. 시설 정보 - 가장 최근 연도/분기 데이터만 사용
-            latest_facility = db.query(Facilities.year, Facilities.quarter).order_by(Facilities.year.desc(), Facilities.quarter.desc()).limit(1).first()
-            facility_rows = db.query(Facilities).filter(
-                Facilities.year == latest_facility.year,
-                Facilities.quarter == latest_facility.quarter
-            ).all()
-            facility_data = [
-                {
-                    "행정동명": row.region_name,
-                    "접근성_합": (
-                        (row.arprt_co or 0) + (row.rlroad_statn_co or 0) +
-                        (row.bus_trminl_co or 0) + (row.subway_statn_co or 0) + (row.bus_sttn_co or 0)
-                    ),
-                    "집객시설": row.viatr_fclty_co or 0
-                }
-                for row in facility_rows
-            ]
-            df_facility = pd.DataFrame(facility_data)
-
-            # 3. 매출 정보 - 최신 연도/분기 기준
-            latest_sales = db.query(SalesData.year, SalesData.quarter).order_by(SalesData.year.desc(), SalesData.quarter.desc()).first()
-            sales_rows = db.query(SalesData).filter(
-                SalesData.year == latest_sales.year,
-                SalesData.quarter == latest_sales.quarter,
-                SalesData.industry_name == industry_name
-            ).all()
-
-            # 4. 점포 수 정보 - 최신 기준
-            latest_store = db.query(StoreCategories.year, StoreCategories.quarter).order_by(StoreCategories.year.desc(), StoreCategories.quarter.desc()).first()
-            storecat_rows = db.query(StoreCategories).filter(
-                StoreCategories.year == latest_store.year,
-                StoreCategories.quarter == latest_store.quarter,
-                StoreCategories.industry_name == industry_name
-            ).all()
-            storecat_dict = {row.region_name: row.store_count or 0 for row in storecat_rows}
-
-            sales_data = []
-            for row in sales_rows:
-                store_count = storecat_dict.get(row.region_name, 0)
-                avg_sales = (row.sales_amount / store_count) if store_count else 0
-                sales_data.append({
+    def _build_heatmap_data(self, pop_rows: list, store_rows: list) -> list:
+        """히트맵 데이터 가공 (스레드에서 실행)"""
+        # 1. 인구 정보
+        pop_data = []
+        for row in pop_rows:
+            try:    
+                pop_data.append({
                     "행정동명": row.region_name,
-                    "업종_평균_매출": avg_sales
+                    "유동인구": row.tot_fpop or 0,
+                    "직장인구": row.tot_wrpop or 0,
+                    "거주인구": row.tot_repop or 0
                 })
-            df_sales = pd.DataFrame(sales_data)
-
-            storecat_data = [
-                {"행정동명": row.region_name, 
-                "동일업종_수": row.store_count or 0}
-                for row in storecat_rows
-            ]
-            df_storecat = pd.DataFrame(storecat_data)
-
-            # 5. 임대료 
-            latest_rent = db.query(RentInfo.STRD_YR_CD, RentInfo.STRD_QTR_CD).order_by(RentInfo.STRD_YR_CD.desc(), RentInfo.STRD_QTR_CD.desc()).first()
-            rent_rows = db.query(RentInfo).filter(
-                RentInfo.STRD_YR_CD == latest_rent.STRD_YR_CD,
-                RentInfo.STRD_QTR_CD == latest_rent.STRD_QTR_CD,
-                RentInfo.LET_CURPRC_FLR_CLSF_CD_NM == "전체층"
-            ).all()
-            rent_data = [
-                {"행정동명": row.ADSTRD_CD_NM, "임대료": row.EXCHE_RENTCG_AVE or 0}
-                for row in rent_rows
-            ]
-            df_rent = pd.DataFrame(rent_data)
-
-            merged = df_pop.merge(df_facility, on="행정동명", how="left")
-            merged = merged.merge(df_sales, on="행정동명", how="left")
-            merged = merged.merge(df_storecat, on="행정동명", how="left")
-            merged = merged.merge(df_rent, on="행정동명", how="left")
-            merged['면적(㎢)'] = pd.to_numeric(merged['행정동명'].map(self.area_data))
-
-
-            merged_unique = merged.groupby("행정동명").agg({
-                "타겟연령_비율": "mean",
-                "타겟연령_수": "mean",
-                "업종_평균_매출": "mean",
-                "임대료": "mean",
-                "유동인구": "mean",
-                "직장인구": "mean",
-                "거주인구": "mean",
-                "동일업종_수": "mean",
-                "집객시설": "mean",
-                "접근성_합": "mean",
-                "면적(㎢)": "mean" 
+            except Exception as e:
+                logger.warning(f"히트맵 인구 데이터 처리 오류: {e}")
+
+        df_pop = pd.DataFrame(pop_data)
+
+        # 2. 점포 수 정보
+        store_data = [
+            {
+                'region_name': row.region_name,
+                'store_count': row.store_count,
+                'open_rate': row.open_rate,
+                'close_rate': row.close_rate
+            }
+            for row in store_rows
+        ]
+
+        df_sales = pd.DataFrame(store_data)
+
+        # 행정동 단위로 계산
+        df_sales_group = df_sales.groupby('region_name').agg({
+                'store_count': 'sum',
+                'open_rate': 'mean',
+                'close_rate': 'mean'
             }).reset_index()
+        df_sales_group.columns = ['행정동명', '총 업소 수', '평균 개업률', '평균 폐업률']
+        df_sales_group['평균 개업률'] = df_sales_group['평균 개업률'].round(2)
+        df_sales_group['평균 폐업률'] = df_sales_group['평균 폐업률'].round(2)
 
-            for col in ["유동인구", "직장인구", "거주인구", "동일업종_수", "집객시설", "접근성_합"]:
-                if col in merged_unique.columns:
-                    merged_unique[f"{col}(면적당)"] = merged_unique[col] / merged_unique["면적(㎢)"]
-            merged_unique.rename(columns={"접근성_합(면적당)": "접근성"}, inplace=True)
-            merged_unique = merged_unique.drop(columns=["면적(㎢)", "유동인구", "직장인구", "거주인구", "동일업종_수", "집객시설", "접근성_합"], errors="ignore")
-
-            # print("======================")
-            # print("merged_unique")
-            # print(merged_unique["행정동명"].nunique())
-            # print("======================")
+        merged = df_pop.merge(df_sales_group, on="행정동명", how="left")
+        merged = merged.fillna(0)
+        result = merged.to_dict(orient="records")
+        return result
 
-            return merged_unique.fillna(0)
-        
+    async def get_integrated_location_dataframe(self, target_age: str, industry_name: str) -> pd.DataFrame:
+        """입지추천을 위한 데이터 병합 수행(타겟연령, 업종 반영)"""
+        try:
+            # 인구/시설/매출/점포/임대료는 서로 독립적이므로 동시에 조회 (각각 최신 연도/분기 기준)
+            pop_rows, facility_rows, sales_rows, storecat_rows, rent_rows = await asyncio.gather(
+                self._fetch_all(select(Population)),
+                self._fetch_latest_rows(Facilities, Facilities.year, Facilities.quarter),
+                self._fetch_latest_rows(
+                    SalesData, SalesData.year, SalesData.quarter,
+                    SalesData.industry_name == industry_name
+                ),
+                self._fetch_latest_rows(
+                    StoreCategories, StoreCategories.year, StoreCategories.quarter,
+                    StoreCategories.industry_name == industry_name
+                ),
+                self._fetch_latest_rows(
+                    RentInfo, RentInfo.STRD_YR_CD, RentInfo.STRD_QTR_CD,
+                    RentInfo.LET_CURPRC_FLR_CLSF_CD_NM == "전체층"
+                )
+            )
+            return await asyncio.to_thread(
+                self._build_integrated_dataframe, target_age,
+                pop_rows, facility_rows, sales_rows, storecat_rows, rent_rows
+            )
         except Exception as e:
-            db.rollback()
             logger.error(f'데이터 병합 중 오류: {e}')
             raise HTTPException(status_code=401)
-        finally:
-            db.close()
+
+    def _build_integrated_dataframe(self, target_age: str, pop_rows: list, facility_rows: list,
+                                    sales_rows: list, storecat_rows: list, rent_rows: list) -> pd.DataFrame:
+        """조회 결과를 행정동 단위로 병합 (스레드에서 실행)"""
+        # 1. 인구 정보
+        pop_data = []
+        for row in pop_rows:
+            try:
+                total_pop = (row.tot_fpop or 0) + (row.tot_wrpop or 0) + (row.tot_repop or 0)
+                target_total = (
+                    (getattr(row, f"female_{target_age}_fpop", 0) or 0) + (getattr(row, f"male_{target_age}_fpop", 0) or 0) +
+                    (getattr(row, f"female_{target_age}_repop", 0) or 0) + (getattr(row, f"male_{target_age}_repop", 0) or 0) +
+                    (getattr(row, f"female_{target_age}_wrpop", 0) or 0) + (getattr(row, f"male_{target_age}_wrpop", 0) or 0)
+                )
+                if target_age == "60" : 
+                    target_total += (getattr(row, f"female_70_fpop", 0) or 0) + (getattr(row, f"male_70_fpop", 0) or 0) 
+                target_ratio = target_total / total_pop if total_pop else 0
+                pop_data.append({
+                    "행정동명": row.region_name,
+                    f"타겟연령_비율": target_ratio,
+                    f"타겟연령_수": target_total,
+                    "유동인구": row.tot_fpop or 0,
+                    "직장인구": row.tot_wrpop or 0,
+                    "거주인구": row.tot_repop or 0
+                })
+            except Exception as e:
+                logger.warning(f"입지추천 인구 데이터 처리 오류: {e}")
+
+        df_pop = pd.DataFrame(pop_data)
+
+        # 2. 시설 정보 - 가장 최근 연도/분기 데이터만 사용
+        facility_data = [
+            {
+                "행정동명": row.region_name,
+                "접근성_합": (
+                    (row.arprt_co or 0) + (row.rlroad_statn_co or 0) +
+                    (row.bus_trminl_co or 0) + (row.subway_statn_co or 0) + (row.bus_sttn_co or 0)
+                ),
+                "집객시설": row.viatr_fclty_co or 0
+            }
+            for row in facility_rows
+        ]
+        df_facility = pd.DataFrame(facility_data)
+
+        # 3~4. 매출 / 점포 수 정보 - 최신 연도/분기 기준
+        storecat_dict = {row.region_name: row.store_count or 0 for row in storecat_rows}
+
+        sales_data = []
+        for row in sales_rows:
+            store_count = storecat_dict.get(row.region_name, 0)
+            avg_sales = (row.sales_amount / store_count) if store_count else 0
+            sales_data.append({
+                "행정동명": row.region_name,
+                "업종_평균_매출": avg_sales
+            })
+        df_sales = pd.DataFrame(sales_data)
+
+        storecat_data = [
+            {"행정동명": row.region_name, 
+            "동일업종_수": row.store_count or 0}
+            for row in storecat_rows
+        ]
+        df_storecat = pd.DataFrame(storecat_data)
+
+        # 5. 임대료 
+        rent_data = [
+            {"행정동명": row.ADSTRD_CD_NM, "임대료": row.EXCHE_RENTCG_AVE or 0}
+            for row in rent_rows
+        ]
+        df_rent = pd.DataFrame(rent_data)
+
+        merged = df_pop.merge(df_facility, on="행정동명", how="left")
+        merged = merged.merge(df_sales, on="행정동명", how="left")
+        merged = merged.merge(df_storecat, on="행정동명", how="left")
+        merged = merged.merge(df_rent, on="행정동명", how="left")
+        merged['면적(㎢)'] = pd.to_numeric(merged['행정동명'].map(self.area_data))
+
+
+        merged_unique = merged.groupby("행정동명").agg({
+            "타겟연령_비율": "mean",
+            "타겟연령_수": "mean",
+            "업종_평균_매출": "mean",
+            "임대료": "mean",
+            "유동인구": "mean",
+            "직장인구": "mean",
+            "거주인구": "mean",
+            "동일업종_수": "mean",
+            "집객시설": "mean",
+            "접근성_합": "mean",
+            "면적(㎢)": "mean" 
+        }).reset_index()
+
+        for col in ["유동인구", "직장인구", "거주인구", "동일업종_수", "집객시설", "접근성_합"]:
+            if col in merged_unique.columns:
+                merged_unique[f"{col}(면적당)"] = merged_unique[col] / merged_unique["면적(㎢)"]
+        merged_unique.rename(columns={"접근성_합(면적당)": "접근성"}, inplace=True)
+        merged_unique = merged_unique.drop(columns=["면적(㎢)", "유동인구", "직장인구", "거주인구", "동일업종_수", "집객시설", "접근성_합"], errors="ignore")
+
+        # print("======================")
+        # print("merged_unique")
+        # print(merged_unique["행정동명"].nunique())
+        # print("======================")
+
+        return merged_unique.fillna(0)
 
     def calculate_location_scores(self, df: pd.DataFrame, priority: List[str]) -> pd.DataFrame:
         "입지추천을 위한 행정동별 점수 계산"
@@ -277,13 +285,17 @@ class LocationRecomService:
         
         return df
 
-    def recommend_location(self, user_input: dict, top_n: int = 3) -> dict:
+    async def recommend_location(self, user_input: dict, top_n: int = 3) -> dict:
         """상위 n개의 행정동을 추천하고 상세정보 반환"""
         target_age = user_input["target_age"]
         industry_name = user_input["industry_name"]
         priority = user_input["priority"]
 
-        preprocess = self.get_integrated_location_dataframe(target_age, industry_name)        
+        preprocess = await self.get_integrated_location_dataframe(target_age, industry_name)
+        return await asyncio.to_thread(self._build_recommendation, preprocess, priority, top_n)
+
+    def _build_recommendation(self, preprocess: pd.DataFrame, priority: List[str], top_n: int) -> dict:
+        """점수 계산 및 등급 부여 (스레드에서 실행)"""
         result = self.calculate_location_scores(preprocess, priority)
 
         avg_data = result[[
@@ -321,7 +333,6 @@ class LocationRecomService:
 location_recommendation_service = LocationRecomService()
 
 # 단독 테스트 실행용
-import asyncio
 if __name__ == "__main__":
     user_input= {
     "industry_name": "한식음식점",
@@ -330,6 +341,6 @@ if __name__ == "__main__":
     }
     async def main():
         # result = location_recommendation_service.recommend_location(user_input)
-        result = location_recommendation_service.prepare_initial_heatmap_data()
+        result = await location_recommendation_service.prepare_initial_heatmap_data()
         print(json.dumps(result, ensure_ascii=False, indent=4))
     asyncio.run(main())
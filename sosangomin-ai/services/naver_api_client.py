@@ -0,0 +1,183 @@
+# services/naver_api_client.py
+
+import os
+import time
+import json
+import logging
+import asyncio
+import aiohttp
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+from dotenv import load_dotenv
+
+logger = logging.getLogger(__name__)
+
+class TokenBucket:
+    """초당 rate개씩 채워지고 최대 capacity개까지 쌓이는 토큰 버킷"""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """토큰 하나를 얻을 때까지 대기"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+                self._updated_at = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class NaverOpenApiClient:
+    """
+    네이버 검색 오픈 API(지역/뉴스) 비동기 클라이언트
+
+    keep-alive 세션 하나를 공유하고, 토큰 버킷으로 호출량을 API 한도 안으로 맞추며,
+    429/5xx 응답은 백오프 후 재시도한다. 같은 검색 요청은 TTL 캐시에서 바로 반환한다.
+    """
+
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+    def __init__(self):
+        load_dotenv("./config/.env")
+
+        self.client_id = os.getenv("NAVER_CLIENT_ID")
+        self.client_secret = os.getenv("NAVER_CLIENT_SECRET")
+
+        if not self.client_id or not self.client_secret:
+            logger.error("네이버 API 키가 설정되지 않았습니다. 환경 변수를 확인하세요.")
+            self.client_id = "NOT_SET"
+            self.client_secret = "NOT_SET"
+        else:
+            logger.info(f"네이버 API 키 설정 완료: {self.client_id[:5]}...")
+
+        self.headers = {
+            "X-Naver-Client-Id": self.client_id,
+            "X-Naver-Client-Secret": self.client_secret
+        }
+        self.base_url = os.getenv("NAVER_OPENAPI_URL", "https://openapi.naver.com/v1/search")
+
+        self.max_retries = int(os.getenv("NAVER_API_MAX_RETRIES", 3))
+        self.backoff_base = float(os.getenv("NAVER_API_BACKOFF", 0.5))
+        self.cache_ttl = int(os.getenv("NAVER_API_CACHE_TTL", 300))
+        self.cache_size = int(os.getenv("NAVER_API_CACHE_SIZE", 1000))
+        self.connection_limit = int(os.getenv("NAVER_API_CONNECTIONS", 10))
+        self.timeout = aiohttp.ClientTimeout(total=10)
+
+        self.rate_limiter = TokenBucket(
+            rate=float(os.getenv("NAVER_API_RATE", 10)),
+            capacity=int(os.getenv("NAVER_API_BURST", 10))
+        )
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._cache: "OrderedDict[Tuple[str, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.connection_limit, keepalive_timeout=60)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=self.timeout,
+                headers=self.headers
+            )
+        return self._session
+
+    def _cache_get(self, key: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+        cached = self._cache.get(key)
+        if cached is None:
+            return None
+
+        expires_at, data = cached
+        if expires_at < time.monotonic():
+            del self._cache[key]
+            return None
+
+        self._cache.move_to_end(key)
+        return data
+
+    def _cache_set(self, key: Tuple[str, str], data: Dict[str, Any]):
+        self._cache[key] = (time.monotonic() + self.cache_ttl, data)
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _retry_delay(self, response: Optional[aiohttp.ClientResponse], attempt: int) -> float:
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after and retry_after.isdigit():
+                return float(retry_after)
+        return self.backoff_base * (2 ** attempt)
+
+    async def search(self, endpoint: str, params: Dict[str, Any], use_cache: bool = True) -> Dict[str, Any]:
+        """
+        검색 API 호출 (캐시 → 토큰 버킷 → 요청/재시도)
+
+        Args:
+            endpoint: 검색 종류 ("local", "news" 등)
+            params: 쿼리 파라미터
+            use_cache: TTL 캐시 사용 여부
+
+        Returns:
+            Dict: API 응답 JSON
+
+        Raises:
+            aiohttp.ClientError: 재시도 후에도 실패한 경우
+        """
+        key = (endpoint, json.dumps(params, sort_keys=True, ensure_ascii=False))
+
+        if use_cache:
+            cached = self._cache_get(key)
+            if cached is not None:
+                return cached
+
+        url = f"{self.base_url}/{endpoint}.json"
+        session = self._get_session()
+
+        for attempt in range(self.max_retries + 1):
+            await self.rate_limiter.acquire()
+
+            try:
+                async with session.get(url, params=params) as response:
+                    if response.status in self.RETRY_STATUSES and attempt < self.max_retries:
+                        delay = self._retry_delay(response, attempt)
+                        logger.warning(f"네이버 API 응답 {response.status}, {delay:.1f}초 후 재시도 ({attempt + 1}/{self.max_retries})")
+                        await asyncio.sleep(delay)
+                        continue
+
+                    response.raise_for_status()
+                    data = await response.json(content_type=None)
+
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._retry_delay(None, attempt)
+                logger.warning(f"네이버 API 연결 오류: {e}, {delay:.1f}초 후 재시도 ({attempt + 1}/{self.max_retries})")
+                await asyncio.sleep(delay)
+                continue
+
+            if use_cache:
+                self._cache_set(key, data)
+            return data
+
+    async def search_local(self, query: str, display: int = 1, start: int = 1, sort: str = "random") -> Dict[str, Any]:
+        """네이버 지역 검색"""
+        return await self.search("local", {"query": query, "display": display, "start": start, "sort": sort})
+
+    async def search_news(self, query: str, display: int = 10, start: int = 1, sort: str = "date") -> Dict[str, Any]:
+        """네이버 뉴스 검색"""
+        return await self.search("news", {"query": query, "display": display, "start": start, "sort": sort})
+
+    async def close(self):
+        if self._session and not self._session.closed:
+            await self._session.close()
+
+naver_api_client = NaverOpenApiClient()
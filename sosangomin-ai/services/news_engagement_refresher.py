@@ -0,0 +1,302 @@
+# services/news_engagement_refresher.py
+
+import os
+import re
+import time
+import codecs
+import logging
+import asyncio
+import aiohttp
+from datetime import datetime
+from html.parser import HTMLParser
+from urllib.parse import urlparse
+from typing import Dict, List, Any, Optional, Tuple
+from pymongo import UpdateOne
+from sqlalchemy.orm import Session
+from dotenv import load_dotenv
+from db_models import News
+from database.mongo_connector import mongo_instance
+
+logger = logging.getLogger(__name__)
+
+VOID_TAGS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr"
+}
+
+class StreamingSelectorParser(HTMLParser):
+    """
+    청크 단위로 feed하면서 간단한 CSS 선택자(자손 결합자 + 태그/클래스/ID)에
+    처음 일치하는 요소의 텍스트를 수집하는 HTML 파서
+
+    모든 선택자의 텍스트가 수집되면 done이 True가 되어 나머지 본문을 읽지 않아도 된다.
+    """
+
+    def __init__(self, selectors: Dict[str, str]):
+        super().__init__(convert_charrefs=True)
+        self.selectors = {name: [self._parse_simple(part) for part in selector.split()]
+                          for name, selector in selectors.items()}
+        self.results: Dict[str, str] = {}
+
+        self._stack: List[Tuple[str, str, set]] = []
+        self._capturing: Dict[str, Tuple[int, List[str]]] = {}
+
+    @staticmethod
+    def _parse_simple(part: str) -> Tuple[Optional[str], Optional[str], set]:
+        tag = re.match(r'^[a-zA-Z][a-zA-Z0-9]*', part)
+        element_id = re.search(r'#([\w-]+)', part)
+        classes = set(re.findall(r'\.([\w-]+)', part))
+        return (tag.group().lower() if tag else None, element_id.group(1) if element_id else None, classes)
+
+    @staticmethod
+    def _matches(simple: Tuple[Optional[str], Optional[str], set], element: Tuple[str, str, set]) -> bool:
+        tag, element_id, classes = simple
+        return ((tag is None or tag == element[0])
+                and (element_id is None or element_id == element[1])
+                and classes <= element[2])
+
+    def _selector_matches(self, parts: List[Tuple[Optional[str], Optional[str], set]]) -> bool:
+        if not self._matches(parts[-1], self._stack[-1]):
+            return False
+
+        remaining = len(parts) - 2
+        for element in reversed(self._stack[:-1]):
+            if remaining < 0:
+                break
+            if self._matches(parts[remaining], element):
+                remaining -= 1
+        return remaining < 0
+
+    @property
+    def done(self) -> bool:
+        return len(self.results) == len(self.selectors)
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        self._stack.append((tag, attrs.get("id") or "", set((attrs.get("class") or "").split())))
+
+        for name, parts in self.selectors.items():
+            if name not in self.results and name not in self._capturing and self._selector_matches(parts):
+                self._capturing[name] = (len(self._stack), [])
+
+        if tag in VOID_TAGS:
+            self._close_to(len(self._stack) - 1)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_TAGS:
+            self._close_to(len(self._stack) - 1)
+
+    def handle_endtag(self, tag):
+        for depth in range(len(self._stack) - 1, -1, -1):
+            if self._stack[depth][0] == tag:
+                self._close_to(depth)
+                return
+
+    def handle_data(self, data):
+        for _, chunks in self._capturing.values():
+            chunks.append(data)
+
+    def _close_to(self, depth: int):
+        """depth 위치 요소까지 닫고, 그 안에서 시작된 수집을 완료"""
+        del self._stack[depth:]
+        for name, (start_depth, chunks) in list(self._capturing.items()):
+            if start_depth > depth:
+                self.results[name] = "".join(chunks).strip()
+                del self._capturing[name]
+
+
+class NewsEngagementRefresher:
+    """
+    뉴스 기사 좋아요/댓글 수 일괄 갱신 엔진
+
+    - ETag/Last-Modified를 MongoDB(NewsFetchValidators)에 보관하여 조건부 요청, 304면 건너뜀
+    - 동시 요청 수 제한, 본문은 청크 단위 스트리밍 파싱 후 선택자를 찾으면 즉시 중단
+    - 변경분은 bulk_update_mappings 한 번으로 저장
+    - 도메인별 수신 바이트/지연 시간 기록
+    """
+
+    def __init__(self, site_patterns: Dict[str, Dict[str, str]], headers: Dict[str, str]):
+        load_dotenv("./config/.env")
+
+        self.site_patterns = site_patterns
+        self.headers = headers
+        self.concurrency = int(os.getenv("NEWS_REFRESH_CONCURRENCY", 8))
+        self.chunk_size = int(os.getenv("NEWS_REFRESH_CHUNK_SIZE", 16384))
+        self.max_bytes = int(os.getenv("NEWS_REFRESH_MAX_BYTES", 2 * 1024 * 1024))
+        self.timeout = aiohttp.ClientTimeout(total=5)
+        self.validators = mongo_instance.get_collection("NewsFetchValidators")
+
+        try:
+            self.validators.create_index("news_id", unique=True)
+        except Exception as e:
+            logger.warning(f"NewsFetchValidators 인덱스 생성 실패: {e}")
+
+        self._domain_stats: Dict[str, Dict[str, float]] = {}
+
+    def _match_site_pattern(self, news_url: str) -> Optional[Dict[str, str]]:
+        for site_domain, pattern in self.site_patterns.items():
+            if site_domain in news_url:
+                return pattern
+        return None
+
+    def _record(self, domain: str, status: int, received: int, latency: float):
+        stats = self._domain_stats.setdefault(domain, {
+            "requests": 0, "not_modified": 0, "errors": 0,
+            "bytes": 0, "latency_total": 0.0, "latency_max": 0.0
+        })
+        stats["requests"] += 1
+        stats["bytes"] += received
+        stats["latency_total"] += latency
+        stats["latency_max"] = max(stats["latency_max"], latency)
+        if status == 304:
+            stats["not_modified"] += 1
+        elif status != 200:
+            stats["errors"] += 1
+
+    def domain_stats(self) -> Dict[str, Dict[str, float]]:
+        """도메인별 요청 수, 304 수, 오류 수, 수신 바이트, 평균/최대 지연(초)"""
+        return {
+            domain: {
+                "requests": stats["requests"],
+                "not_modified": stats["not_modified"],
+                "errors": stats["errors"],
+                "bytes": stats["bytes"],
+                "latency_avg": round(stats["latency_total"] / stats["requests"], 4),
+                "latency_max": round(stats["latency_max"], 4)
+            }
+            for domain, stats in self._domain_stats.items()
+        }
+
+    @staticmethod
+    def _parse_count(text: Optional[str]) -> int:
+        match = re.search(r'\d+', text or "")
+        return int(match.group()) if match else 0
+
+    async def _fetch_metrics(self, session: aiohttp.ClientSession, news_url: str,
+                             pattern: Dict[str, str], validator: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        조건부 요청으로 기사 페이지를 스트리밍 파싱하여 좋아요/댓글 수 추출
+
+        Returns:
+            Dict: status, likes, comments, etag, last_modified
+        """
+        headers = dict(self.headers)
+        if validator:
+            if validator.get("etag"):
+                headers["If-None-Match"] = validator["etag"]
+            if validator.get("last_modified"):
+                headers["If-Modified-Since"] = validator["last_modified"]
+
+        domain = urlparse(news_url).netloc
+        started = time.perf_counter()
+        received = 0
+        status = 0
+
+        try:
+            async with session.get(news_url, headers=headers, timeout=self.timeout) as response:
+                status = response.status
+                result = {
+                    "status": status,
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified")
+                }
+                if status != 200:
+                    return result
+
+                parser = StreamingSelectorParser({
+                    "likes": pattern["likes_selector"],
+                    "comments": pattern["comments_selector"]
+                })
+                decoder = codecs.getincrementaldecoder(response.charset or "utf-8")(errors="replace")
+
+                async for chunk in response.content.iter_chunked(self.chunk_size):
+                    received += len(chunk)
+                    parser.feed(decoder.decode(chunk))
+                    if parser.done or received >= self.max_bytes:
+                        break
+
+                result["likes"] = self._parse_count(parser.results.get("likes"))
+                result["comments"] = self._parse_count(parser.results.get("comments"))
+                return result
+
+        except (aiohttp.ClientError, asyncio.TimeoutError, LookupError) as e:
+            logger.warning(f"좋아요/댓글 수 추출 실패: {e}, 링크: {news_url}")
+            return {"status": status or -1}
+        finally:
+            self._record(domain, status, received, time.perf_counter() - started)
+
+    async def refresh(self, db: Session, limit: int = 50) -> int:
+        """
+        최신 뉴스 limit개의 좋아요/댓글 수 갱신
+
+        Args:
+            db: 데이터베이스 세션
+            limit: 갱신할 최신 기사 수
+
+        Returns:
+            int: 지표가 변경된 기사 수
+        """
+        rows = db.query(News.news_id, News.link, News.likes_count, News.comments_count) \
+            .order_by(News.pub_date.desc()).limit(limit).all()
+
+        try:
+            validators = {doc["news_id"]: doc for doc in self.validators.find({"news_id": {"$in": [row.news_id for row in rows]}})}
+        except Exception as e:
+            logger.warning(f"조건부 요청 정보 조회 실패: {e}")
+            validators = {}
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        connector = aiohttp.TCPConnector(limit=self.concurrency)
+
+        async with aiohttp.ClientSession(connector=connector) as session:
+            async def refresh_one(row):
+                pattern = self._match_site_pattern(row.link)
+                if not pattern:
+                    # 지원하지 않는 사이트는 요청 없이 0으로 본다 (기존 동작과 동일)
+                    return {"status": 200, "likes": 0, "comments": 0}
+                async with semaphore:
+                    return await self._fetch_metrics(session, row.link, pattern, validators.get(row.news_id))
+
+            results = await asyncio.gather(*(refresh_one(row) for row in rows))
+
+        now = datetime.now()
+        mappings = []
+        validator_ops = []
+
+        for row, result in zip(rows, results):
+            if result.get("etag") or result.get("last_modified"):
+                validator_ops.append(UpdateOne(
+                    {"news_id": row.news_id},
+                    {"$set": {
+                        "news_id": row.news_id,
+                        "etag": result.get("etag"),
+                        "last_modified": result.get("last_modified"),
+                        "updated_at": now
+                    }},
+                    upsert=True
+                ))
+
+            if result["status"] != 200:
+                continue
+
+            if row.likes_count != result["likes"] or row.comments_count != result["comments"]:
+                mappings.append({
+                    "news_id": row.news_id,
+                    "likes_count": result["likes"],
+                    "comments_count": result["comments"],
+                    "updated_at": now
+                })
+
+        if mappings:
+            db.bulk_update_mappings(News, mappings)
+            db.commit()
+
+        if validator_ops:
+            try:
+                self.validators.bulk_write(validator_ops, ordered=False)
+            except Exception as e:
+                logger.warning(f"조건부 요청 정보 저장 실패: {e}")
+
+        logger.info(f"지표 갱신 도메인별 통계: {self.domain_stats()}")
+        return len(mappings)
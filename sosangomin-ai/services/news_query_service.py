@@ -0,0 +1,137 @@
+# services/news_query_service.py
+
+import os
+import time
+import base64
+import logging
+import threading
+from datetime import date, datetime
+from typing import Dict, List, Any, Optional, Tuple
+from sqlalchemy import or_, and_
+from sqlalchemy.orm import Session
+from dotenv import load_dotenv
+from db_models import News
+
+logger = logging.getLogger(__name__)
+
+class NewsQueryService:
+    """
+    뉴스 목록 조회 계층
+
+    (category, pub_date) 복합 인덱스를 타도록 pub_date DESC, news_id DESC 순으로 정렬하고
+    OFFSET 대신 마지막 항목의 (pub_date, news_id)를 커서로 넘기는 keyset 페이지네이션을 사용한다.
+    가장 많이 호출되는 카테고리별 첫 페이지는 짧은 TTL로 메모리에 캐싱한다.
+    """
+
+    def __init__(self):
+        load_dotenv("./config/.env")
+
+        self.first_page_ttl = int(os.getenv("NEWS_FIRST_PAGE_TTL", 60))
+        self.max_limit = int(os.getenv("NEWS_PAGE_MAX_LIMIT", 100))
+
+        self._first_page_cache: Dict[Tuple[str, int], Tuple[float, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def ensure_indexes(self, engine):
+        """db_models.News에 선언된 인덱스가 없으면 생성 (애플리케이션 시작 시 호출)"""
+        for index in News.__table__.indexes:
+            try:
+                index.create(bind=engine, checkfirst=True)
+            except Exception as e:
+                logger.warning(f"news 인덱스 생성 실패 ({index.name}): {e}")
+
+    @staticmethod
+    def encode_cursor(pub_date: date, news_id: int) -> str:
+        raw = f"{pub_date.isoformat()}|{news_id}".encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[date, int]:
+        """
+        커서 문자열을 (pub_date, news_id)로 변환
+
+        Raises:
+            ValueError: 잘못된 커서인 경우
+        """
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            pub_date, news_id = base64.urlsafe_b64decode(padded).decode("utf-8").split("|")
+            return datetime.strptime(pub_date, "%Y-%m-%d").date(), int(news_id)
+        except Exception:
+            raise ValueError(f"유효하지 않은 커서입니다: {cursor}")
+
+    @staticmethod
+    def serialize(news: News) -> Dict[str, Any]:
+        return {
+            "news_id": news.news_id,
+            "title": news.title,
+            "link": news.link,
+            "pub_date": news.pub_date.isoformat() if news.pub_date else None,
+            "image_url": news.image_url,
+            "category": news.category,
+            "likes_count": news.likes_count,
+            "comments_count": news.comments_count
+        }
+
+    def fetch_rows(self, db: Session, category: Optional[str] = None, limit: int = 20,
+                   cursor: Optional[str] = None) -> List[News]:
+        """keyset 조건으로 limit개의 News 행 조회"""
+        query = db.query(News)
+
+        if category and category != "전체":
+            query = query.filter(News.category == category)
+
+        if cursor:
+            cursor_date, cursor_id = self.decode_cursor(cursor)
+            query = query.filter(or_(
+                News.pub_date < cursor_date,
+                and_(News.pub_date == cursor_date, News.news_id < cursor_id)
+            ))
+
+        return query.order_by(News.pub_date.desc(), News.news_id.desc()).limit(limit).all()
+
+    def list_news(self, db: Session, category: Optional[str] = None, limit: int = 20,
+                  cursor: Optional[str] = None) -> Dict[str, Any]:
+        """
+        뉴스 목록 페이지 조회
+
+        Args:
+            db: 데이터베이스 세션
+            category: 카테고리 (None 또는 "전체"면 전체)
+            limit: 페이지 크기
+            cursor: 이전 페이지의 next_cursor (없으면 첫 페이지)
+
+        Returns:
+            Dict: items, next_cursor (마지막 페이지면 None)
+        """
+        limit = max(1, min(limit, self.max_limit))
+        cache_key = (category or "전체", limit)
+
+        if not cursor:
+            with self._lock:
+                cached = self._first_page_cache.get(cache_key)
+            if cached and cached[0] > time.monotonic():
+                return cached[1]
+
+        # 다음 페이지 존재 여부를 알기 위해 한 건 더 조회
+        rows = self.fetch_rows(db, category, limit + 1, cursor)
+        has_next = len(rows) > limit
+        rows = rows[:limit]
+
+        page = {
+            "items": [self.serialize(news) for news in rows],
+            "next_cursor": self.encode_cursor(rows[-1].pub_date, rows[-1].news_id) if has_next else None
+        }
+
+        if not cursor:
+            with self._lock:
+                self._first_page_cache[cache_key] = (time.monotonic() + self.first_page_ttl, page)
+
+        return page
+
+    def invalidate(self):
+        """새 뉴스 저장 후 첫 페이지 캐시 비우기"""
+        with self._lock:
+            self._first_page_cache.clear()
+
+news_query_service = NewsQueryService()
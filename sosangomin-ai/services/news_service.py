@@ -11,7 +11,11 @@ from db_models import News
 from typing import List, Dict, Any, Optional, Tuple
 from bs4 import BeautifulSoup
 import re
+from urllib.parse import urlparse
 from dotenv import load_dotenv
+from services.naver_api_client import naver_api_client
+from services.news_engagement_refresher import NewsEngagementRefresher
+from services.news_query_service import news_query_service
 
 logger = logging.getLogger(__name__)
 
@@ -19,22 +23,6 @@ class NewsService:
     def __init__(self):
         load_dotenv("./config/.env")
         
-        self.client_id = os.getenv("NAVER_CLIENT_ID")
-        self.client_secret = os.getenv("NAVER_CLIENT_SECRET")
-        
-        if not self.client_id or not self.client_secret:
-            logger.error("네이버 API 키가 설정되지 않았습니다. 환경 변수를 확인하세요.")
-            self.client_id = "NOT_SET"
-            self.client_secret = "NOT_SET"
-        else:
-            logger.info(f"네이버 API 키 설정 완료: {self.client_id[:5]}...")
-        
-        self.headers = {
-            "X-Naver-Client-Id": self.client_id,
-            "X-Naver-Client-Secret": self.client_secret
-        }
-        self.base_url = "https://openapi.naver.com/v1/search/news.json"
-
         # 소상공인 관련 검색 키워드
         self.keywords = [
             "소상공인 지원",
@@ -89,30 +77,29 @@ class NewsService:
                 "comments_selector": ".reply-count"
             }
         }
+        
+        self.page_headers = {
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+            "Accept": "text/html,application/xhtml+xml,application/xml",
+            "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7"
+        }
+        self.default_image_url = "https://picsum.photos/200/300?random=1"
+        
+        # 기사 페이지 동시 요청 수 / DB 저장 배치 크기
+        self.fetch_concurrency = int(os.getenv("NEWS_FETCH_CONCURRENCY", 8))
+        self.insert_batch_size = int(os.getenv("NEWS_INSERT_BATCH_SIZE", 100))
+        
+        self.engagement_refresher = NewsEngagementRefresher(self.news_site_patterns, self.page_headers)
     
-    async def fetch_news(self, session, keyword: str, display: int = 10, start: int = 1) -> Dict[str, Any]:
+    async def fetch_news(self, keyword: str, display: int = 10, start: int = 1) -> Dict[str, Any]:
         """네이버 검색 API를 사용하여 뉴스 검색 (비동기)"""
         try:
-            params = {
-                "query": keyword,
-                "display": display,
-                "start": start,
-                "sort": "date"  
-            }
+            response_json = await naver_api_client.search_news(keyword, display=display, start=start, sort="date")
             
-            async with session.get(self.base_url, headers=self.headers, params=params) as response:
-                status = response.status
-                if status != 200:
-                    error_text = await response.text()
-                    logger.error(f"API 응답 오류: {status}, 응답: {error_text}")
-                    return {"items": []}
-                
-                response_json = await response.json()
-                
-                if 'total' in response_json:
-                    logger.info(f"키워드 '{keyword}' 총 검색 결과 수: {response_json['total']}")
-                
-                return response_json
+            if 'total' in response_json:
+                logger.info(f"키워드 '{keyword}' 총 검색 결과 수: {response_json['total']}")
+            
+            return response_json
         except Exception as e:
             logger.error(f"뉴스 검색 API 호출 중 오류 발생: {e}")
             logger.error(traceback.format_exc())
@@ -154,57 +141,142 @@ class NewsService:
             logger.warning(f"날짜 파싱 실패: {date_str}, 오늘 날짜 사용")
             return datetime.now().date()
     
+    def _match_site_pattern(self, news_url: str) -> Optional[Dict[str, str]]:
+        """URL 도메인에 해당하는 좋아요/댓글 선택자 패턴"""
+        for site_domain, pattern in self.news_site_patterns.items():
+            if site_domain in news_url:
+                return pattern
+        return None
+    
+    def _parse_count(self, soup: BeautifulSoup, selector: str) -> int:
+        elem = soup.select_one(selector)
+        if elem:
+            match = re.search(r'\d+', elem.get_text().strip())
+            if match:
+                return int(match.group())
+        return 0
+    
+    def _parse_engagement(self, soup: BeautifulSoup, news_url: str) -> Tuple[int, int]:
+        """파싱된 기사 HTML에서 좋아요 수와 댓글 수 추출"""
+        site_pattern = self._match_site_pattern(news_url)
+        if not site_pattern:
+            return 0, 0
+        
+        likes = self._parse_count(soup, site_pattern["likes_selector"])
+        comments = self._parse_count(soup, site_pattern["comments_selector"])
+        return likes, comments
+    
+    def _parse_image_url(self, soup: BeautifulSoup, news_url: str) -> Optional[str]:
+        """파싱된 기사 HTML에서 대표 이미지 URL 추출"""
+        og_image = soup.find('meta', property='og:image')
+        if og_image and og_image.get('content'):
+            return og_image['content']
+        
+        main_image = soup.select_one('article img, .news_content img, .article_body img, .news-article-image img')
+        if main_image and main_image.get('src'):
+            image_url = main_image['src']
+            if image_url.startswith('/'):
+                parsed_url = urlparse(news_url)
+                image_url = f"{parsed_url.scheme}://{parsed_url.netloc}" + image_url
+            return image_url
+        
+        return None
+    
+    async def _fetch_article_soup(self, session, news_url: str) -> Optional[BeautifulSoup]:
+        async with session.get(
+            news_url, 
+            headers=self.page_headers, 
+            timeout=aiohttp.ClientTimeout(total=5)
+        ) as response:
+            if response.status != 200:
+                logger.warning(f"뉴스 페이지 접근 실패: {response.status}")
+                return None
+            
+            html = await response.text()
+            return BeautifulSoup(html, 'html.parser')
+    
     async def extract_engagement_metrics(self, session, news_url: str) -> Tuple[int, int]:
         """뉴스 URL에서 좋아요 수와 댓글 수 추출 (비동기)"""
+        if not self._match_site_pattern(news_url):
+            return 0, 0
+        
         try:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml",
-                "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7"
-            }
-            
-            site_pattern = None
-            for site_domain, pattern in self.news_site_patterns.items():
-                if site_domain in news_url:
-                    site_pattern = pattern
-                    break
-            
-            if not site_pattern:
+            soup = await self._fetch_article_soup(session, news_url)
+            if soup is None:
                 return 0, 0
-                
-            async with session.get(
-                news_url, 
-                headers=headers, 
-                timeout=aiohttp.ClientTimeout(total=5)
-            ) as response:
-                if response.status != 200:
-                    return 0, 0
-                
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                likes = 0
-                likes_elem = soup.select_one(site_pattern["likes_selector"])
-                if likes_elem:
-                    likes_text = likes_elem.get_text().strip()
-                    likes_match = re.search(r'\d+', likes_text)
-                    if likes_match:
-                        likes = int(likes_match.group())
-                
-                comments = 0
-                comments_elem = soup.select_one(site_pattern["comments_selector"])
-                if comments_elem:
-                    comments_text = comments_elem.get_text().strip()
-                    comments_match = re.search(r'\d+', comments_text)
-                    if comments_match:
-                        comments = int(comments_match.group())
-                
-                return likes, comments
-                
+            return self._parse_engagement(soup, news_url)
         except Exception as e:
             logger.warning(f"좋아요/댓글 수 추출 실패: {e}")
             return 0, 0
     
+    async def extract_image_url(self, session, news_url: str) -> Optional[str]:
+        """뉴스 링크에서 대표 이미지 URL 추출 시도 (비동기)"""
+        try:
+            soup = await self._fetch_article_soup(session, news_url)
+            if soup is None:
+                return None
+            return self._parse_image_url(soup, news_url)
+        except Exception:
+            return None
+    
+    async def extract_article_metadata(self, session, news_url: str) -> Tuple[Optional[str], int, int]:
+        """
+        기사 페이지를 한 번만 받아서 대표 이미지와 좋아요/댓글 수를 함께 추출
+        
+        Returns:
+            Tuple[Optional[str], int, int]: (이미지 URL, 좋아요 수, 댓글 수)
+        """
+        try:
+            soup = await self._fetch_article_soup(session, news_url)
+        except UnicodeDecodeError as ude:
+            logger.warning(f"유니코드 디코딩 오류: {ude}, 링크: {news_url}")
+            return None, 0, 0
+        except Exception as e:
+            logger.warning(f"뉴스 페이지 요청 실패: {e}, 링크: {news_url}")
+            return None, 0, 0
+        
+        if soup is None:
+            return None, 0, 0
+        
+        try:
+            image_url = self._parse_image_url(soup, news_url)
+        except Exception:
+            image_url = None
+        
+        try:
+            likes, comments = self._parse_engagement(soup, news_url)
+        except Exception as e:
+            logger.warning(f"좋아요/댓글 수 추출 실패: {e}")
+            likes, comments = 0, 0
+        
+        return image_url, likes, comments
+    
+    def _collect_candidates(self, search_results: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """키워드별 검색 결과를 링크 기준으로 중복 제거 (먼저 나온 항목 유지)"""
+        candidates: Dict[str, Dict[str, Any]] = {}
+        
+        for news_data in search_results:
+            for item in news_data.get("items", []):
+                try:
+                    link = item.get("originallink") or item.get("link", "")
+                    if not link or link in candidates:
+                        continue
+                    
+                    title = self.clean_html_text(item.get("title", ""))
+                    description = self.clean_html_text(item.get("description", ""))
+                    
+                    candidates[link] = {
+                        "title": title,
+                        "link": link,
+                        "pub_date": self.parse_pub_date(item.get("pubDate", "")),
+                        "category": self.determine_category(title, description)
+                    }
+                except Exception as e:
+                    logger.error(f"뉴스 항목 처리 오류: {e}")
+                    logger.error(traceback.format_exc())
+        
+        return candidates
+    
     async def update_news(self):
         """최신 뉴스를 수집하고 데이터베이스에 저장 (비동기)"""
         from database.connector import database_instance as mariadb
@@ -219,151 +291,91 @@ class NewsService:
             all_news = []
             saved_count = 0
             skipped_count = 0
-            duplicate_count = 0
             no_image_count = 0
             
             current_time = datetime.now(datetime.now().astimezone().tzinfo)
             
-            async with aiohttp.ClientSession() as session:
-                for keyword in self.keywords:
-                    logger.info(f"키워드 '{keyword}'로 뉴스 검색 중...")
-                    news_data = await self.fetch_news(session, keyword, display=20) 
-                    
-                    for item in news_data.get("items", []):
-                        try:
-                            title = self.clean_html_text(item.get("title", ""))
-                            description = self.clean_html_text(item.get("description", ""))
-                            link = item.get("originallink") or item.get("link", "")
-                            pub_date = self.parse_pub_date(item.get("pubDate", ""))
-                                 
-                            existing_news = db.query(News).filter(News.link == link).first()
-                            if existing_news:
-                                duplicate_count += 1
-                                skipped_count += 1
-                                continue
-                            
-                            category = self.determine_category(title, description)
-                            
-                            try:
-                                image_url = await self.extract_image_url(session, link)
-                                
-                                if image_url is None:
-                                    image_url = "https://picsum.photos/200/300?random=1"
-                                    no_image_count += 1
-                                
-                                likes_count, comments_count = await self.extract_engagement_metrics(session, link)
-                                
-                                news = News(
-                                    title=title,
-                                    link=link,
-                                    pub_date=pub_date,
-                                    image_url=image_url,
-                                    category=category,
-                                    created_at=current_time,
-                                    updated_at=current_time,  
-                                    likes_count=likes_count,
-                                    comments_count=comments_count
-                                )
-                                
-                                try:
-                                    db.add(news)
-                                    db.flush()  
-                                    all_news.append(news)
-                                    saved_count += 1
-                                except Exception as e:
-                                    logger.error(f"뉴스 저장 실패: {e}, 뉴스: {title[:30]}...")
-                                    logger.error(traceback.format_exc())
-                                    skipped_count += 1
-                                    continue
-                                
-                            except UnicodeDecodeError as ude:
-                                logger.warning(f"유니코드 디코딩 오류: {ude}, 뉴스: {title[:30]}...")
-                                skipped_count += 1
-                                continue
-                            except Exception as e:
-                                logger.warning(f"뉴스 처리 중 오류: {e}, 뉴스: {title[:30]}...")
-                                logger.warning(traceback.format_exc())
-                                skipped_count += 1
-                                continue
-                                
-                        except Exception as e:
-                            logger.error(f"뉴스 항목 처리 오류: {e}")
-                            logger.error(traceback.format_exc())
-                            skipped_count += 1
-                            continue
-                    
-                    await asyncio.sleep(0.5)
+            # 1. 키워드 검색 동시 실행 (호출량은 naver_api_client의 토큰 버킷이 제한)
+            search_results = await asyncio.gather(*(self.fetch_news(keyword, display=20) for keyword in self.keywords))
+            fetched_count = sum(len(result.get("items", [])) for result in search_results)
+            
+            # 2. 링크 기준 메모리 중복 제거 후 DB 중복은 IN 쿼리 한 번으로 확인
+            candidates = self._collect_candidates(search_results)
+            existing_links = set()
+            if candidates:
+                existing_links = {
+                    link for (link,) in db.query(News.link).filter(News.link.in_(list(candidates.keys()))).all()
+                }
+            new_items = [item for link, item in candidates.items() if link not in existing_links]
+            duplicate_count = fetched_count - len(new_items)
+            skipped_count += duplicate_count
+            
+            logger.info(f"검색 결과 {fetched_count}개 중 신규 기사 {len(new_items)}개 (중복: {duplicate_count}개)")
+            
+            # 3. 기사 페이지는 한 번씩만, 동시 요청 수를 제한하여 수집
+            semaphore = asyncio.Semaphore(self.fetch_concurrency)
+            connector = aiohttp.TCPConnector(limit=self.fetch_concurrency)
+            
+            async with aiohttp.ClientSession(connector=connector) as session:
+                async def fetch_metadata(item: Dict[str, Any]):
+                    async with semaphore:
+                        return await self.extract_article_metadata(session, item["link"])
+                
+                metadata = await asyncio.gather(*(fetch_metadata(item) for item in new_items))
             
-            try:
-                if saved_count > 0:
+            news_rows = []
+            for item, (image_url, likes_count, comments_count) in zip(new_items, metadata):
+                if image_url is None:
+                    image_url = self.default_image_url
+                    no_image_count += 1
+                
+                news_rows.append(News(
+                    title=item["title"],
+                    link=item["link"],
+                    pub_date=item["pub_date"],
+                    image_url=image_url,
+                    category=item["category"],
+                    created_at=current_time,
+                    updated_at=current_time,  
+                    likes_count=likes_count,
+                    comments_count=comments_count
+                ))
+            
+            # 4. 배치 단위 저장 (실패한 배치만 건너뜀)
+            for i in range(0, len(news_rows), self.insert_batch_size):
+                batch = news_rows[i:i + self.insert_batch_size]
+                try:
+                    db.add_all(batch)
                     db.commit()
-                    logger.info(f"총 {saved_count}개의 새로운 뉴스 기사가 저장되었습니다.")
-                    logger.info(f"건너뛴 항목: {skipped_count}개 (중복: {duplicate_count}개, 이미지 없음: {no_image_count}개)")
-                else:
-                    logger.info("저장할 새로운 뉴스가 없습니다.")
-                    logger.info(f"건너뛴 항목: {skipped_count}개 (중복: {duplicate_count}개, 이미지 없음: {no_image_count}개)")
-            except Exception as e:
-                db.rollback()
-                logger.error(f"뉴스 저장 중 오류 발생: {e}")
-                logger.error(traceback.format_exc())
+                    all_news.extend(batch)
+                    saved_count += len(batch)
+                except Exception as e:
+                    db.rollback()
+                    logger.error(f"뉴스 배치 저장 실패 ({len(batch)}개): {e}")
+                    logger.error(traceback.format_exc())
+                    skipped_count += len(batch)
+            
+            if saved_count > 0:
+                news_query_service.invalidate()
+                logger.info(f"총 {saved_count}개의 새로운 뉴스 기사가 저장되었습니다.")
+            else:
+                logger.info("저장할 새로운 뉴스가 없습니다.")
+            logger.info(f"건너뛴 항목: {skipped_count}개 (중복: {duplicate_count}개, 이미지 없음: {no_image_count}개)")
             
             return all_news
             
         except Exception as e:
+            db.rollback()
             logger.error(f"뉴스 업데이트 중 오류 발생: {e}")
             logger.error(traceback.format_exc())
             return []
         finally:
             db.close()
-
-    async def extract_image_url(self, session, news_url: str) -> Optional[str]:
-        """뉴스 링크에서 대표 이미지 URL 추출 시도 (비동기)"""
-        try:
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-            }
-            
-            async with session.get(
-                news_url, 
-                headers=headers, 
-                timeout=aiohttp.ClientTimeout(total=5)  
-            ) as response:
-                if response.status != 200:
-                    logger.warning(f"뉴스 페이지 접근 실패: {response.status}")
-                    return None
-                try: 
-                    html = await response.text()
-                    
-                    soup = BeautifulSoup(html, 'html.parser')
-                    
-                    og_image = soup.find('meta', property='og:image')
-                    if og_image and og_image.get('content'):
-                        image_url = og_image['content']
-                        return image_url
-                    
-                    main_image = soup.select_one('article img, .news_content img, .article_body img, .news-article-image img')
-                    if main_image and main_image.get('src'):
-                        image_url = main_image['src']
-                        if image_url.startswith('/'):
-                            from urllib.parse import urlparse
-                            parsed_url = urlparse(news_url)
-                            base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
-                            image_url = base_url + image_url
-                        return image_url
-                except:
-                    pass
-
-        except Exception as e:
-            pass
     
+
     def get_recent_news(self, db: Session, category: Optional[str] = None, limit: int = 20) -> List[News]:
         """최근 뉴스 조회 (카테고리별 필터링 옵션)"""
-        query = db.query(News).order_by(News.pub_date.desc())
-        
-        if category and category != "전체":
-            query = query.filter(News.category == category)
-        
-        return query.limit(limit).all()
+        return news_query_service.fetch_rows(db, category, limit)
     
     def get_news_categories(self) -> List[str]:
         """뉴스 카테고리 목록 반환"""
@@ -376,27 +388,9 @@ class NewsService:
     async def update_engagement_metrics(self, db: Session, limit: int = 50):
         """기존 뉴스 기사의 좋아요 수와 댓글 수 업데이트"""
         try:
-            news_list = db.query(News).order_by(News.pub_date.desc()).limit(limit).all()
-            
-            update_count = 0
-            async with aiohttp.ClientSession() as session:
-                for news in news_list:
-                    try:
-                        likes, comments = await self.extract_engagement_metrics(session, news.link)
-                        
-                        if news.likes_count != likes or news.comments_count != comments:
-                            news.likes_count = likes
-                            news.comments_count = comments
-                            news.updated_at = datetime.now() 
-                            update_count += 1
-                            
-                        await asyncio.sleep(0.2)
-                    except Exception as e:
-                        logger.warning(f"지표 업데이트 중 오류 발생: {e}, 뉴스 ID: {news.news_id}")
-                        continue
+            update_count = await self.engagement_refresher.refresh(db, limit)
             
             if update_count > 0:
-                db.commit()
                 logger.info(f"{update_count}개 뉴스 기사의 지표가 업데이트되었습니다.")
             else:
                 logger.info("업데이트할 지표가 없습니다.")
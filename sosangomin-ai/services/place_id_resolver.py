@@ -0,0 +1,163 @@
+# services/place_id_resolver.py
+
+import os
+import re
+import logging
+import asyncio
+from datetime import datetime, timedelta
+from typing import Dict, Any, Optional, Callable, Awaitable, List
+from dotenv import load_dotenv
+from database.async_mongo_connector import async_mongo_instance
+
+logger = logging.getLogger(__name__)
+
+class PlaceIdResolver:
+    """
+    가게 이름+주소 → 네이버 place_id 해석 결과 저장소 (MongoDB PlaceIdResolutions 컬렉션)
+
+    검색 API 링크에 place_id가 없을 때만 브라우저 조회가 필요하므로, 그 결과를
+    정규화한 이름/주소 키로 저장해 재조회 시 브라우저를 띄우지 않는다.
+    검색을 마쳤지만 찾지 못한 경우(lookup_fn이 None 반환)만 짧은 TTL로 저장(네거티브 캐시)하고,
+    조회 중 예외가 발생한 경우는 저장하지 않는다. 브라우저 조회는
+    백그라운드 큐 워커가 순서대로 처리하며 같은 키의 동시 요청은 한 번만 조회한다.
+    """
+
+    def __init__(self):
+        load_dotenv("./config/.env")
+
+        self.positive_ttl = int(os.getenv("PLACE_ID_CACHE_TTL", 30 * 86400))
+        self.negative_ttl = int(os.getenv("PLACE_ID_NEGATIVE_TTL", 86400))
+        self.worker_count = int(os.getenv("PLACE_ID_RESOLVER_WORKERS", 1))
+        self.collection_name = "PlaceIdResolutions"
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._pending: Dict[str, asyncio.Future] = {}
+
+    def _collection(self):
+        return async_mongo_instance.get_collection(self.collection_name)
+
+    async def ensure_indexes(self):
+        """key 유니크 인덱스 생성 (애플리케이션 시작 시 호출)"""
+        try:
+            await self._collection().create_index("key", unique=True)
+        except Exception as e:
+            logger.warning(f"{self.collection_name} 인덱스 생성 실패: {e}")
+
+    @staticmethod
+    def normalize_key(store_name: str, address: Optional[str] = None) -> str:
+        """공백/특수문자를 제거하고 소문자로 만든 '이름|주소' 키"""
+        def normalize(value: Optional[str]) -> str:
+            return re.sub(r'[^0-9a-z가-힣]', '', (value or "").lower())
+
+        return f"{normalize(store_name)}|{normalize(address)}"
+
+    async def lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        """TTL 이내의 해석 결과 조회 (place_id가 None이면 네거티브 캐시)"""
+        try:
+            cached = await self._collection().find_one({"key": key})
+        except Exception as e:
+            logger.error(f"place_id 캐시 조회 중 오류: {e}")
+            return None
+
+        if not cached or not cached.get("updated_at"):
+            return None
+
+        ttl = self.positive_ttl if cached.get("place_id") else self.negative_ttl
+        if datetime.now() - cached["updated_at"] >= timedelta(seconds=ttl):
+            return None
+
+        return cached
+
+    async def save(self, key: str, store_name: str, address: Optional[str], place_id: Optional[str]):
+        """해석 결과 저장 (찾지 못한 경우 place_id=None)"""
+        try:
+            await self._collection().update_one(
+                {"key": key},
+                {"$set": {
+                    "key": key,
+                    "store_name": store_name,
+                    "address": address,
+                    "place_id": place_id,
+                    "updated_at": datetime.now()
+                }},
+                upsert=True
+            )
+        except Exception as e:
+            logger.error(f"place_id 캐시 저장 중 오류: {e}")
+
+    def _ensure_workers(self):
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+
+        self._workers = [task for task in self._workers if not task.done()]
+        while len(self._workers) < self.worker_count:
+            self._workers.append(asyncio.create_task(self._worker()))
+
+    async def _worker(self):
+        while True:
+            key, store_name, address, lookup_fn, future = await self._queue.get()
+            try:
+                place_id = await lookup_fn()
+                await self.save(key, store_name, address, place_id)
+                if not future.done():
+                    future.set_result(place_id)
+            except Exception as e:
+                # 조회 실패는 '찾지 못함'이 아니므로 저장하지 않고 다음 요청에서 다시 조회
+                logger.error(f"place_id 백그라운드 조회 중 오류 ({store_name}): {e}")
+                if not future.done():
+                    future.set_result(None)
+            finally:
+                self._pending.pop(key, None)
+                self._queue.task_done()
+
+    def enqueue(self, store_name: str, address: Optional[str],
+                lookup_fn: Callable[[], Awaitable[Optional[str]]]) -> asyncio.Future:
+        """
+        브라우저 조회를 백그라운드 큐에 등록 (같은 키가 이미 대기 중이면 그 Future 반환)
+
+        Args:
+            store_name: 검색 결과 가게 이름
+            address: 검색 결과 주소
+            lookup_fn: place_id를 조회하는 코루틴 함수 (예: Selenium 조회).
+                찾지 못하면 None을 반환하고, 조회 자체가 실패하면 예외를 발생시켜야 한다.
+
+        Returns:
+            asyncio.Future: 조회된 place_id (없으면 None)
+        """
+        key = self.normalize_key(store_name, address)
+
+        future = self._pending.get(key)
+        if future is not None:
+            return future
+
+        self._ensure_workers()
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        self._queue.put_nowait((key, store_name, address, lookup_fn, future))
+        return future
+
+    async def resolve(self, store_name: str, address: Optional[str],
+                      lookup_fn: Callable[[], Awaitable[Optional[str]]]) -> Optional[str]:
+        """
+        캐시 우선으로 place_id 해석 (캐시에 없을 때만 큐를 통해 브라우저 조회)
+
+        Returns:
+            Optional[str]: place_id (찾지 못했거나 네거티브 캐시면 None)
+        """
+        key = self.normalize_key(store_name, address)
+
+        cached = await self.lookup(key)
+        if cached is not None:
+            logger.info(f"place_id 캐시 사용: {store_name} → {cached.get('place_id')}")
+            return cached.get("place_id")
+
+        return await asyncio.shield(self.enqueue(store_name, address, lookup_fn))
+
+    async def close(self):
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+place_id_resolver = PlaceIdResolver()
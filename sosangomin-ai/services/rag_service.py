@@ -4,10 +4,12 @@ import os
 import logging
 import json
 import numpy as np
-from typing import List, Dict, Tuple, Any
+from typing import List, Dict, Tuple, Any, Optional
 from sentence_transformers import SentenceTransformer, CrossEncoder # type: ignore
 from dotenv import load_dotenv
 
+from services.lexical_retriever import BM25Retriever, reciprocal_rank_fusion
+
 logger = logging.getLogger(__name__)
 
 class RAGService:
@@ -16,6 +18,9 @@ class RAGService:
         """RAG 서비스 초기화"""
         load_dotenv("./config/.env")
         
+        # 어휘/밀집 검색 1위가 일치하고 코사인 유사도가 이 값 이상이면 cross-encoder 생략
+        self.rerank_skip_threshold = float(os.getenv("RAG_RERANK_SKIP_THRESHOLD", 0.85))
+        
         self.bi_encoder = SentenceTransformer('distiluse-base-multilingual-cased-v1')
         self.cross_encoder = CrossEncoder('cross-encoder/ms-marco-MiniLM-L-6-v2')
         
@@ -27,6 +32,10 @@ class RAGService:
             self.embeddings = self._create_embeddings()
             self._save_embeddings(embeddings_path)
         
+        self.lexical_retriever = BM25Retriever(
+            [f"{item['question']} {item.get('subcategory', '')}" for item in self.qa_data]
+        )
+        
         logger.info(f"RAG 서비스 초기화 완료: {len(self.qa_data)} 개의 QA 쌍 로드됨")
     
     def _load_data(self, data_path: str) -> List[Dict]:
@@ -78,21 +87,45 @@ class RAGService:
         except Exception as e:
             logger.error(f"임베딩 저장 중 오류: {str(e)}")
     
-    def retrieve(self, query: str, top_k_stage1: int = 10, top_k_stage2: int = 3) -> List[Dict]:
-        """2단계 검색 프로세스"""
+    def encode(self, texts):
+        """Bi-encoder 임베딩 (문자열 하나 또는 목록). 실패 시 None"""
+        try:
+            return self.bi_encoder.encode(texts, convert_to_tensor=False)
+        except Exception as e:
+            logger.error(f"임베딩 계산 중 오류: {str(e)}")
+            return None
+    
+    def retrieve(self, query: str, top_k_stage1: int = 10, top_k_stage2: int = 3,
+                 query_embedding: Optional[np.ndarray] = None) -> List[Dict]:
+        """
+        2단계 검색 프로세스 (BM25 + Bi-encoder 하이브리드 → Cross-encoder)
+        
+        query_embedding을 넘기면 같은 질문을 다시 인코딩하지 않음 (채팅에서 EDA 스니펫 선택과 공유)
+        """
         try:
             if not self.qa_data or not self.embeddings.size:
                 logger.warning("QA 데이터 또는 임베딩이 로드되지 않았습니다.")
                 return []
                 
-            # Stage 1: Bi-encoder
-            query_embedding = self.bi_encoder.encode(query, convert_to_tensor=False)
+            # Stage 1: Bi-encoder + BM25, Reciprocal Rank Fusion
+            if query_embedding is None:
+                query_embedding = self.bi_encoder.encode(query, convert_to_tensor=False)
             scores = np.dot(self.embeddings, query_embedding) / (
                 np.linalg.norm(self.embeddings, axis=1) * np.linalg.norm(query_embedding)
             )
             
-            top_k_indices = np.argsort(-scores)[:top_k_stage1]
-            stage1_candidates = [self.qa_data[idx] for idx in top_k_indices]
+            dense_ranking = [int(idx) for idx in np.argsort(-scores)[:top_k_stage1]]
+            lexical_ranking = [idx for idx, _ in self.lexical_retriever.search(query, top_k=top_k_stage1)]
+            
+            fused = reciprocal_rank_fusion([dense_ranking, lexical_ranking])[:top_k_stage1]
+            stage1_candidates = [dict(self.qa_data[idx], score=float(scores[idx])) for idx, _ in fused]
+            
+            # 두 검색기의 1위가 같고 밀집 유사도가 충분히 높으면 재정렬 생략
+            if (lexical_ranking and dense_ranking[0] == lexical_ranking[0]
+                    and scores[dense_ranking[0]] >= self.rerank_skip_threshold):
+                top_results = stage1_candidates[:top_k_stage2]
+                logger.info(f"쿼리 '{query}'에 대해 {len(top_results)}개의 답변 검색됨 (cross-encoder 생략)")
+                return top_results
             
             # Stage 2: Cross-encoder
             cross_inp = [[query, candidate['question']] for candidate in stage1_candidates]
@@ -0,0 +1,167 @@
+# services/report_input_assembler.py
+
+import os
+import copy
+import time
+import asyncio
+import logging
+from typing import Dict, Any, Optional, Tuple
+from dotenv import load_dotenv
+from database.async_mongo_connector import async_mongo_instance
+from services.analysis_artifact_store import analysis_artifact_store
+from services.store_service import simple_store_service as store_service
+from services.location_info_service import location_info_service
+
+logger = logging.getLogger(__name__)
+
+# 보고서 프롬프트에 쓰는 종합 분석 섹션
+COMBINED_REPORT_SECTIONS = [
+    "eda_result.result_data.basic_stats",
+    "eda_result.result_data.weekday_sales",
+    "eda_result.result_data.time_period_sales",
+    "eda_result.result_data.top_products",
+    "auto_analysis_results.predict",
+    "auto_analysis_results.cluster"
+]
+
+class ReportInputAssembler:
+    """
+    SWOT 보고서 입력 수집기
+
+    리뷰 분석, 종합 분석, 경쟁사 비교, 매장/행정동 정보를 asyncio.gather로 동시에 조회하고
+    입력별 소요 시간을 기록한다. 결과는 매장별로 짧게 캐싱하여
+    같은 보고서 세션(생성 재시도, 연속 요청) 동안 다시 조회하지 않는다.
+    호출부가 결과를 수정해도 캐시가 바뀌지 않도록 항상 복사본을 반환한다.
+    """
+
+    def __init__(self):
+        load_dotenv("./config/.env")
+
+        self.cache_ttl = int(os.getenv("REPORT_INPUT_CACHE_TTL", 300))
+        self._cache: Dict[int, Tuple[float, Dict[str, Any]]] = {}
+
+    async def _timed(self, timings: Dict[str, float], name: str, coro) -> Any:
+        started = time.perf_counter()
+        try:
+            return await coro
+        finally:
+            timings[name] = round(time.perf_counter() - started, 4)
+
+    async def _fetch_review_analysis(self, store_id: int) -> Optional[Dict[str, Any]]:
+        reviews_collection = async_mongo_instance.get_collection("StoreReviews")
+        return await reviews_collection.find_one({"store_id": store_id}, sort=[("created_at", -1)])
+
+    async def _fetch_combined_analysis(self, store_id: int) -> Optional[Dict[str, Any]]:
+        analysis_results = async_mongo_instance.get_collection("AnalysisResults")
+        combined_analysis = await analysis_results.find_one(
+            {"store_id": store_id, "analysis_type": "combined_analysis"},
+            sort=[("created_at", -1)]
+        )
+        if not combined_analysis:
+            return None
+        return await analysis_artifact_store.hydrate(combined_analysis, COMBINED_REPORT_SECTIONS)
+
+    async def _fetch_competitor_analysis(self, store_id: int) -> Optional[Dict[str, Any]]:
+        competitor_collection = async_mongo_instance.get_collection("CompetitorComparisons")
+        # 보고서는 단일 경쟁사 비교 형태(comparison_data.competitor)를 사용하므로 다중 비교 문서는 제외
+        return await competitor_collection.find_one(
+            {"store_id": store_id, "comparison_type": {"$ne": "multi"}},
+            sort=[("created_at", -1)]
+        )
+
+    async def _fetch_store_and_location(self, store_id: int, timings: Dict[str, float]) -> Tuple[Optional[Dict], Optional[Dict]]:
+        """매장 정보 조회 후 주소의 행정동 정보 조회 (행정동은 매장 주소에 의존)"""
+        store_info = None
+        location_info = None
+        try:
+            store_result = await self._timed(timings, "store_info", store_service.get_store(store_id))
+            if store_result.get("status") == "success":
+                store_info = store_result.get("store_info")
+
+            if store_info and "address" in store_info:
+                dong_name = location_info_service.extract_dong_from_address(store_info["address"])
+                if dong_name:
+                    location_result = await self._timed(timings, "location_info", location_info_service.get_dong_info(dong_name))
+                    if location_result.get("status") == "success":
+                        location_info = {
+                            "dong_name": dong_name,
+                            "data": location_result.get("data", {})
+                        }
+        except Exception as e:
+            logger.warning(f"매장 위치 정보를 가져오지 못했습니다 (ID: {store_id}): {str(e)}")
+
+        return store_info, location_info
+
+    async def assemble(self, store_id: int, use_cache: bool = True) -> Dict[str, Any]:
+        """
+        보고서 입력 수집
+
+        Args:
+            store_id: 매장 ID
+            use_cache: 캐시된 입력 사용 여부
+
+        Returns:
+            Dict: results, missing_analyses, status, store_info, timings(입력별 소요 시간, 초)
+        """
+        if use_cache:
+            cached = self._cache.get(store_id)
+            if cached and cached[0] > time.monotonic():
+                return copy.deepcopy(cached[1])
+
+        timings: Dict[str, float] = {}
+        started = time.perf_counter()
+
+        review_analysis, combined_analysis, competitor_analysis, (store_info, location_info) = await asyncio.gather(
+            self._timed(timings, "review_analysis", self._fetch_review_analysis(store_id)),
+            self._timed(timings, "combined_analysis", self._fetch_combined_analysis(store_id)),
+            self._timed(timings, "competitor_analysis", self._fetch_competitor_analysis(store_id)),
+            self._fetch_store_and_location(store_id, timings)
+        )
+        timings["total"] = round(time.perf_counter() - started, 4)
+
+        results = {}
+        missing_analyses = []
+
+        if review_analysis:
+            results["review_analysis"] = review_analysis
+        else:
+            missing_analyses.append("리뷰 분석")
+
+        if combined_analysis:
+            results["combined_analysis"] = combined_analysis
+            # 자동 분석 결과도 combined_analysis에서 가져옴
+            if "auto_analysis_results" in combined_analysis:
+                results["auto_analysis"] = {
+                    "results": combined_analysis["auto_analysis_results"],
+                    "summaries": combined_analysis.get("summaries", {})
+                }
+
+        if competitor_analysis:
+            results["competitor_analysis"] = competitor_analysis
+        else:
+            missing_analyses.append("경쟁사 비교 분석")
+
+        if location_info:
+            results["location_info"] = location_info
+
+        logger.info(f"보고서 입력 수집 완료 (store_id: {store_id}) 소요 시간: {timings}")
+
+        assembled = {
+            "results": results,
+            "missing_analyses": missing_analyses,
+            "status": "missing" if missing_analyses else "complete",
+            "store_info": store_info,
+            "timings": timings
+        }
+
+        # 누락된 분석이 있으면 사용자가 곧 분석을 추가할 수 있으므로 캐싱하지 않음
+        if not missing_analyses:
+            self._cache[store_id] = (time.monotonic() + self.cache_ttl, assembled)
+
+        return copy.deepcopy(assembled)
+
+    def invalidate(self, store_id: int):
+        """새 분석 결과 저장 후 해당 매장의 캐시 제거"""
+        self._cache.pop(store_id, None)
+
+report_input_assembler = ReportInputAssembler()
@@ -0,0 +1,67 @@
+# services/review_analysis_worker.py
+#
+# 프로세스 풀 워커에서도 import할 수 있도록 DB 연결 모듈에 의존하지 않는다.
+
+from typing import Dict, List, Any, Iterable, Optional, Tuple
+
+from services.lexicon_matcher import LexiconMatcher
+from services.review_tokenizer import ReviewTokenizer
+
+_worker_state: Optional[Dict[str, Any]] = None
+
+def analyze_review(review: Dict[str, Any], tokenizer: ReviewTokenizer,
+                   matcher: LexiconMatcher, stopwords: Iterable[str]) -> Dict[str, Any]:
+    """KoNLPy를 활용한 단일 리뷰 감성/키워드 분석"""
+    tokens = tokenizer.tokenize(review["text"])
+
+    sentiment_score = 0
+    matched_words = []
+
+    for word, pos in tokens.morphs:
+        if pos in ['Adjective', 'Verb', 'Noun']:
+            score, match_count = matcher.score(word)
+            if match_count:
+                sentiment_score += score
+                matched_words.append(word)
+
+    sentiment = "neutral"
+    if sentiment_score > 1:
+        sentiment = "positive"
+    elif sentiment_score < -0.5:
+        sentiment = "negative"
+
+    keywords = list(dict.fromkeys(tokens.content_nouns(stopwords)))[:5]
+
+    review_copy = review.copy()
+    review_copy["sentiment"] = sentiment
+    review_copy["sentiment_score"] = sentiment_score
+    review_copy["keywords"] = keywords
+    review_copy["matched_sentiment_words"] = list(set(matched_words))
+
+    return review_copy
+
+def init_worker(sentiment_dict: Dict[str, float], stopwords: List[str]):
+    """워커 프로세스 초기화 - 프로세스마다 Okt와 사전 오토마톤을 한 번만 생성"""
+    global _worker_state
+    _worker_state = {
+        "tokenizer": ReviewTokenizer(),
+        "matcher": LexiconMatcher(sentiment_dict),
+        "stopwords": frozenset(stopwords)
+    }
+
+def analyze_batch(batch: List[Dict[str, Any]]) -> List[Tuple[Dict[str, Any], List[Tuple[str, str]]]]:
+    """
+    워커 프로세스에서 리뷰 배치 분석
+
+    Returns:
+        List[Tuple]: (분석된 리뷰, 형태소 분석 결과). 부모 프로세스가 토크나이저 캐시에 등록하여
+        워드 클라우드/카테고리 분석에서 Okt를 다시 호출하지 않도록 한다.
+    """
+    tokenizer = _worker_state["tokenizer"]
+    return [
+        (
+            analyze_review(review, tokenizer, _worker_state["matcher"], _worker_state["stopwords"]),
+            tokenizer.tokenize(review["text"]).morphs
+        )
+        for review in batch
+    ]
@@ -0,0 +1,109 @@
+# services/review_cache.py
+
+import os
+import hashlib
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, List, Any, Optional
+from dotenv import load_dotenv
+from database.async_mongo_connector import async_mongo_instance
+from services.review_fetcher import review_fetcher
+
+logger = logging.getLogger(__name__)
+
+class PlaceReviewCache:
+    """
+    place_id별 분석 완료 리뷰 저장소 (MongoDB PlaceReviews 컬렉션)
+
+    리뷰 텍스트 해시로 이미 분석한 리뷰를 식별하여 감성/키워드 결과를 재사용하고,
+    TTL 이내의 결과는 크롤링 없이 그대로 반환한다.
+    재수집 시에는 이미 저장된 해시의 리뷰가 나온 페이지에서 수집을 멈춘다.
+    (리뷰 날짜는 연도 생략/누락이 있어 수집 기준으로 쓰지 않는다)
+    해시는 리뷰와 같은 순서의 review_hashes에만 저장하고 리뷰 레코드에는 넣지 않는다.
+    저장 범위는 최근 수집 창(기본: HTTP 수집 페이지 크기 x 최대 페이지 수)으로 제한하여
+    리뷰 수/감성 분포가 갱신할 때마다 누적되지 않고 최근 리뷰를 나타내도록 한다.
+    여러 매장이 같은 경쟁사를 조회해도 place_id 단위로 공유된다.
+    """
+
+    def __init__(self):
+        load_dotenv("./config/.env")
+
+        self.ttl_seconds = int(os.getenv("PLACE_REVIEW_TTL", 21600))
+        self.max_reviews = int(os.getenv("PLACE_REVIEW_MAX", review_fetcher.page_size * review_fetcher.max_pages))
+        self.collection_name = "PlaceReviews"
+
+    def _collection(self):
+        return async_mongo_instance.get_collection(self.collection_name)
+
+    async def ensure_indexes(self):
+        """place_id 유니크 인덱스 생성 (애플리케이션 시작 시 호출)"""
+        try:
+            await self._collection().create_index("place_id", unique=True)
+        except Exception as e:
+            logger.warning(f"{self.collection_name} 인덱스 생성 실패: {e}")
+
+    @staticmethod
+    def review_hash(review: Dict[str, Any]) -> str:
+        """공백을 정규화한 리뷰 텍스트의 해시"""
+        text = " ".join(review.get("text", "").split())
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+    async def get(self, place_id: str) -> Optional[Dict[str, Any]]:
+        """place_id의 캐시 문서 조회"""
+        try:
+            return await self._collection().find_one({"place_id": place_id})
+        except Exception as e:
+            logger.error(f"리뷰 캐시 조회 중 오류: {e}")
+            return None
+
+    def cached_reviews(self, cached: Optional[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """캐시 문서의 리뷰를 해시 -> 리뷰(최신순) dict로 변환"""
+        reviews = (cached or {}).get("reviews") or []
+        hashes = (cached or {}).get("review_hashes") or []
+        if len(hashes) != len(reviews):
+            hashes = [self.review_hash(review) for review in reviews]
+
+        # 이전 형식 문서는 리뷰 레코드에 hash 필드가 들어 있으므로 제거
+        return {h: {k: v for k, v in review.items() if k != "hash"} for h, review in zip(hashes, reviews)}
+
+    def is_fresh(self, cached: Optional[Dict[str, Any]]) -> bool:
+        """TTL 이내에 갱신된 캐시인지 확인"""
+        if not cached or not cached.get("updated_at"):
+            return False
+        return datetime.now() - cached["updated_at"] < timedelta(seconds=self.ttl_seconds)
+
+    async def save(self, place_id: str, reviews: Dict[str, Dict[str, Any]], fetched_count: int = 0) -> List[Dict[str, Any]]:
+        """
+        분석된 리뷰 저장 (최신순 max_reviews개 유지)
+
+        Args:
+            place_id: 네이버 플레이스 ID
+            reviews: 리뷰 해시 -> 분석 완료 리뷰 (최신순)
+            fetched_count: 이번에 수집된 리뷰 수 (수집 창보다 많이 수집된 경우 모두 유지)
+
+        Returns:
+            List[Dict]: 저장된 리뷰 목록
+        """
+        hashes = list(reviews)[:max(self.max_reviews, fetched_count)]
+        saved = [reviews[h] for h in hashes]
+
+        try:
+            await self._collection().update_one(
+                {"place_id": place_id},
+                {
+                    "$set": {
+                        "place_id": place_id,
+                        "reviews": saved,
+                        "review_hashes": hashes,
+                        "updated_at": datetime.now()
+                    },
+                    "$unset": {"last_seen_date": ""}
+                },
+                upsert=True
+            )
+        except Exception as e:
+            logger.error(f"리뷰 캐시 저장 중 오류: {e}")
+
+        return saved
+
+place_review_cache = PlaceReviewCache()
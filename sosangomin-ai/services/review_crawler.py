@@ -0,0 +1,278 @@
+# services/review_crawler.py
+
+import re
+import time
+import logging
+import threading
+from typing import Dict, List, Any, Optional, Tuple
+from bs4 import BeautifulSoup
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
+
+logger = logging.getLogger(__name__)
+
+# 마지막 DOM 변경 시각과 로드된 리소스 수를 반환 (MutationObserver는 최초 호출 시 설치)
+DOM_ACTIVITY_SCRIPT = """
+if (!window.__crawlerObserver) {
+    window.__crawlerLastMutation = performance.now();
+    window.__crawlerObserver = new MutationObserver(function() {
+        window.__crawlerLastMutation = performance.now();
+    });
+    window.__crawlerObserver.observe(document, {childList: true, subtree: true});
+}
+return [performance.now() - window.__crawlerLastMutation,
+        performance.getEntriesByType('resource').length];
+"""
+
+class NaverReviewCrawler:
+    """
+    네이버 플레이스 리뷰 크롤링 엔진 (블로킹, 스레드 실행기에서 호출)
+
+    - 사이트별로 리뷰를 충분히(min_learn_reviews개 이상) 추출한 선택자를 기억해 다음 크롤링의 대기 조건으로 먼저 시도
+      (리뷰 추출은 항상 고정 우선순위로 수행하여 잘못 학습된 컨테이너 선택자가 파싱을 오염시키지 않도록 함)
+    - 고정 sleep 대신 DOM 변경/네트워크 유휴 상태를 기다림
+    - 단계별(navigate/locate/expand/parse) 소요 시간 기록
+    """
+
+    SITE = "naver_place"
+
+    REVIEW_SELECTORS = [
+        "div.pui__vn15t2",
+        "div.place_review",
+        "div.YeUwq",
+        "div.place_section_content",
+        "ul.PVzvR > li",
+        "ul.WoYpd > li",
+        "div.ZZ4OK > div",
+        "li.xg2_q",
+        "div._1kUrA",
+        "div._3uEkn",
+        "div.LHv0Z",
+        "div.eCPGL",
+        "li.place_apply_pui",
+        "div.EjjAW",
+        "a[data-pui-click-code='rvshowmore']",
+        "#app-root > div > div > div > div:nth-child(6) > div:nth-child(3) > div.place_section.k1QQ5 > div.place_section_content",
+        "div.place_section.k1QQ5 > div.place_section_content"
+    ]
+
+    MORE_BUTTON_SELECTORS = [
+        "a.fvwqf",
+        "button.fvwqf",
+        "a.place_reviewMore",
+        "button.place_reviewMore",
+        "a[role='button']",
+        "button.moreBtn"
+    ]
+
+    def __init__(self, page_timeout: float = 15, settle_timeout: float = 5,
+                 quiet_ms: float = 500, max_more_clicks: int = 5, min_learn_reviews: int = 3):
+        self.page_timeout = page_timeout
+        self.settle_timeout = settle_timeout
+        self.quiet_ms = quiet_ms
+        self.max_more_clicks = max_more_clicks
+        self.min_learn_reviews = min_learn_reviews
+
+        self._learned_selectors: Dict[str, Dict[str, str]] = {}
+        self._lock = threading.Lock()
+
+    def _ordered(self, kind: str, candidates: List[str]) -> List[str]:
+        """학습된 선택자를 맨 앞으로 정렬"""
+        with self._lock:
+            learned = self._learned_selectors.get(self.SITE, {}).get(kind)
+        if learned in candidates:
+            return [learned] + [c for c in candidates if c != learned]
+        return list(candidates)
+
+    def _learn(self, kind: str, selector: str):
+        with self._lock:
+            site_cache = self._learned_selectors.setdefault(self.SITE, {})
+            if site_cache.get(kind) != selector:
+                logger.info(f"[{self.SITE}] {kind} 선택자 학습: {selector}")
+                site_cache[kind] = selector
+
+    def _find_first(self, driver, selectors: List[str]) -> Optional[Tuple[str, list]]:
+        """선택자 목록 중 처음으로 요소가 존재하는 선택자와 요소 반환"""
+        for selector in selectors:
+            elements = driver.find_elements(By.CSS_SELECTOR, selector)
+            if elements:
+                return selector, elements
+        return None
+
+    def _wait_for_settle(self, driver, condition=None) -> bool:
+        """
+        condition이 충족되거나 DOM 변경과 리소스 로딩이 quiet_ms 동안 멈출 때까지 대기
+
+        Returns:
+            bool: condition 충족 여부 (condition이 없으면 유휴 상태 도달 여부)
+        """
+        state = {"resources": None, "met": False}
+
+        def settled(d):
+            if condition and condition(d):
+                state["met"] = True
+                return True
+            idle_ms, resources = d.execute_script(DOM_ACTIVITY_SCRIPT)
+            network_idle = resources == state["resources"]
+            state["resources"] = resources
+            return idle_ms >= self.quiet_ms and network_idle
+
+        try:
+            WebDriverWait(driver, self.settle_timeout, poll_frequency=0.1).until(settled)
+            return state["met"] or condition is None
+        except TimeoutException:
+            return False
+
+    def _locate_reviews(self, driver) -> Optional[str]:
+        """
+        iframe 진입 후 리뷰 영역이 나타날 때까지 대기 (모든 선택자를 한 번에 폴링)
+
+        학습된 리뷰 선택자를 먼저 확인하지만, 여기서 찾은 선택자는 학습하지 않는다.
+        (로딩 중에는 리뷰 목록 대신 일반 컨테이너가 먼저 잡힐 수 있음)
+        """
+        review_selectors = self._ordered("review", self.REVIEW_SELECTORS)
+        found = {}
+
+        def ready(d):
+            iframes = d.find_elements(By.CSS_SELECTOR, "iframe#entryIframe")
+            if iframes:
+                d.switch_to.frame(iframes[0])
+            match = self._find_first(d, review_selectors)
+            if match:
+                found["selector"] = match[0]
+                return True
+            if iframes:
+                d.switch_to.default_content()
+            return False
+
+        try:
+            WebDriverWait(driver, self.page_timeout, poll_frequency=0.2).until(ready)
+        except TimeoutException:
+            logger.error("리뷰 요소를 찾을 수 없습니다. 페이지 구조가 변경되었을 수 있습니다.")
+            return None
+
+        return found["selector"]
+
+    def _expand_reviews(self, driver, review_selector: str) -> int:
+        """더보기 버튼을 눌러 리뷰를 추가 로드, 클릭 횟수 반환"""
+        clicks = 0
+
+        for i in range(self.max_more_clicks):
+            match = self._find_first(driver, self._ordered("more_button", self.MORE_BUTTON_SELECTORS))
+            if not match:
+                logger.info("더보기 버튼을 찾을 수 없습니다")
+                break
+
+            selector, buttons = match
+            before = len(driver.find_elements(By.CSS_SELECTOR, review_selector))
+            try:
+                buttons[0].click()
+            except Exception as e:
+                logger.info(f"더 이상 리뷰를 로드할 수 없습니다: {e}")
+                break
+
+            self._learn("more_button", selector)
+            clicks += 1
+            logger.info(f"더보기 버튼 클릭 {i+1}회 성공")
+
+            grew = self._wait_for_settle(
+                driver,
+                lambda d: len(d.find_elements(By.CSS_SELECTOR, review_selector)) > before
+            )
+            if not grew:
+                logger.info("더보기 클릭 후 리뷰가 늘어나지 않아 중단합니다")
+                break
+
+        return clicks
+
+    def _parse_reviews(self, page_source: str) -> List[Dict[str, Any]]:
+        """
+        페이지 소스에서 고정 우선순위의 선택자로 리뷰 추출
+
+        리뷰가 min_learn_reviews개 이상 나온 선택자만 학습한다.
+        """
+        reviews = []
+        soup = BeautifulSoup(page_source, 'html.parser')
+
+        for selector in self.REVIEW_SELECTORS:
+            review_elements = soup.select(selector)
+            logger.info(f"{selector} 선택자로 {len(review_elements)}개 리뷰 찾음")
+            if not review_elements:
+                continue
+
+            for element in review_elements:
+                try:
+                    reviews.append(self.build_review(element.get_text()))
+                except Exception as e:
+                    logger.warning(f"리뷰 파싱 중 오류: {e}")
+                    continue
+
+            if len(reviews) >= self.min_learn_reviews:
+                self._learn("review", selector)
+            break
+
+        return reviews
+
+    @staticmethod
+    def build_review(raw_text: str) -> Dict[str, Any]:
+        """리뷰 텍스트에서 평점/날짜를 추출하여 리뷰 레코드 생성"""
+        review_text = re.sub(r'\s+', ' ', raw_text.strip())
+
+        rating = 0
+        rating_match = re.search(r'평점\s*(\d+(\.\d+)?)', review_text)
+        if rating_match:
+            try:
+                rating = float(rating_match.group(1))
+            except ValueError:
+                rating = 0
+
+        date = "알 수 없음"
+        date_match = re.search(r'(\d{4}-\d{2}-\d{2}|\d{4}\.\d{2}\.\d{2})', review_text)
+        if date_match:
+            date = date_match.group(1)
+
+        return {
+            "text": review_text,
+            "rating": rating,
+            "date": date,
+            "sentiment": None,
+            "keywords": []
+        }
+
+    def crawl(self, driver, review_url: str) -> Tuple[List[Dict[str, Any]], Dict[str, float]]:
+        """
+        리뷰 페이지 크롤링 (블로킹)
+
+        Args:
+            driver: 풀에서 대여한 WebDriver
+            review_url: 네이버 플레이스 리뷰 URL
+
+        Returns:
+            Tuple: (리뷰 목록, 단계별 소요 시간(초))
+        """
+        timings: Dict[str, float] = {}
+        reviews: List[Dict[str, Any]] = []
+
+        started = time.perf_counter()
+        driver.get(review_url)
+        timings["navigate"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        review_selector = self._locate_reviews(driver)
+        timings["locate"] = time.perf_counter() - started
+
+        if review_selector:
+            started = time.perf_counter()
+            self._expand_reviews(driver, review_selector)
+            timings["expand"] = time.perf_counter() - started
+
+            started = time.perf_counter()
+            reviews = self._parse_reviews(driver.page_source)
+            timings["parse"] = time.perf_counter() - started
+
+        timings["total"] = sum(timings.values())
+        return reviews, timings
+
+review_crawler = NaverReviewCrawler()
@@ -0,0 +1,182 @@
+# services/review_fetcher.py
+
+import os
+import re
+import logging
+import asyncio
+import aiohttp
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Callable, Tuple
+from dotenv import load_dotenv
+
+logger = logging.getLogger(__name__)
+
+VISITOR_REVIEWS_QUERY = """
+query getVisitorReviews($input: VisitorReviewsInput) {
+  visitorReviews(input: $input) {
+    items { id rating body visited created }
+    total
+  }
+}
+"""
+
+class NaverReviewFetcher:
+    """
+    브라우저 없이 네이버 플레이스 방문자 리뷰 데이터를 직접 요청하는 HTTP 수집기
+
+    플레이스 페이지가 내부적으로 호출하는 GraphQL API를 페이지 단위로 요청하고
+    JSON 응답을 fetch_reviews_with_selenium과 동일한 리뷰 형식으로 변환한다.
+    엔드포인트는 NAVER_PLACE_GRAPHQL_URL로 변경할 수 있다. (스텁 서버 등)
+    업종(businessType)은 요청별로 지정하며, 기본값은 NAVER_PLACE_BUSINESS_TYPE이다.
+    """
+
+    def __init__(self):
+        load_dotenv("./config/.env")
+
+        self.graphql_url = os.getenv("NAVER_PLACE_GRAPHQL_URL", "https://api.place.naver.com/graphql")
+        self.page_size = int(os.getenv("NAVER_REVIEW_PAGE_SIZE", 20))
+        self.max_pages = int(os.getenv("NAVER_REVIEW_MAX_PAGES", 3))
+        self.business_type = os.getenv("NAVER_PLACE_BUSINESS_TYPE", "restaurant")
+        self.timeout = aiohttp.ClientTimeout(total=10)
+        self.user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(timeout=self.timeout)
+        return self._session
+
+    def _build_payload(self, place_id: str, page: int, business_type: str) -> List[Dict[str, Any]]:
+        return [{
+            "operationName": "getVisitorReviews",
+            "variables": {
+                "input": {
+                    "businessId": place_id,
+                    "businessType": business_type,
+                    "item": "0",
+                    "page": page,
+                    "size": self.page_size,
+                    "isPhotoUsed": False,
+                    "includeContent": True
+                },
+                "id": place_id
+            },
+            "query": VISITOR_REVIEWS_QUERY
+        }]
+
+    def _build_headers(self, place_id: str, business_type: str) -> Dict[str, str]:
+        return {
+            "User-Agent": self.user_agent,
+            "Content-Type": "application/json",
+            "Referer": f"https://m.place.naver.com/{business_type}/{place_id}/review/visitor"
+        }
+
+    @staticmethod
+    def normalize_date(raw: Optional[str], today: Optional[datetime] = None) -> str:
+        """
+        '24.3.15.금' 또는 '3.15.금' 형식의 날짜를 'YYYY.MM.DD'로 변환
+
+        연도가 생략된 날짜는 올해로 보되, 미래 날짜가 되면 작년으로 본다.
+        """
+        if not raw:
+            return "알 수 없음"
+
+        numbers = re.findall(r'\d+', raw)
+        today = today or datetime.now()
+
+        try:
+            if len(numbers) >= 3:
+                year, month, day = int(numbers[0]), int(numbers[1]), int(numbers[2])
+                if year < 100:
+                    year += 2000
+            elif len(numbers) == 2:
+                month, day = int(numbers[0]), int(numbers[1])
+                year = today.year if (month, day) <= (today.month, today.day) else today.year - 1
+            else:
+                return "알 수 없음"
+
+            return datetime(year, month, day).strftime("%Y.%m.%d")
+        except ValueError:
+            return "알 수 없음"
+
+    @staticmethod
+    def _page_items(payload: Any) -> List[Dict[str, Any]]:
+        if isinstance(payload, list):
+            payload = payload[0] if payload else {}
+
+        visitor_reviews = ((payload or {}).get("data") or {}).get("visitorReviews") or {}
+        return visitor_reviews.get("items") or []
+
+    def parse_page(self, payload: Any) -> List[Dict[str, Any]]:
+        """GraphQL 응답 JSON을 리뷰 레코드 목록으로 변환 (본문이 없는 리뷰는 제외)"""
+        reviews = []
+
+        for item in self._page_items(payload):
+            body = re.sub(r'\s+', ' ', (item.get("body") or "")).strip()
+            if not body:
+                continue
+
+            reviews.append({
+                "text": body,
+                "rating": float(item.get("rating") or 0),
+                "date": self.normalize_date(item.get("visited") or item.get("created")),
+                "sentiment": None,
+                "keywords": []
+            })
+
+        return reviews
+
+    async def _fetch_page(self, place_id: str, page: int, business_type: str) -> Tuple[List[Dict[str, Any]], int]:
+        """한 페이지 요청 (변환된 리뷰, 본문 없는 리뷰를 포함한 응답 항목 수)"""
+        session = self._get_session()
+        async with session.post(
+            self.graphql_url,
+            json=self._build_payload(place_id, page, business_type),
+            headers=self._build_headers(place_id, business_type)
+        ) as response:
+            if response.status != 200:
+                logger.warning(f"리뷰 API 응답 오류 (place_id={place_id}, page={page}): {response.status}")
+                return [], 0
+            payload = await response.json(content_type=None)
+            return self.parse_page(payload), len(self._page_items(payload))
+
+    async def fetch(self, place_id: str, max_pages: Optional[int] = None,
+                    stop_when: Optional[Callable[[Dict[str, Any]], bool]] = None,
+                    business_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        리뷰 목록을 최신순 페이지 순서대로 수집 (빈 페이지 또는 페이지 크기 미만이면 중단)
+
+        Args:
+            place_id: 네이버 플레이스 ID
+            max_pages: 최대 페이지 수 (기본값 NAVER_REVIEW_MAX_PAGES)
+            stop_when: 리뷰가 조건을 만족하면 그 페이지까지만 수집 (예: 이미 본 리뷰)
+            business_type: 플레이스 업종 (예: restaurant, cafe, hairshop. 기본값 NAVER_PLACE_BUSINESS_TYPE)
+
+        Returns:
+            List[Dict]: fetch_reviews_with_selenium과 같은 형식의 리뷰 목록
+        """
+        reviews: List[Dict[str, Any]] = []
+
+        try:
+            for page in range(1, (max_pages or self.max_pages) + 1):
+                page_reviews, item_count = await self._fetch_page(place_id, page, business_type or self.business_type)
+                reviews.extend(page_reviews)
+
+                if item_count < self.page_size:
+                    break
+                if stop_when and any(stop_when(review) for review in page_reviews):
+                    break
+
+            logger.info(f"HTTP로 {len(reviews)}개의 리뷰를 수집했습니다. (place_id={place_id})")
+            return reviews
+
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            logger.warning(f"HTTP 리뷰 수집 중 오류 (place_id={place_id}): {e}")
+            return reviews
+
+    async def close(self):
+        if self._session and not self._session.closed:
+            await self._session.close()
+
+review_fetcher = NaverReviewFetcher()
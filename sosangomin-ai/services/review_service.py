@@ -1,30 +1,25 @@
 import os
 import logging
 import asyncio
-from bs4 import BeautifulSoup
-import re
 import json
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 from dotenv import load_dotenv
-from database.mongo_connector import mongo_instance
+from database.async_mongo_connector import async_mongo_instance
+from services.webdriver_pool import webdriver_pool
+from services.review_crawler import review_crawler
+from services.review_fetcher import review_fetcher
+from services.review_cache import place_review_cache
+from services.lexicon_matcher import LexiconMatcher
+from services.review_tokenizer import ReviewTokenizer
+from services.review_analysis_worker import analyze_review, analyze_batch, init_worker
+from services.report_input_assembler import report_input_assembler
 from bson import ObjectId
-import time
 from konlpy.tag import Okt  # type: ignore
 import pandas as pd  
 from collections import Counter  
 import concurrent.futures  
-
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
-from selenium.webdriver.chrome.service import Service
-import tempfile
-import shutil
-import uuid
+import multiprocessing
 
 logger = logging.getLogger(__name__)
 
@@ -45,12 +40,22 @@ class ReviewService:
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         }
         self.review_base_url = "https://map.naver.com/p/entry/place/{place_id}?c=15.00,0,0,0,dh&placePath=/review"
+        self.use_http_fetch = os.getenv("REVIEW_HTTP_FETCH", "true").lower() == "true"
         
         self.okt = Okt()
+        self.tokenizer = ReviewTokenizer(self.okt)
         
         self.sentiment_dict = self._load_sentiment_dict()
+        self.sentiment_matcher = LexiconMatcher(self.sentiment_dict)
         
         self.stopwords = self._load_stopwords()
+        self.stopword_set = frozenset(self.stopwords)
+        
+        # 기본값 0(프로세스 내 분석): 워커마다 인터프리터와 JVM을 새로 띄우고 배치마다 직렬화 비용이 들어
+        # 단일 코어에서는 이득이 없음. 멀티 코어 호스트에서 벤치마크(--workers 1,2,4,N)로 확인 후 설정
+        self.analysis_workers = int(os.getenv("REVIEW_ANALYSIS_WORKERS", 0))
+        self.analysis_batch_size = int(os.getenv("REVIEW_ANALYSIS_BATCH_SIZE", 10))
+        self._analysis_pool = None
     
     def _load_sentiment_dict(self) -> Dict[str, float]:
         """확장된 감성 사전 로드"""
@@ -123,162 +128,78 @@ class ReviewService:
         ]
         return stopwords
     
+    async def fetch_reviews(self, place_id: str, stop_when=None, business_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """HTTP 수집을 우선 시도하고, 실패하거나 결과가 없으면 Selenium 크롤링으로 대체"""
+        if self.use_http_fetch:
+            reviews = await review_fetcher.fetch(place_id, stop_when=stop_when, business_type=business_type)
+            if reviews:
+                return reviews
+            logger.info(f"HTTP 리뷰 수집 결과가 없어 Selenium으로 대체합니다. (place_id={place_id})")
+        
+        return await self.fetch_reviews_with_selenium(place_id)
+    
+    async def get_analyzed_reviews(self, place_id: str, force_refresh: bool = False) -> List[Dict[str, Any]]:
+        """
+        place_id의 분석된 리뷰 조회 (PlaceReviews 캐시 활용)
+        
+        TTL 이내의 캐시는 그대로 반환하고, 그 외에는 새 리뷰만 수집/분석하여
+        이미 분석한 리뷰의 감성/키워드 결과와 병합한다. 병합 결과는 최근 수집 창
+        (PLACE_REVIEW_MAX) 크기로 자른다.
+        
+        Args:
+            place_id: 네이버 플레이스 ID
+            force_refresh: True면 TTL과 무관하게 새 리뷰 확인
+            
+        Returns:
+            List[Dict]: 최신순 분석 완료 리뷰 (캐시 실패 시에도 분석 결과 반환)
+        """
+        cached = await place_review_cache.get(place_id)
+        cached_reviews = place_review_cache.cached_reviews(cached)
+        if not force_refresh and place_review_cache.is_fresh(cached):
+            logger.info(f"캐시된 리뷰 분석 결과 사용 (place_id={place_id})")
+            return list(cached_reviews.values())[:place_review_cache.max_reviews]
+        
+        # 이미 분석한 리뷰가 나온 페이지까지만 수집 (해시 기준)
+        fetched = await self.fetch_reviews(
+            place_id,
+            stop_when=lambda review: place_review_cache.review_hash(review) in cached_reviews
+        )
+        if not fetched:
+            return list(cached_reviews.values())[:place_review_cache.max_reviews]
+        
+        fetched_by_hash = {}
+        for review in fetched:
+            fetched_by_hash.setdefault(place_review_cache.review_hash(review), review)
+        
+        new_hashes = [h for h in fetched_by_hash if h not in cached_reviews]
+        analyzed_new = dict(zip(
+            new_hashes,
+            await self.analyze_sentiment([fetched_by_hash[h] for h in new_hashes])
+        ))
+        logger.info(f"새 리뷰 {len(analyzed_new)}개 분석, 캐시 리뷰 {len(cached_reviews)}개 재사용 (place_id={place_id})")
+        
+        # 이번에 수집된 순서(최신순)를 따르고, 수집 범위 밖의 기존 리뷰는 뒤에 유지
+        merged = {h: analyzed_new.get(h) or cached_reviews[h] for h in fetched_by_hash}
+        for h, review in cached_reviews.items():
+            merged.setdefault(h, review)
+        
+        return await place_review_cache.save(place_id, merged, len(fetched_by_hash))
+    
     async def fetch_reviews_with_selenium(self, place_id: str) -> List[Dict[str, Any]]:
-        reviews = []
-        driver = None
+        """WebDriver 풀에서 브라우저를 대여해 스레드 실행기에서 리뷰 크롤링"""
+        pooled = None
 
         try:
-            chrome_options = Options()
-            chrome_options.add_argument("--headless")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
-            chrome_options.add_argument(f"user-agent={self.headers['User-Agent']}")
-            chrome_options.add_argument("--incognito")
-
-            webdriver_path = os.getenv('CHROME_WEBDRIVER_PATH', '/usr/local/bin/chromedriver')
-            logger.info(f"Using Chrome WebDriver at: {webdriver_path}")
-
-            service = Service()
-            driver = webdriver.Chrome(service=service, options=chrome_options)
+            pooled = await webdriver_pool.acquire()
 
             review_url = self.review_base_url.format(place_id=place_id)
-            driver.get(review_url)
-            
-            wait = WebDriverWait(driver, 15)
-            
-            try:
-                iframe = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "iframe#entryIframe")))
-                driver.switch_to.frame(iframe)
-            except TimeoutException:
-                logger.info("iframe이 없거나 접근할 수 없습니다. 메인 페이지에서 계속합니다.")
-            
-            try:
-                selectors = [
-                    "div.pui__vn15t2", 
-                    "div.place_review", 
-                    "div.YeUwq",
-                    "div.place_section_content",
-                    "ul.PVzvR > li",  
-                    "ul.WoYpd > li",  
-                    "div.ZZ4OK > div",  
-                    "li.xg2_q",       
-                    "div._1kUrA",     
-                    "div._3uEkn",     
-                    "div.LHv0Z",      
-                    "div.eCPGL",
-                    "li.place_apply_pui",      
-                    "div.EjjAW",                
-                    "a[data-pui-click-code='rvshowmore']",
-                    "#app-root > div > div > div > div:nth-child(6) > div:nth-child(3) > div.place_section.k1QQ5 > div.place_section_content",
-                    "div.place_section.k1QQ5 > div.place_section_content"
-                ]
-                xpath_selectors = [
-                    "//div[@class='place_section_content']",
-                    "//*[@id='app-root']/div/div/div/div[6]/div[3]/div[contains(@class,'place_section')]/div[contains(@class,'place_section_content')]"
-                ]
-                                
-                for selector in selectors:
-                    try:
-                        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
-                        break
-                    except TimeoutException:
-                        continue
-                
-                try:
-                    for i in range(5):
-                        try:
-                            more_button_selectors = [
-                                "a.fvwqf", 
-                                "button.fvwqf", 
-                                "a.place_reviewMore", 
-                                "button.place_reviewMore",
-                                "a[role='button']",
-                                "button.moreBtn"
-                            ]
-                            
-                            more_button = None
-                            for btn_selector in more_button_selectors:
-                                try:
-                                    more_button = WebDriverWait(driver, 2).until(
-                                        EC.element_to_be_clickable((By.CSS_SELECTOR, btn_selector))
-                                    )
-                                    break
-                                except:
-                                    continue
-                            
-                            if more_button:
-                                more_button.click()
-                                logger.info(f"더보기 버튼 클릭 {i+1}회 성공")
-                                time.sleep(2)
-                            else:
-                                logger.info("더보기 버튼을 찾을 수 없습니다")
-                                break
-                        except Exception as e:
-                            logger.info(f"더 이상 리뷰를 로드할 수 없습니다: {e}")
-                            break
-                except Exception as e:
-                    logger.info(f"추가 리뷰 로드 시도 중 오류: {e}")
-                
-                page_source = driver.page_source
-                
-                soup = BeautifulSoup(page_source, 'html.parser')
-                
-                all_div_classes = set()
-                for div in soup.select('div[class]'):
-                    all_div_classes.update(div.get('class', []))
-                
-                for selector in selectors:
-                    review_elements = soup.select(selector)
-                    logger.info(f"{selector} 선택자로 {len(review_elements)}개 리뷰 찾음")
-                    
-                    if review_elements:
-                        for element in review_elements:
-                            try:
-                                review_text = element.get_text().strip()
-                                review_text = re.sub(r'\s+', ' ', review_text)
-                                
-                                rating = 0
-                                rating_pattern = r'평점\s*(\d+(\.\d+)?)'
-                                rating_match = re.search(rating_pattern, review_text)
-                                if rating_match:
-                                    try:
-                                        rating = float(rating_match.group(1))
-                                    except ValueError:
-                                        rating = 0
-                                
-                                date = "알 수 없음"
-                                date_pattern = r'(\d{4}-\d{2}-\d{2}|\d{4}\.\d{2}\.\d{2})'
-                                date_match = re.search(date_pattern, review_text)
-                                if date_match:
-                                    date = date_match.group(1)
-                                
-                                reviews.append({
-                                    "text": review_text,
-                                    "rating": rating,
-                                    "date": date,
-                                    "sentiment": None,
-                                    "keywords": []
-                                })
-                            except Exception as e:
-                                logger.warning(f"리뷰 파싱 중 오류: {e}")
-                                continue
-                        
-                        break
-                    if not review_elements:
-                        for xpath in xpath_selectors:
-                            try:
-                                review_elements = driver.find_elements(By.XPATH, xpath)
-                                if review_elements:
-                                    logger.info(f"{xpath} XPath로 {len(review_elements)}개 리뷰 찾음")
-                                    break
-                            except:
-                                continue
-                
-                logger.info(f"성공적으로 {len(reviews)}개의 리뷰를 파싱했습니다.")
-                
-            except TimeoutException:
-                logger.error("리뷰 요소를 찾을 수 없습니다. 페이지 구조가 변경되었을 수 있습니다.")
-            
+            loop = asyncio.get_running_loop()
+            reviews, timings = await loop.run_in_executor(
+                None, review_crawler.crawl, pooled.driver, review_url
+            )
+
+            timing_text = ", ".join(f"{phase}={seconds:.2f}s" for phase, seconds in timings.items())
+            logger.info(f"성공적으로 {len(reviews)}개의 리뷰를 파싱했습니다. ({timing_text})")
             return reviews
             
         except Exception as e:
@@ -286,66 +207,72 @@ class ReviewService:
             return []
 
         finally:
-            if driver:
-                driver.quit()
-                logger.info("WebDriver 종료됨")
+            if pooled:
+                await webdriver_pool.release(pooled)
     
     def _analyze_single_review(self, review: Dict[str, Any]) -> Dict[str, Any]:
         """KoNLPy를 활용한 단일 리뷰 분석"""
-        text = review["text"].lower()
-        
-        morphs = self.okt.pos(text)
-        
-        sentiment_score = 0
-        matched_words = []
-        
-        for word, pos in morphs:
-            if pos in ['Adjective', 'Verb', 'Noun']:
-                for sentiment_word, score in self.sentiment_dict.items():
-                    if sentiment_word in word:
-                        sentiment_score += score
-                        matched_words.append(word)
-        
-        sentiment = "neutral"
-        if sentiment_score > 1:
-            sentiment = "positive"
-        elif sentiment_score < -0.5:
-            sentiment = "negative"
-        
-        keywords = []
-        for word, pos in morphs:
-            if pos == 'Noun' and len(word) > 1 and word not in self.stopwords:
-                keywords.append(word)
-        
-        keywords = list(dict.fromkeys(keywords))[:5]
-        
-        review_copy = review.copy()
-        review_copy["sentiment"] = sentiment
-        review_copy["sentiment_score"] = sentiment_score
-        review_copy["keywords"] = keywords
-        review_copy["matched_sentiment_words"] = list(set(matched_words))
-        
-        return review_copy
+        return analyze_review(review, self.tokenizer, self.sentiment_matcher, self.stopword_set)
     
     def _process_reviews_batch(self, batch):
         """리뷰 배치를 처리하는 메소드"""
         return [self._analyze_single_review(review) for review in batch]
     
+    def _get_analysis_pool(self) -> Optional[concurrent.futures.ProcessPoolExecutor]:
+        """감성 분석용 프로세스 풀 (REVIEW_ANALYSIS_WORKERS가 0이면 사용하지 않음)"""
+        if self.analysis_workers <= 0:
+            return None
+        
+        if self._analysis_pool is None:
+            # JVM(Okt)은 fork 이후 사용할 수 없으므로 spawn으로 워커 생성
+            self._analysis_pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.analysis_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_worker,
+                initargs=(self.sentiment_dict, self.stopwords)
+            )
+            logger.info(f"리뷰 분석 프로세스 풀 생성: 워커 {self.analysis_workers}개")
+        
+        return self._analysis_pool
+    
+    def close_analysis_pool(self):
+        """프로세스 풀 종료"""
+        if self._analysis_pool is not None:
+            self._analysis_pool.shutdown(wait=False, cancel_futures=True)
+            self._analysis_pool = None
+            logger.info("리뷰 분석 프로세스 풀 종료")
+    
     async def analyze_sentiment(self, reviews: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """KoNLPy를 활용한 감성 분석 (병렬 처리)"""
+        """KoNLPy를 활용한 감성 분석 (프로세스 풀 병렬 처리)"""
         if not reviews:
             return []
         
-        def process_reviews_batch(batch):
-            return [self._analyze_single_review(review) for review in batch]
-        
-        batch_size = 10
+        batch_size = self.analysis_batch_size
         review_batches = [reviews[i:i + batch_size] for i in range(0, len(reviews), batch_size)]
         
-        analyzed_reviews = []
-        for batch in review_batches:
-            analyzed_reviews.extend(self._process_reviews_batch(batch))
+        pool = self._get_analysis_pool()
+        if pool is None or len(review_batches) < 2:
+            analyzed_reviews = []
+            for batch in review_batches:
+                analyzed_reviews.extend(self._process_reviews_batch(batch))
+            return analyzed_reviews
         
+        loop = asyncio.get_running_loop()
+        try:
+            results = await asyncio.gather(*[
+                loop.run_in_executor(pool, analyze_batch, batch) for batch in review_batches
+            ])
+        except concurrent.futures.process.BrokenProcessPool:
+            logger.error("리뷰 분석 프로세스 풀이 손상되어 현재 프로세스에서 분석합니다.")
+            self._analysis_pool = None
+            return self._process_reviews_batch(reviews)
+        
+        # 워커의 형태소 분석 결과를 현재 프로세스 캐시에 등록 (워드 클라우드/카테고리 분석에서 재사용)
+        analyzed_reviews = []
+        for batch in results:
+            for review, morphs in batch:
+                self.tokenizer.prime(review["text"], morphs)
+                analyzed_reviews.append(review)
         return analyzed_reviews
     
     async def generate_word_cloud_data(self, reviews: List[Dict[str, Any]]) -> Dict[str, Dict[str, int]]:
@@ -357,9 +284,7 @@ class ReviewService:
         for review in positive_reviews:
             text = review.get("text", "")
             try:
-                nouns = self.okt.nouns(text)
-                filtered_nouns = [noun for noun in nouns if len(noun) > 1 and noun not in self.stopwords]
-                positive_nouns.extend(filtered_nouns)
+                positive_nouns.extend(self.tokenizer.tokenize(text).content_nouns(self.stopword_set))
             except Exception as e:
                 logger.warning(f"긍정 리뷰 단어 추출 오류: {e}")
         
@@ -367,9 +292,7 @@ class ReviewService:
         for review in negative_reviews:
             text = review.get("text", "")
             try:
-                nouns = self.okt.nouns(text)
-                filtered_nouns = [noun for noun in nouns if len(noun) > 1 and noun not in self.stopwords]
-                negative_nouns.extend(filtered_nouns)
+                negative_nouns.extend(self.tokenizer.tokenize(text).content_nouns(self.stopword_set))
             except Exception as e:
                 logger.warning(f"부정 리뷰 단어 추출 오류: {e}")
         
@@ -411,10 +334,9 @@ class ReviewService:
                             category_data[category]["negative"] += 1
                         
                         try:
-                            nouns = self.okt.nouns(text)
-                            for noun in nouns:
-                                if len(noun) > 1 and noun not in self.stopwords:
-                                    category_data[category]["keywords"].append(noun)
+                            category_data[category]["keywords"].extend(
+                                self.tokenizer.tokenize(text).content_nouns(self.stopword_set)
+                            )
                         except:
                             pass
                             
@@ -639,10 +561,10 @@ class ReviewService:
     
     async def analyze_store_reviews(self, store_id: int, place_id: str) -> Dict[str, Any]:
         try:
-            reviews_collection = mongo_instance.get_collection("StoreReviews")
+            reviews_collection = async_mongo_instance.get_collection("StoreReviews")
             query = {"store_id": store_id, "place_id": place_id}
             
-            existing_result = reviews_collection.find_one(query, sort=[("created_at", -1)])
+            existing_result = await reviews_collection.find_one(query, sort=[("created_at", -1)])
             
             if existing_result and "created_at" in existing_result:
                 created_at = existing_result["created_at"]
@@ -656,12 +578,11 @@ class ReviewService:
                         "is_cached": True
                     }
             
-            reviews = await self.fetch_reviews_with_selenium(place_id)
+            analyzed_reviews = await self.get_analyzed_reviews(place_id)
             
-            if not reviews:
+            if not analyzed_reviews:
                 return {"status": "error", "message": "리뷰를 가져올 수 없습니다. 매장 ID를 확인하거나 나중에 다시 시도해 주세요."}
             
-            analyzed_reviews = await self.analyze_sentiment(reviews)
             word_cloud_data = await self.generate_word_cloud_data(analyzed_reviews)
             category_insights = await self.generate_category_insights(analyzed_reviews)
             insights = await self.generate_insights(analyzed_reviews, place_id)
@@ -689,7 +610,8 @@ class ReviewService:
                 "created_at": datetime.now()
             }
             
-            result_id = reviews_collection.insert_one(result).inserted_id
+            result_id = (await reviews_collection.insert_one(result)).inserted_id
+            report_input_assembler.invalidate(store_id)
             
             result["_id"] = str(result_id)
             
@@ -706,7 +628,7 @@ class ReviewService:
     
     async def get_store_reviews_list(self, store_id: int) -> Dict[str, Any]:
         try:
-            reviews_collection = mongo_instance.get_collection("StoreReviews")
+            reviews_collection = async_mongo_instance.get_collection("StoreReviews")
             
             if isinstance(store_id, str) and store_id.isdigit():
                 store_id = int(store_id)
@@ -714,7 +636,7 @@ class ReviewService:
             cursor = reviews_collection.find({"store_id": int(store_id)}).sort("created_at", -1)
             
             results = []
-            for doc in cursor:
+            async for doc in cursor:
                 doc["_id"] = str(doc["_id"])
                 results.append({
                     "analysis_id": doc["_id"],
@@ -736,9 +658,9 @@ class ReviewService:
     
     async def get_review_analysis(self, analysis_id: str) -> Dict[str, Any]:
         try:
-            reviews_collection = mongo_instance.get_collection("StoreReviews")
+            reviews_collection = async_mongo_instance.get_collection("StoreReviews")
             
-            result = reviews_collection.find_one({"_id": ObjectId(analysis_id)})
+            result = await reviews_collection.find_one({"_id": ObjectId(analysis_id)})
             
             if not result:
                 return {"status": "error", "message": "해당 분석 결과를 찾을 수 없습니다"}
@@ -0,0 +1,84 @@
+# services/review_tokenizer.py
+
+import os
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import List, Tuple, Iterable, Optional
+from konlpy.tag import Okt  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+class TokenizedReview:
+    """리뷰 한 건의 형태소 분석 결과 (감성/키워드/워드클라우드/카테고리 분석에서 공유)"""
+
+    __slots__ = ("morphs", "nouns")
+
+    def __init__(self, morphs: List[Tuple[str, str]]):
+        self.morphs = morphs
+        self.nouns = [word for word, pos in morphs if pos == 'Noun']
+
+    def content_nouns(self, stopwords: Iterable[str]) -> List[str]:
+        """두 글자 이상이고 불용어가 아닌 명사"""
+        return [noun for noun in self.nouns if len(noun) > 1 and noun not in stopwords]
+
+
+class ReviewTokenizer:
+    """
+    Okt 형태소 분석 결과를 리뷰 텍스트 해시 기준 LRU로 캐싱하는 토크나이저
+
+    같은 리뷰를 여러 단계에서 분석하거나, 경쟁사 조회처럼 동일 리뷰가 반복될 때
+    JVM 기반 Okt 호출을 한 번으로 줄인다.
+    """
+
+    def __init__(self, okt: Optional[Okt] = None, cache_size: Optional[int] = None):
+        self.okt = okt or Okt()
+        self.cache_size = cache_size or int(os.getenv("REVIEW_TOKEN_CACHE_SIZE", 5000))
+
+        self._cache: "OrderedDict[str, TokenizedReview]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(normalized: str) -> str:
+        return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+    def _store(self, key: str, tokenized: TokenizedReview):
+        with self._lock:
+            self._cache[key] = tokenized
+            self._cache.move_to_end(key)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def tokenize(self, text: str) -> TokenizedReview:
+        """소문자로 정규화한 텍스트의 형태소 분석 결과 (캐시 우선)"""
+        normalized = text.lower()
+        key = self._key(normalized)
+
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        tokenized = TokenizedReview(self.okt.pos(normalized))
+        self._store(key, tokenized)
+        return tokenized
+
+    def prime(self, text: str, morphs: List[Tuple[str, str]]) -> TokenizedReview:
+        """다른 프로세스(분석 워커)에서 얻은 형태소 분석 결과를 캐시에 등록"""
+        tokenized = TokenizedReview(morphs)
+        self._store(self._key(text.lower()), tokenized)
+        return tokenized
+
+    def cache_info(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._cache),
+            "max_size": self.cache_size
+        }
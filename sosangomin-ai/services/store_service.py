@@ -1,46 +1,26 @@
 # services/store_service.py
-import os
 import re
 import time
 import logging
-import requests
 import asyncio
 from typing import Dict, Any, Optional
 from datetime import datetime
 from dotenv import load_dotenv
 from database.connector import database_instance
 from bs4 import BeautifulSoup
-from urllib.parse import urlencode, quote_plus
+from urllib.parse import quote_plus
 from db_models import Store
 from sqlalchemy import or_
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
-import tempfile
-import shutil
-import uuid
+from services.webdriver_pool import webdriver_pool
+from services.naver_api_client import naver_api_client
+from services.place_id_resolver import place_id_resolver
+from services.chat_context_cache import chat_context_cache
 
 logger = logging.getLogger(__name__)
 
 class SimpleStoreService:
     def __init__(self):
         load_dotenv("./config/.env")
-        
-        self.naver_client_id = os.getenv("NAVER_CLIENT_ID")
-        self.naver_client_secret = os.getenv("NAVER_CLIENT_SECRET")
-        
-        if not self.naver_client_id or not self.naver_client_secret:
-            logger.error("네이버 API 키가 설정되지 않았습니다. 환경 변수를 확인하세요.")
-            self.naver_client_id = "NOT_SET"
-            self.naver_client_secret = "NOT_SET"
-        
-        self.naver_headers = {
-            "X-Naver-Client-Id": self.naver_client_id,
-            "X-Naver-Client-Secret": self.naver_client_secret,
-            "Content-Type": "application/json"
-        }
-        
-        self.naver_search_url = "https://openapi.naver.com/v1/search/local.json"
     
     async def register_store_by_name(self, user_id: int, store_name: str, pos_type: str, category: str) -> Dict[str, Any]:
         """
@@ -62,15 +42,7 @@ class SimpleStoreService:
                     "message": f"'{store_name}' 검색 결과가 없습니다."
                 }
             
-            place_id = search_result.get("place_id")
-            
-            if not place_id or place_id == search_result.get("place_url"):
-                search_query = f"{search_result['store_name']}"
-                place_id = await self._get_place_id_with_selenium(search_query)
-                
-                if place_id:
-                    search_result["place_id"] = place_id
-                    logger.info(f"Selenium으로 place_id 추출 성공: {place_id}")
+            await self._resolve_place_id(search_result, search_result['store_name'])
             
             store_info = {
                 "store_name": search_result.get("store_name"),
@@ -95,19 +67,7 @@ class SimpleStoreService:
     async def _search_naver_store(self, query: str) -> Dict[str, Any]:
         """네이버 지역 검색 API를 사용하여 가게 검색 (첫 번째 결과만 반환)"""
         try:
-            params = {
-                "query": query,
-                "display": 1,  
-                "start": 1,
-                "sort": "random"
-            }
-            
-            url = f"{self.naver_search_url}?{urlencode(params)}"
-            
-            response = requests.get(url, headers=self.naver_headers)
-            response.raise_for_status()
-            
-            data = response.json()
+            data = await naver_api_client.search_local(query, display=1, start=1, sort="random")
             items = data.get("items", [])
             
             if not items:
@@ -144,6 +104,34 @@ class SimpleStoreService:
             logger.error(f"네이버 가게 검색 중 오류: {str(e)}")
             return {}
     
+    async def _resolve_place_id(self, search_result: Dict[str, Any], query: str) -> Optional[str]:
+        """
+        검색 결과 링크에 place_id가 없으면 해석 캐시/백그라운드 Selenium 조회로 보완
+
+        Args:
+            search_result: _search_naver_store 결과 (place_id가 갱신됨)
+            query: Selenium 조회 시 사용할 검색어
+
+        Returns:
+            Optional[str]: place_id
+        """
+        place_id = search_result.get("place_id")
+        
+        if place_id and place_id != search_result.get("place_url"):
+            return place_id
+        
+        place_id = await place_id_resolver.resolve(
+            search_result.get("store_name", query),
+            search_result.get("address"),
+            lambda: self._get_place_id_with_selenium(query)
+        )
+        
+        if place_id:
+            search_result["place_id"] = place_id
+            logger.info(f"place_id 해석 성공: {place_id}")
+        
+        return place_id
+    
     def _extract_naver_place_id(self, url: str) -> str:
         """네이버 지도 URL에서 place_id 추출 시도"""
         try:
@@ -167,205 +155,203 @@ class SimpleStoreService:
     
     
     async def _get_place_id_with_selenium(self, query: str) -> Optional[str]:
-        driver = None
+        """
+        네이버 지도 검색 페이지에서 place_id 추출
+
+        Returns:
+            Optional[str]: place_id (검색을 마쳤지만 찾지 못하면 None)
+
+        Raises:
+            Exception: WebDriver 대여, 페이지 로드 등 조회 자체가 실패한 경우
+        """
+        pooled = None
         try:
             logger.info(f"'{query}' 검색하여 place_id 추출 중...")
 
-            chrome_options = Options()
-            chrome_options.add_argument("--headless")
-            chrome_options.add_argument("--window-size=1920,1080")
-            chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-            chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            chrome_options.add_experimental_option("useAutomationExtension", False)
-            chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/100.0.4896.127 Safari/537.36")
-            chrome_options.add_argument("--incognito")
-            chrome_options.add_argument("--no-sandbox")
-            chrome_options.add_argument("--disable-dev-shm-usage")
+            pooled = await webdriver_pool.acquire()
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._search_place_id, pooled.driver, query)
 
-            service = Service()
-            driver = webdriver.Chrome(service=service, options=chrome_options)
-            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        except Exception as e:
+            # 브라우저/네트워크 오류는 호출부로 전달 (None은 '검색했지만 없음'으로 네거티브 캐시됨)
+            logger.error(f"Selenium으로 place_id 추출 중 오류 발생: {e}")
+            raise
 
-            search_url = f"https://map.naver.com/p/search/{quote_plus(query)}"
-            driver.get(search_url)
+        finally:
+            if pooled:
+                await webdriver_pool.release(pooled)
 
-            time.sleep(6)
-            
-            current_url = driver.current_url
-            logger.info(f"현재 URL: {current_url}")
+    def _search_place_id(self, driver, query: str) -> Optional[str]:
+        """네이버 지도 검색 페이지를 열어 place_id 추출 (블로킹, 스레드 실행기에서 호출)"""
+        search_url = f"https://map.naver.com/p/search/{quote_plus(query)}"
+        driver.get(search_url)
+
+        time.sleep(6)
+        
+        current_url = driver.current_url
+        logger.info(f"현재 URL: {current_url}")
 
-            place_id_match = re.search(r'/place/(\d+)', current_url)
+        place_id_match = re.search(r'/place/(\d+)', current_url)
+        if place_id_match:
+            return place_id_match.group(1)
+
+        if "place=" in current_url:
+            place_id_match = re.search(r'place=(\d+)', current_url)
             if place_id_match:
                 return place_id_match.group(1)
-
-            if "place=" in current_url:
-                place_id_match = re.search(r'place=(\d+)', current_url)
-                if place_id_match:
-                    return place_id_match.group(1)
-            
-            try:
-                iframe_elements = driver.find_elements("css selector", "iframe#entryIframe")
-                if iframe_elements:
-                    iframe_src = iframe_elements[0].get_attribute("src")
-                    logger.info(f"Entry iframe 소스 발견: {iframe_src}")
-                    
-                    iframe_place_id_match = re.search(r'/place/(\d+)', iframe_src)
-                    if iframe_place_id_match:
-                        return iframe_place_id_match.group(1)
-            except Exception as iframe_error:
-                logger.warning(f"Entry iframe 확인 중 오류: {iframe_error}")
+        
+        try:
+            iframe_elements = driver.find_elements("css selector", "iframe#entryIframe")
+            if iframe_elements:
+                iframe_src = iframe_elements[0].get_attribute("src")
+                logger.info(f"Entry iframe 소스 발견: {iframe_src}")
                 
+                iframe_place_id_match = re.search(r'/place/(\d+)', iframe_src)
+                if iframe_place_id_match:
+                    return iframe_place_id_match.group(1)
+        except Exception as iframe_error:
+            logger.warning(f"Entry iframe 확인 중 오류: {iframe_error}")
+            
+        try:
+            time.sleep(2)
+            
+            search_iframe = None
             try:
-                time.sleep(2)
+                search_iframe = driver.find_element("css selector", "iframe#searchIframe")
+                logger.info("검색 iframe 발견")
+            except Exception as e:
+                logger.warning(f"검색 iframe 찾기 실패: {e}")
                 
-                search_iframe = None
-                try:
-                    search_iframe = driver.find_element("css selector", "iframe#searchIframe")
-                    logger.info("검색 iframe 발견")
-                except Exception as e:
-                    logger.warning(f"검색 iframe 찾기 실패: {e}")
-                    
-                if search_iframe:
-                    driver.switch_to.frame(search_iframe)
-                    
-                    selectors = [
-                        "li.UEzoS.rTjJo", 
-                        "li.VLTHu", 
-                        "li[data-laim-exp-id]", 
-                        "ul.Place_list__W5R4u > li", 
-                        "ul.lst_site > li", 
-                        "div.panel_wrap > div.panel_content > div.panel_content_flexible > div.search_result > ul > li",
-                        "div.search_result > ul > li",
-                        "ul > li.item_search",
-                        "li.sc-ebcc9e2e-0",
-                        "li:first-child",  
-                    ]
-                    
-                    for selector in selectors:
-                        try:
-                            logger.info(f"선택자 시도: {selector}")
-                            elements = driver.find_elements("css selector", selector)
-                            if elements:
-                                logger.info(f"선택자 '{selector}'로 {len(elements)}개 요소 발견")
-                                try:
-                                    link_element = elements[0].find_element("css selector", "a")
-                                    href = link_element.get_attribute("href")
-                                    logger.info(f"첫 번째 검색 결과 href: {href}")
-                                    if href and '/place/' in href:
-                                        driver.switch_to.default_content()
-                                        driver.get(href)
-                                        time.sleep(3)
-                                        new_url = driver.current_url
-                                        logger.info(f"href 이동 후 URL: {new_url}")
-                                        match = re.search(r'/place/(\d+)', new_url)
-                                        if match:
-                                            return match.group(1)
-                                except Exception as href_error:
-                                    logger.warning(f"href 추출 및 이동 중 오류: {href_error}")
-                                elements[0].click()
-                                logger.info("첫 번째 검색 결과 클릭 성공")
-                                break
-                        except Exception as e:
-                            logger.warning(f"선택자 '{selector}' 시도 실패: {e}")
-                    
-                    driver.switch_to.default_content()
-                    iframes = driver.find_elements("tag name", "iframe")
-                    logger.info(f"현재 페이지 iframe 수: {len(iframes)}")
-                    for i, frame in enumerate(iframes):
-                        logger.info(f"iframe[{i}] - id: {frame.get_attribute('id')}, src: {frame.get_attribute('src')}")
-
-                    
-                    # 클릭 후 추가 로딩 시간
-                    time.sleep(3)
-                    
-                    # 현재 URL 다시 확인
-                    current_url = driver.current_url
-                    place_id_match = re.search(r'/place/(\d+)', current_url)
-                    if place_id_match:
-                        logger.info(f"클릭 후 URL에서 place_id 발견: {place_id_match.group(1)}")
-                        return place_id_match.group(1)
-                    
-                    # entry iframe 다시 확인
-                    try:
-                        entry_iframe = driver.find_element("css selector", "iframe#entryIframe")
-                        iframe_src = entry_iframe.get_attribute("src")
-                        logger.info(f"클릭 후 entry iframe 소스: {iframe_src}")
-                        
-                        # iframe 소스에서 place_id 추출
-                        iframe_place_id_match = re.search(r'/place/(\d+)', iframe_src)
-                        if iframe_place_id_match:
-                            return iframe_place_id_match.group(1)
-                    except Exception as e:
-                        logger.warning(f"클릭 후 entry iframe 확인 실패: {e}")
-                        
-            except Exception as click_error:
-                logger.warning(f"검색 결과 클릭 시도 중 오류: {click_error}")
+            if search_iframe:
+                driver.switch_to.frame(search_iframe)
                 
-            try:
-                scripts = [
-                    "return document.querySelector('iframe#entryIframe')?.src",
-                    "return document.querySelector('iframe#searchIframe')?.src",
-                    "return document.body.innerHTML.match(/\\/place\\/(\\d+)/)?.[1]",
-                    "return window.location.href"
+                selectors = [
+                    "li.UEzoS.rTjJo", 
+                    "li.VLTHu", 
+                    "li[data-laim-exp-id]", 
+                    "ul.Place_list__W5R4u > li", 
+                    "ul.lst_site > li", 
+                    "div.panel_wrap > div.panel_content > div.panel_content_flexible > div.search_result > ul > li",
+                    "div.search_result > ul > li",
+                    "ul > li.item_search",
+                    "li.sc-ebcc9e2e-0",
+                    "li:first-child",  
                 ]
                 
-                for script in scripts:
+                for selector in selectors:
                     try:
-                        result = driver.execute_script(script)
-                        if result:
-                            logger.info(f"JavaScript 실행 결과: {result}")
-                            if isinstance(result, str) and 'place' in result:
-                                place_match = re.search(r'/place/(\d+)', result)
-                                if place_match:
-                                    return place_match.group(1)
-                    except Exception as script_error:
-                        logger.warning(f"JavaScript 실행 오류: {script_error}")
+                        logger.info(f"선택자 시도: {selector}")
+                        elements = driver.find_elements("css selector", selector)
+                        if elements:
+                            logger.info(f"선택자 '{selector}'로 {len(elements)}개 요소 발견")
+                            try:
+                                link_element = elements[0].find_element("css selector", "a")
+                                href = link_element.get_attribute("href")
+                                logger.info(f"첫 번째 검색 결과 href: {href}")
+                                if href and '/place/' in href:
+                                    driver.switch_to.default_content()
+                                    driver.get(href)
+                                    time.sleep(3)
+                                    new_url = driver.current_url
+                                    logger.info(f"href 이동 후 URL: {new_url}")
+                                    match = re.search(r'/place/(\d+)', new_url)
+                                    if match:
+                                        return match.group(1)
+                            except Exception as href_error:
+                                logger.warning(f"href 추출 및 이동 중 오류: {href_error}")
+                            elements[0].click()
+                            logger.info("첫 번째 검색 결과 클릭 성공")
+                            break
+                    except Exception as e:
+                        logger.warning(f"선택자 '{selector}' 시도 실패: {e}")
                 
-            except Exception as js_error:
-                logger.warning(f"JavaScript 실행 중 오류: {js_error}")
+                driver.switch_to.default_content()
+                iframes = driver.find_elements("tag name", "iframe")
+                logger.info(f"현재 페이지 iframe 수: {len(iframes)}")
+                for i, frame in enumerate(iframes):
+                    logger.info(f"iframe[{i}] - id: {frame.get_attribute('id')}, src: {frame.get_attribute('src')}")
+
                 
-            try:
-                page_source = driver.page_source
-                logger.info("HTML 소스에서 place_id 찾기 시도")
+                # 클릭 후 추가 로딩 시간
+                time.sleep(3)
                 
-                place_id_pattern = re.compile(r'place/(\d+)')
-                place_matches = place_id_pattern.findall(page_source)
+                # 현재 URL 다시 확인
+                current_url = driver.current_url
+                place_id_match = re.search(r'/place/(\d+)', current_url)
+                if place_id_match:
+                    logger.info(f"클릭 후 URL에서 place_id 발견: {place_id_match.group(1)}")
+                    return place_id_match.group(1)
                 
-                if place_matches:
-                    logger.info(f"소스에서 place_id 발견: {place_matches[0]}")
-                    return place_matches[0]
+                # entry iframe 다시 확인
+                try:
+                    entry_iframe = driver.find_element("css selector", "iframe#entryIframe")
+                    iframe_src = entry_iframe.get_attribute("src")
+                    logger.info(f"클릭 후 entry iframe 소스: {iframe_src}")
                     
-                alt_patterns = [
-                    r'\"id\":\"(\d+)\"',
-                    r'placeId\":\"(\d+)\"',
-                    r'placeId=(\d+)',
-                    r'place_id=(\d+)'
-                ]
+                    # iframe 소스에서 place_id 추출
+                    iframe_place_id_match = re.search(r'/place/(\d+)', iframe_src)
+                    if iframe_place_id_match:
+                        return iframe_place_id_match.group(1)
+                except Exception as e:
+                    logger.warning(f"클릭 후 entry iframe 확인 실패: {e}")
+                    
+        except Exception as click_error:
+            logger.warning(f"검색 결과 클릭 시도 중 오류: {click_error}")
+            
+        try:
+            scripts = [
+                "return document.querySelector('iframe#entryIframe')?.src",
+                "return document.querySelector('iframe#searchIframe')?.src",
+                "return document.body.innerHTML.match(/\\/place\\/(\\d+)/)?.[1]",
+                "return window.location.href"
+            ]
+            
+            for script in scripts:
+                try:
+                    result = driver.execute_script(script)
+                    if result:
+                        logger.info(f"JavaScript 실행 결과: {result}")
+                        if isinstance(result, str) and 'place' in result:
+                            place_match = re.search(r'/place/(\d+)', result)
+                            if place_match:
+                                return place_match.group(1)
+                except Exception as script_error:
+                    logger.warning(f"JavaScript 실행 오류: {script_error}")
+            
+        except Exception as js_error:
+            logger.warning(f"JavaScript 실행 중 오류: {js_error}")
+            
+        try:
+            page_source = driver.page_source
+            logger.info("HTML 소스에서 place_id 찾기 시도")
+            
+            place_id_pattern = re.compile(r'place/(\d+)')
+            place_matches = place_id_pattern.findall(page_source)
+            
+            if place_matches:
+                logger.info(f"소스에서 place_id 발견: {place_matches[0]}")
+                return place_matches[0]
                 
-                for pattern in alt_patterns:
-                    matches = re.findall(pattern, page_source)
-                    if matches:
-                        logger.info(f"대체 패턴으로 ID 발견: {matches[0]}")
-                        return matches[0]
-                        
-            except Exception as source_error:
-                logger.warning(f"HTML 소스 분석 중 오류: {source_error}")
-
-            logger.warning("모든 방법으로 place_id를 찾지 못했습니다.")
-            return None
+            alt_patterns = [
+                r'\"id\":\"(\d+)\"',
+                r'placeId\":\"(\d+)\"',
+                r'placeId=(\d+)',
+                r'place_id=(\d+)'
+            ]
+            
+            for pattern in alt_patterns:
+                matches = re.findall(pattern, page_source)
+                if matches:
+                    logger.info(f"대체 패턴으로 ID 발견: {matches[0]}")
+                    return matches[0]
+                    
+        except Exception as source_error:
+            # 페이지 소스를 읽지 못하면 검색을 끝까지 확인하지 못한 것이므로 '없음'으로 처리하지 않음
+            logger.warning(f"HTML 소스 분석 중 오류: {source_error}")
+            raise
 
-        except Exception as e:
-            logger.error(f"Selenium으로 place_id 추출 중 오류 발생: {e}")
-            return None
-
-        finally:
-            if driver:
-                try:
-                    loop = asyncio.get_running_loop()
-                    await loop.run_in_executor(None, driver.quit)
-                except RuntimeError:
-                    driver.quit()
-            logger.info("WebDriver 종료됨")
+        logger.warning("모든 방법으로 place_id를 찾지 못했습니다.")
+        return None
 
     def _clean_text(self, text: str) -> str:
         """HTML 태그 및 특수문자 제거"""
@@ -538,6 +524,9 @@ class SimpleStoreService:
             
             db_session.commit()
             
+            # 채팅 세션에 캐시된 메인 매장 정보 제거
+            await chat_context_cache.invalidate_user_sessions(user_id)
+            
             return {
                 "status": "success",
                 "message": "대표 가게가 성공적으로 변경되었습니다.",
@@ -556,7 +545,7 @@ class SimpleStoreService:
 
     async def get_store(self, store_id: int, user_id: Optional[int] = None) -> Dict[str, Any]:
         """
-        DB에서 가게 정보를 조회
+        DB에서 가게 정보를 조회 (동기 SQLAlchemy 조회를 스레드에서 실행하여 이벤트 루프를 막지 않음)
         
         Args:
             store_id: 가게 ID
@@ -565,6 +554,9 @@ class SimpleStoreService:
         Returns:
             Dict: 가게 정보
         """
+        return await asyncio.to_thread(self._get_store_sync, store_id, user_id)
+
+    def _get_store_sync(self, store_id: int, user_id: Optional[int] = None) -> Dict[str, Any]:
         db_session = database_instance.pre_session()
         
         try:
@@ -638,15 +630,7 @@ class SimpleStoreService:
             store_info = {}
             
             if search_result:
-                place_id = search_result.get("place_id")
-                
-                if not place_id or place_id == search_result.get("place_url"):
-                    search_query = f"{search_result['store_name']}"
-                    place_id = await self._get_place_id_with_selenium(search_query)
-                    
-                    if place_id:
-                        search_result["place_id"] = place_id
-                        logger.info(f"Selenium으로 place_id 추출 성공: {place_id}")
+                await self._resolve_place_id(search_result, search_result['store_name'])
                 
                 store_info = {
                     "store_name": search_result.get("store_name", store_name),
@@ -0,0 +1,167 @@
+# services/swot_report_engine.py
+
+import os
+import asyncio
+import hashlib
+import logging
+from datetime import datetime
+from typing import Dict, Any, AsyncIterator, Awaitable, Callable
+from dotenv import load_dotenv
+from database.async_mongo_connector import async_mongo_instance
+
+logger = logging.getLogger(__name__)
+
+# 프롬프트 형식이 바뀌면 올려서 기존 캐시를 무효화
+PROMPT_VERSION = "1"
+
+SECTION_PROMPT = """
+        # 소상공인 SWOT 영역 분석 요청
+
+        당신은 소상공인을 위한 데이터 분석 전문가입니다. 아래 매장 정보와 하나의 분석 영역 데이터만 보고
+        이 영역에서 드러나는 강점, 약점, 기회, 위협을 각각 1-3개씩 간결하게 도출해 주세요.
+        평균 평점 관련 정보는 무시하세요.
+        """
+
+SECTION_RESPONSE_FORMAT = """
+        ## 응답 포맷
+
+        다음 JSON 형식으로만 답해 주세요:
+
+        ```json
+        {
+            "strengths": ["강점1", ...],
+            "weaknesses": ["약점1", ...],
+            "opportunities": ["기회1", ...],
+            "threats": ["위협1", ...]
+        }
+        ```
+        """
+
+class SwotReportEngine:
+    """
+    영역별 캐시를 사용하는 SWOT 보고서 생성 엔진
+
+    - 입력 영역(reviews, sales, competitors, location)마다 프롬프트 블록의 지문(SHA-256)을 계산
+    - 영역별 LLM 분석은 ReportSectionCache에 지문 단위로 저장하고, 지문이 바뀐 영역만 다시 생성
+    - 영역 분석은 동시에 실행하며 완료되는 순서대로 이벤트를 내보냄
+    - 최종 보고서는 영역별 결과를 종합하여 생성하고, 모든 영역 지문이 같으면 캐시된 보고서를 재사용
+    """
+
+    def __init__(self,
+                 llm_call: Callable[..., Awaitable[Dict[str, Any]]],
+                 parse_swot: Callable[[str], Awaitable[Dict[str, Any]]]):
+        load_dotenv("./config/.env")
+
+        self.llm_call = llm_call
+        self.parse_swot = parse_swot
+        self.section_max_tokens = int(os.getenv("SWOT_SECTION_MAX_TOKENS", 1500))
+        self.final_max_tokens = int(os.getenv("SWOT_FINAL_MAX_TOKENS", 7000))
+        self.collection_name = "ReportSectionCache"
+
+    def _collection(self):
+        return async_mongo_instance.get_collection(self.collection_name)
+
+    async def ensure_indexes(self):
+        """(section, fingerprint) 유니크 인덱스 생성 (애플리케이션 시작 시 호출)"""
+        try:
+            await self._collection().create_index(
+                [("section", 1), ("fingerprint", 1)], unique=True, name="ux_section_fingerprint"
+            )
+        except Exception as e:
+            logger.warning(f"{self.collection_name} 인덱스 생성 실패: {e}")
+
+    @staticmethod
+    def fingerprint(*parts: str) -> str:
+        digest = hashlib.sha256(PROMPT_VERSION.encode("utf-8"))
+        for part in parts:
+            digest.update(b"\x00")
+            digest.update(part.encode("utf-8"))
+        return digest.hexdigest()
+
+    async def _get_cached(self, section: str, fingerprint: str):
+        try:
+            return await self._collection().find_one({"section": section, "fingerprint": fingerprint})
+        except Exception as e:
+            logger.warning(f"보고서 영역 캐시 조회 실패 ({section}): {e}")
+            return None
+
+    async def _save_cached(self, section: str, fingerprint: str, fields: Dict[str, Any]):
+        try:
+            await self._collection().update_one(
+                {"section": section, "fingerprint": fingerprint},
+                {"$set": {**fields, "created_at": datetime.now()}},
+                upsert=True
+            )
+        except Exception as e:
+            logger.warning(f"보고서 영역 캐시 저장 실패 ({section}): {e}")
+
+    async def _analyze_section(self, section: str, store_block: str, block: str) -> Dict[str, Any]:
+        """영역 하나의 SWOT 항목 도출 (지문이 같으면 캐시 사용)"""
+        fingerprint = self.fingerprint(section, store_block, block)
+
+        cached = await self._get_cached(section, fingerprint)
+        if cached:
+            return {"section": section, "fingerprint": fingerprint, "cached": True, "swot": cached["swot"]}
+
+        prompt = SECTION_PROMPT + store_block + block + SECTION_RESPONSE_FORMAT
+        response = await self.llm_call(prompt, max_tokens=self.section_max_tokens)
+        if response.get("status") == "error":
+            raise ValueError(f"{section} 영역 분석 실패: {response.get('message')}")
+
+        parsed = await self.parse_swot(response.get("content", ""))
+        swot = {key: parsed.get(key, []) for key in ("strengths", "weaknesses", "opportunities", "threats")}
+
+        # 응답 파싱에 실패해 항목이 비었으면 캐싱하지 않음
+        if any(swot.values()):
+            await self._save_cached(section, fingerprint, {"swot": swot})
+        return {"section": section, "fingerprint": fingerprint, "cached": False, "swot": swot}
+
+    async def stream(self, store_block: str, section_blocks: Dict[str, str],
+                     build_final_prompt: Callable[[Dict[str, Dict[str, Any]]], str]) -> AsyncIterator[Dict[str, Any]]:
+        """
+        보고서 생성 이벤트 스트림
+
+        Args:
+            store_block: 매장 정보 프롬프트 블록
+            section_blocks: 영역명 -> 프롬프트 블록
+            build_final_prompt: 영역별 SWOT 결과로 최종 보고서 프롬프트를 만드는 함수
+
+        Yields:
+            {"event": "section", section, cached, swot}: 영역 분석이 끝날 때마다
+            {"event": "final", content, cached, fingerprints}: 최종 보고서 본문
+        """
+        tasks = [
+            asyncio.create_task(self._analyze_section(section, store_block, block))
+            for section, block in section_blocks.items()
+        ]
+
+        section_results: Dict[str, Dict[str, Any]] = {}
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                result = await next_done
+                section_results[result["section"]] = result
+                yield {"event": "section", **result}
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        # 영역 순서를 고정하여 최종 지문/프롬프트가 완료 순서에 좌우되지 않도록 함
+        ordered = {section: section_results[section] for section in section_blocks}
+        fingerprints = {section: result["fingerprint"] for section, result in ordered.items()}
+        final_fingerprint = self.fingerprint(
+            "final", store_block, *(f"{section}:{fingerprint}" for section, fingerprint in fingerprints.items())
+        )
+
+        cached = await self._get_cached("final", final_fingerprint)
+        if cached:
+            yield {"event": "final", "content": cached["content"], "cached": True, "fingerprints": fingerprints}
+            return
+
+        prompt = build_final_prompt({section: result["swot"] for section, result in ordered.items()})
+        response = await self.llm_call(prompt, max_tokens=self.final_max_tokens)
+        if response.get("status") == "error":
+            raise ValueError(response.get("message"))
+
+        content = response.get("content", "")
+        await self._save_cached("final", final_fingerprint, {"content": content})
+        yield {"event": "final", "content": content, "cached": False, "fingerprints": fingerprints}
@@ -1,15 +1,15 @@
 import os
 import sys
 import logging
-import requests
+import aiohttp
 from dotenv import load_dotenv
 from typing import Dict, Optional, Union
-import pymysql
 import pandas as pd
 from typing import List, Tuple
 from datetime import datetime, timedelta
 import asyncio
 import calendar
+from sqlalchemy.dialects.mysql import insert as mysql_insert
 from db_models import Weathers
 from database.connector import database_instance
 
@@ -28,6 +28,10 @@ class WeatherService:
             logger.error("기상청 API 키가 설정되지 않았습니다. 환경 변수를 확인하세요.")
             self.service_key = "NOT_SET"
 
+        # 월 단위 API 동시 호출 수 / upsert 배치 크기
+        self.fetch_concurrency = int(os.getenv("WEATHER_FETCH_CONCURRENCY", 4))
+        self.upsert_batch_size = int(os.getenv("WEATHER_UPSERT_BATCH_SIZE", 1000))
+
         # 지점번호 (stnId) 목록
         self.LOCATION_CODE = {
             "서울": 108,
@@ -48,6 +52,7 @@ class WeatherService:
         :param start_date: 예) '2024031011' (yyyyMMddhh 형식)
         :param end_date: 예) '2025042223' (yyyyMMddhh 형식)
         :param location: 예) "서울"
+        :return: 정수 YYYYMMDDHH(datetime)를 인덱스로 하는 시간별 날씨 (ta, ws, hm, rn)
         """
         db = database_instance.pre_session()
         location = location or self.default_location
@@ -78,40 +83,21 @@ class WeatherService:
             existing_months_set = set(f"{year}{str(month).zfill(2)}" for year, month in existing_months)
             logger.info(f"[이미 저장된 월]: {existing_months_set}")
 
-            # 4. 없는 월 목록 파악
-            missing_months = [date for date in date_list if date not in existing_months_set]
+            # 4. 없는 월 목록 파악 (이번 달은 아직 채워지는 중이므로 항상 다시 수집, upsert라 중복 없음)
+            this_month = datetime.today().strftime("%Y%m")
+            missing_months = [date for date in date_list if date not in existing_months_set or date == this_month]
             logger.info(f"[API 호출 필요 월]: {missing_months}")
 
-            # 5. 누락된 월에 대해 API 호출 및 저장
-            for date in missing_months:
-                api_data = self.get_weather_data(location, date) 
-                if 'error' not in api_data:
-                    await self.save_weather_hourly(db, api_data, location)  
-
-            db.commit()  
+            # 5. 누락된 월을 동시에 API 호출 후 일괄 upsert
+            if missing_months:
+                monthly_data = await self.fetch_months(location, missing_months)
+                frames = [data for data in monthly_data if data is not None and not data.empty]
+                if frames:
+                    await self.save_weather_hourly(db, pd.concat(frames, ignore_index=True), location)
+                    db.commit()
 
             # 6. 최종 데이터 조회 (범위 내)
-            final_weather = db.query(Weathers)\
-                .filter(
-                    Weathers.location == location,
-                    Weathers.datetime.between(start_date, end_date)
-                )\
-                .order_by(Weathers.datetime.asc())\
-                .all()
-
-            # 7. DataFrame 변환
-            df_result = pd.DataFrame([
-                {
-                    "year": row.year,
-                    "month": row.month,
-                    "day": row.day,
-                    "hour": row.hour,
-                    "ta": row.ta,
-                    "ws": row.ws,
-                    "hm": row.hm,
-                    "rn": row.rn,
-                } for row in final_weather
-            ])
+            df_result = self.load_weather_frame(db, location, int(start_date), int(end_date))
 
             logger.info(f"[날씨 처리 완료] 총 {len(df_result)}건 데이터 확보")
             return df_result
@@ -123,27 +109,43 @@ class WeatherService:
         finally:
             db.close()
 
+    def load_weather_frame(self, db, location: str, start_key: int, end_key: int) -> pd.DataFrame:
+        """
+        정수 YYYYMMDDHH 범위의 시간별 날씨 조회
+
+        :return: datetime(int) 인덱스, ta/ws/hm/rn 컬럼의 DataFrame
+        """
+        rows = db.query(Weathers.datetime, Weathers.ta, Weathers.ws, Weathers.hm, Weathers.rn)\
+            .filter(
+                Weathers.location == location,
+                Weathers.datetime.between(start_key, end_key)
+            )\
+            .order_by(Weathers.datetime.asc())\
+            .all()
+
+        return pd.DataFrame.from_records(
+            rows, columns=["datetime", "ta", "ws", "hm", "rn"], index="datetime"
+        )
 
     async def save_weather_hourly(self, db, weather_df: pd.DataFrame, location: Optional[str] = None):
-        """날씨 데이터 저장"""
+        """날씨 데이터 저장 (datetime 키 기준 일괄 upsert)"""
         try:
-            for _, row in weather_df.iterrows():
-                datetime = f"{row['year']}{row['month']}{row['day']}{row['hour']}"
-                weather_record = Weathers(
-                    datetime = int(datetime),
-                    year=row['year'],
-                    month=row['month'],
-                    day=row['day'],
-                    hour=row['hour'],
-                    location=location,
-                    ta=float(row['ta']) if row['ta'] else None, 
-                    ws=float(row['ws']) if row['ws'] else None,
-                    hm=float(row['hm']) if row['hm'] else None,
-                    rn=float(row['rn']) if row['rn'] else None
+            columns = weather_df[["datetime", "year", "month", "day", "hour", "ta", "ws", "hm", "rn"]]
+            records = columns.astype(object).where(columns.notna(), None).to_dict("records")
+
+            for i in range(0, len(records), self.upsert_batch_size):
+                batch = [dict(record, location=location) for record in records[i:i + self.upsert_batch_size]]
+                stmt = mysql_insert(Weathers).values(batch)
+                stmt = stmt.on_duplicate_key_update(
+                    location=stmt.inserted.location,
+                    ta=stmt.inserted.ta,
+                    ws=stmt.inserted.ws,
+                    hm=stmt.inserted.hm,
+                    rn=stmt.inserted.rn
                 )
-                db.add(weather_record)  
-            db.flush()  
-            logger.debug(f"{len(weather_df)}건 날씨 데이터 저장 완료")
+                db.execute(stmt)
+
+            logger.debug(f"{len(records)}건 날씨 데이터 저장 완료")
         except Exception as e:
             logger.error(f"날씨 데이터 저장 중 오류 : {str(e)}")
             raise
@@ -152,13 +154,25 @@ class WeatherService:
         """위치명으로 지점 번호 가져오기 (기본: 서울 108)"""
         return self.LOCATION_CODE.get(location, 108)
 
-    def get_weather_data(self, location: str, date: str) -> Dict:
+    async def fetch_months(self, location: str, months: List[str]) -> List[Optional[pd.DataFrame]]:
+        """여러 월의 날씨 데이터를 하나의 세션으로 동시에 조회 (동시 요청 수 제한)"""
+        semaphore = asyncio.Semaphore(self.fetch_concurrency)
+
+        async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10)) as session:
+            async def fetch(date: str):
+                async with semaphore:
+                    return await self.get_weather_data(session, location, date)
+
+            return await asyncio.gather(*(fetch(date) for date in months))
+
+    async def get_weather_data(self, session, location: str, date: str) -> Optional[pd.DataFrame]:
         """
-        과거 날씨 API 호출 (특정 시간)
+        과거 날씨 API 호출 (월 단위, 비동기)
 
+        :param session: aiohttp 세션
         :param location: 예) '서울'
         :param date: 예) '202403' (yyyyMM 형식)
-        :return: 날씨 데이터 (기온, 풍속, 습도, 강수량 등) 또는 에러 메시지
+        :return: 시간별 날씨 데이터 (datetime 키, 기온, 풍속, 습도, 강수량 등) 또는 None
         """
         stn_id = self.get_stn_id(location)
 
@@ -171,6 +185,8 @@ class WeatherService:
         # 만약 이번 달인데 오늘이 마지막 날보다 작으면 -> 어제 날짜로 제한
         if year == today.year and month == today.month:
             end_day = min(today.day, last_day) - 1
+            if end_day < 1:
+                return None
 
         startDt = f"{date}01"
         endDt = f"{date}{str(end_day).zfill(2)}"
@@ -186,34 +202,36 @@ class WeatherService:
             "startHh": "00",
             "endDt": endDt,
             "endHh": "23",
-            "stnIds": stn_id
+            "stnIds": str(stn_id)
         }
         try:
-            response = requests.get(self.base_url, params=params, timeout=10)
-            print("[DEBUG] 응답 코드:", response.status_code)
-            print(startDt, endDt)
-
-            response.raise_for_status()
-            result = response.json()
+            async with session.get(self.base_url, params=params) as response:
+                logger.debug(f"날씨 API 응답 코드: {response.status} ({startDt} ~ {endDt})")
+                response.raise_for_status()
+                result = await response.json(content_type=None)
 
             items = result['response']['body']['items']['item']
             if not items:
-                logger.warning(f"[WARN] 데이터 없음")
-                return {"error": "데이터가 없습니다."}
+                logger.warning(f"[WARN] 데이터 없음 ({date})")
+                return None
 
             # 여러 시간대 데이터 파싱
-            parsed_data = self.parse_weather_data(items)  # 리스트 처리로 변경
-            df = pd.DataFrame(parsed_data)
-            df['year'] = pd.to_datetime(df['tm']).dt.year.astype(str)
-            df['month'] = pd.to_datetime(df['tm']).dt.month.apply(lambda x: str(x).zfill(2))
-            df['day'] = pd.to_datetime(df['tm']).dt.day.apply(lambda x: str(x).zfill(2))
-            df['hour'] = pd.to_datetime(df['tm']).dt.hour.apply(lambda x: str(x).zfill(2))
+            df = pd.DataFrame(self.parse_weather_data(items))
+            tm = pd.to_datetime(df['tm'])
+
+            df['datetime'] = (tm.dt.year * 1000000 + tm.dt.month * 10000 + tm.dt.day * 100 + tm.dt.hour).astype("int64")
+            df['year'] = tm.dt.strftime('%Y')
+            df['month'] = tm.dt.strftime('%m')
+            df['day'] = tm.dt.strftime('%d')
+            df['hour'] = tm.dt.strftime('%H')
+            for col in ['ta', 'ws', 'hm', 'rn']:
+                df[col] = pd.to_numeric(df[col], errors='coerce')
 
             return df
 
         except Exception as e:
-            logger.error(f"날씨 API 호출 실패: {e}")
-            return {"error": "날씨 데이터를 가져오는 중 오류가 발생했습니다."}
+            logger.error(f"날씨 API 호출 실패 ({date}): {e}")
+            return None
         
     def parse_weather_data(self, items: list) -> list[Dict[str, Optional[str]]]:
         """
@@ -235,8 +253,6 @@ class WeatherService:
 
 weather_service = WeatherService()
 
-import asyncio
-
 if __name__ == "__main__":
     async def test_process_weather():
         """
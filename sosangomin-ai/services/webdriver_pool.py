@@ -0,0 +1,243 @@
+# services/webdriver_pool.py
+
+import os
+import time
+import asyncio
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Deque
+from dotenv import load_dotenv
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+
+logger = logging.getLogger(__name__)
+
+class PooledDriver:
+    """풀에서 관리되는 WebDriver와 사용 이력"""
+
+    def __init__(self, driver: webdriver.Chrome):
+        self.driver = driver
+        self.uses = 0
+        self.created_at = time.monotonic()
+
+
+class WebDriverPool:
+    """
+    크기가 제한된 헤드리스 Chrome WebDriver 풀
+
+    - 최대 max_size개의 브라우저만 동시에 존재하며, 초과 요청은 대기열에서 순서대로 대기
+    - 대여 시 헬스 체크, max_uses회 사용한 브라우저는 폐기 후 재생성
+    - 반납 시 쿠키/프레임을 초기화하여 요청 간 상태가 섞이지 않도록 함
+    """
+
+    def __init__(self):
+        load_dotenv("./config/.env")
+
+        self.max_size = int(os.getenv("WEBDRIVER_POOL_SIZE", 2))
+        self.warm_size = min(int(os.getenv("WEBDRIVER_POOL_WARM", 1)), self.max_size)
+        self.max_uses = int(os.getenv("WEBDRIVER_MAX_USES", 50))
+        self.acquire_timeout = float(os.getenv("WEBDRIVER_ACQUIRE_TIMEOUT", 120))
+        self.user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+        self._idle: Deque[PooledDriver] = deque()
+        self._size = 0
+        self._closed = False
+        self._condition = asyncio.Condition()
+
+    def _create_driver(self) -> webdriver.Chrome:
+        """새 헤드리스 Chrome 인스턴스 생성 (블로킹)"""
+        chrome_options = Options()
+        chrome_options.add_argument("--headless")
+        chrome_options.add_argument("--no-sandbox")
+        chrome_options.add_argument("--disable-dev-shm-usage")
+        chrome_options.add_argument("--window-size=1920,1080")
+        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
+        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        chrome_options.add_experimental_option("useAutomationExtension", False)
+        chrome_options.add_argument(f"user-agent={self.user_agent}")
+        chrome_options.add_argument("--incognito")
+
+        driver = webdriver.Chrome(service=Service(), options=chrome_options)
+        # 이후 로드되는 모든 문서에서 navigator.webdriver 숨김
+        driver.execute_cdp_cmd(
+            "Page.addScriptToEvaluateOnNewDocument",
+            {"source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"}
+        )
+        logger.info("WebDriver 인스턴스 생성됨")
+        return driver
+
+    def _is_healthy(self, pooled: PooledDriver) -> bool:
+        """브라우저 세션이 살아있는지 확인 (블로킹)"""
+        try:
+            _ = pooled.driver.window_handles
+            return True
+        except Exception:
+            return False
+
+    def _reset(self, pooled: PooledDriver) -> bool:
+        """다음 사용자를 위해 브라우저 상태 초기화 (블로킹)"""
+        try:
+            pooled.driver.switch_to.default_content()
+            pooled.driver.delete_all_cookies()
+            pooled.driver.get("about:blank")
+            return True
+        except Exception as e:
+            logger.warning(f"WebDriver 초기화 실패, 폐기합니다: {e}")
+            return False
+
+    def _quit(self, pooled: PooledDriver):
+        """브라우저 종료 (블로킹)"""
+        try:
+            pooled.driver.quit()
+            logger.info("WebDriver 종료됨")
+        except Exception as e:
+            logger.warning(f"WebDriver 종료 중 오류: {e}")
+
+    async def _discard(self, pooled: PooledDriver):
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._quit, pooled)
+        async with self._condition:
+            self._size -= 1
+            self._condition.notify()
+
+    async def acquire(self) -> PooledDriver:
+        """
+        풀에서 WebDriver 대여 (없으면 생성, 최대 크기 도달 시 대기)
+
+        Returns:
+            PooledDriver: 대여한 WebDriver
+        """
+        loop = asyncio.get_running_loop()
+
+        while True:
+            pooled = None
+            async with self._condition:
+                if self._closed:
+                    raise RuntimeError("WebDriver 풀이 종료되었습니다.")
+
+                await asyncio.wait_for(
+                    self._condition.wait_for(lambda: self._closed or self._idle or self._size < self.max_size),
+                    timeout=self.acquire_timeout
+                )
+
+                # 대기 중 close()된 경우 새 브라우저를 만들지 않음
+                if self._closed:
+                    raise RuntimeError("WebDriver 풀이 종료되었습니다.")
+
+                if self._idle:
+                    pooled = self._idle.popleft()
+                else:
+                    self._size += 1
+
+            if pooled is None:
+                try:
+                    driver = await loop.run_in_executor(None, self._create_driver)
+                except Exception:
+                    async with self._condition:
+                        self._size -= 1
+                        self._condition.notify()
+                    raise
+                pooled = PooledDriver(driver)
+                # 생성하는 동안 close()된 경우 바로 폐기
+                if self._closed:
+                    await self._discard(pooled)
+                    raise RuntimeError("WebDriver 풀이 종료되었습니다.")
+            elif not await loop.run_in_executor(None, self._is_healthy, pooled):
+                logger.warning("응답하지 않는 WebDriver를 폐기합니다.")
+                await self._discard(pooled)
+                continue
+
+            pooled.uses += 1
+            return pooled
+
+    async def release(self, pooled: PooledDriver, discard: bool = False):
+        """
+        WebDriver 반납 (사용 횟수 초과 또는 오류 시 폐기)
+
+        Args:
+            pooled: 반납할 WebDriver
+            discard: True면 재사용하지 않고 종료
+        """
+        loop = asyncio.get_running_loop()
+
+        if not discard and pooled.uses >= self.max_uses:
+            logger.info(f"WebDriver {pooled.uses}회 사용, 재생성합니다.")
+            discard = True
+
+        if not discard and not self._closed:
+            discard = not await loop.run_in_executor(None, self._reset, pooled)
+
+        if discard or self._closed:
+            await self._discard(pooled)
+            return
+
+        async with self._condition:
+            self._idle.append(pooled)
+            self._condition.notify()
+
+    @asynccontextmanager
+    async def driver(self):
+        """
+        async with webdriver_pool.driver() as driver: 형태로 WebDriver 대여
+        """
+        pooled = await self.acquire()
+        failed = False
+        try:
+            yield pooled.driver
+        except Exception:
+            failed = True
+            raise
+        finally:
+            await self.release(pooled, discard=failed)
+
+    async def warm_up(self):
+        """서버 시작 시 warm_size개의 브라우저를 미리 생성"""
+        loop = asyncio.get_running_loop()
+
+        for _ in range(self.warm_size):
+            async with self._condition:
+                if self._size >= self.max_size:
+                    break
+                self._size += 1
+            try:
+                driver = await loop.run_in_executor(None, self._create_driver)
+            except Exception as e:
+                logger.error(f"WebDriver 예열 중 오류: {e}")
+                async with self._condition:
+                    self._size -= 1
+                break
+            async with self._condition:
+                self._idle.append(PooledDriver(driver))
+                self._condition.notify()
+
+        logger.info(f"WebDriver 풀 예열 완료: 유휴 {len(self._idle)}개 / 최대 {self.max_size}개")
+
+    async def close(self):
+        """유휴 브라우저를 모두 종료하고 풀을 닫음 (대여 중인 브라우저는 반납 시 종료)"""
+        loop = asyncio.get_running_loop()
+
+        async with self._condition:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+            self._size -= len(idle)
+            self._condition.notify_all()
+
+        for pooled in idle:
+            await loop.run_in_executor(None, self._quit, pooled)
+
+        logger.info("WebDriver 풀 종료")
+
+    def stats(self) -> dict:
+        """풀 상태 조회"""
+        return {
+            "size": self._size,
+            "idle": len(self._idle),
+            "in_use": self._size - len(self._idle),
+            "max_size": self.max_size
+        }
+
+webdriver_pool = WebDriverPool()
@@ -0,0 +1,81 @@
+# tests/test_analysis_artifact_store.py
+# 실행: sosangomin-ai 디렉토리에서 python -m pytest tests
+
+import asyncio
+from types import SimpleNamespace
+from bson import ObjectId
+from services.analysis_artifact_store import AnalysisArtifactStore
+
+class FakeCollection:
+    """insert_one/insert_many만 기록하는 Motor 컬렉션 대역"""
+
+    def __init__(self):
+        self.docs = []
+
+    async def insert_one(self, doc):
+        self.docs.append(doc)
+        return SimpleNamespace(inserted_id=doc["_id"])
+
+    async def insert_many(self, docs, ordered=True):
+        self.docs.extend(docs)
+
+def _make_store(artifacts: FakeCollection) -> AnalysisArtifactStore:
+    store = AnalysisArtifactStore()
+    store._collection = lambda: artifacts
+    return store
+
+def test_save_keeps_caller_chart_data():
+    # eda_service.perform_eda와 같은 형태: 응답에 그대로 쓰는 dict를 result_doc에 담아 저장
+    eda_result_data = {
+        "basic_stats": {"data": {"total_sales": 1000}, "summary": "기본 통계"},
+        "weekday_sales": {"data": {"월": 100}, "summary": "요일별 매출"},
+        "hourly_sales": {"data": {"12": 300}, "summary": "시간별 매출"}
+    }
+    predict_value = {"predictions": [1, 2, 3]}
+    cluster_value = {"clusters": []}
+    auto_analysis_results = {"predict": predict_value, "cluster": cluster_value, "summaries": {"predict": "예측"}}
+    result_doc = {
+        "_id": ObjectId(),
+        "analysis_type": "combined_analysis",
+        "eda_result": {"result_data": eda_result_data, "summary": "요약"},
+        "auto_analysis_results": auto_analysis_results,
+        "chat_context": {"version": 1, "snippets": []}
+    }
+
+    artifacts = FakeCollection()
+    analysis_results = FakeCollection()
+    inserted_id = asyncio.run(_make_store(artifacts).save(analysis_results, result_doc))
+
+    # 호출부가 들고 있는 dict에는 모든 차트가 남아 있어야 함
+    assert list(eda_result_data) == ["basic_stats", "weekday_sales", "hourly_sales"]
+    assert auto_analysis_results == {"predict": predict_value, "cluster": cluster_value, "summaries": {"predict": "예측"}}
+
+    # 저장된 분석 문서에는 섹션이 빠지고 목록만 남아야 함
+    assert inserted_id == result_doc["_id"]
+    saved_doc = analysis_results.docs[0]
+    assert saved_doc["eda_result"] == {"result_data": {}, "summary": "요약"}
+    assert saved_doc["auto_analysis_results"] == {"summaries": {"predict": "예측"}}
+    assert "chat_context" not in saved_doc
+    assert saved_doc["artifact_sections"] == [
+        "eda_result.result_data.basic_stats",
+        "eda_result.result_data.weekday_sales",
+        "eda_result.result_data.hourly_sales",
+        "auto_analysis_results.predict",
+        "auto_analysis_results.cluster",
+        "chat_context"
+    ]
+
+    # 섹션은 analysis_id와 함께 따로 저장
+    stored = {artifact["section"]: artifact["data"] for artifact in artifacts.docs}
+    assert stored["eda_result.result_data.weekday_sales"] is eda_result_data["weekday_sales"]
+    assert stored["auto_analysis_results.predict"] is predict_value
+    assert all(artifact["analysis_id"] == result_doc["_id"] for artifact in artifacts.docs)
+
+def test_split_skips_missing_sections():
+    result_doc = {"_id": ObjectId(), "analysis_type": "autoanalysis", "results": {"predict": {"a": 1}}}
+
+    sections = AnalysisArtifactStore().split(result_doc)
+
+    assert sections == {"results.predict": {"a": 1}}
+    assert result_doc["results"] == {}
+    assert result_doc["artifact_sections"] == ["results.predict"]
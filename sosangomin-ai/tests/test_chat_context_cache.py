@@ -0,0 +1,80 @@
+# tests/test_chat_context_cache.py
+# 실행: sosangomin-ai 디렉토리에서 python -m pytest tests
+
+import asyncio
+from datetime import datetime, timedelta
+from services.chat_context_cache import ChatContextCache
+
+class FakeCollection:
+    """ChatContextCache가 쓰는 연산만 흉내 내는 Motor 컬렉션 대역"""
+
+    def __init__(self):
+        self.docs = {}
+
+    async def find_one(self, query, projection=None):
+        doc = self.docs.get(query["_id"])
+        if doc is None or doc["expires_at"] <= query["expires_at"]["$gt"]:
+            return None
+        return doc
+
+    async def replace_one(self, query, doc, upsert=False):
+        self.docs[query["_id"]] = dict(doc, _id=query["_id"])
+
+    async def delete_many(self, query):
+        for key in [k for k, doc in self.docs.items() if doc.get("user_id") == query["user_id"]]:
+            del self.docs[key]
+
+    async def delete_one(self, query):
+        self.docs.pop(query["_id"], None)
+
+def _make_cache() -> ChatContextCache:
+    cache = ChatContextCache()
+    collection = FakeCollection()
+    cache._collection = lambda: collection
+    return cache
+
+def test_session_keeps_recent_history_window():
+    cache = _make_cache()
+    history = [{"user_message": f"질문 {i}", "bot_message": f"답변 {i}"} for i in range(8)]
+
+    async def run():
+        await cache.save_session("s1", 7, history, main_store_id=3)
+        return await cache.get_session("s1")
+
+    context = asyncio.run(run())
+
+    assert context["user_id"] == 7
+    assert context["main_store_id"] == 3
+    assert [turn["user_message"] for turn in context["history"]] == ["질문 3", "질문 4", "질문 5", "질문 6", "질문 7"]
+
+def test_expired_entry_is_a_miss():
+    cache = _make_cache()
+
+    async def run():
+        await cache.save_eda_context(1, {"analysis_id": "a1", "index": {}})
+        cache._collection().docs["chat:eda:1"]["expires_at"] = datetime.now() - timedelta(seconds=1)
+        return await cache.get_eda_context(1)
+
+    assert asyncio.run(run()) is None
+
+def test_invalidate_user_sessions_keeps_other_users_and_eda_context():
+    cache = _make_cache()
+
+    async def run():
+        await cache.save_session("s1", 7, [])
+        await cache.save_session("s2", 7, [])
+        await cache.save_session("s3", 8, [])
+        await cache.save_eda_context(1, {"analysis_id": "a1", "index": {}})
+        await cache.invalidate_user_sessions(7)
+        return (
+            await cache.get_session("s1"),
+            await cache.get_session("s2"),
+            await cache.get_session("s3"),
+            await cache.get_eda_context(1)
+        )
+
+    s1, s2, s3, eda = asyncio.run(run())
+
+    assert s1 is None and s2 is None
+    assert s3["user_id"] == 8
+    assert eda["analysis_id"] == "a1"
@@ -0,0 +1,70 @@
+# tests/test_data_listing_service.py
+# 실행: sosangomin-ai 디렉토리에서 python -m pytest tests
+
+import asyncio
+from datetime import datetime, timedelta
+from bson import ObjectId
+from services import data_listing_service as listing_module
+from services.data_listing_service import DataListingService
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def sort(self, keys):
+        for field, direction in reversed(keys):
+            self.docs.sort(key=lambda doc: doc[field], reverse=direction < 0)
+        return self
+
+    def limit(self, count):
+        self.docs = self.docs[:count]
+        return self
+
+    async def to_list(self, length):
+        return self.docs[:length]
+
+class FakeCollection:
+    """_list_page가 만드는 조건($type, keyset $or)만 해석하는 Motor 컬렉션 대역"""
+
+    def __init__(self, docs):
+        self.docs = docs
+        self.queries = []
+
+    @staticmethod
+    def _matches(doc, field, condition):
+        value = doc.get(field)
+        if isinstance(condition, dict):
+            if "$type" in condition:
+                return isinstance(value, datetime)
+            return value is not None and value < condition["$lt"]
+        return value == condition
+
+    def find(self, query, projection=None):
+        self.queries.append(query)
+
+        def matches(doc):
+            for field, condition in query.items():
+                if field == "$or":
+                    if not any(all(self._matches(doc, f, c) for f, c in branch.items()) for branch in condition):
+                        return False
+                elif not self._matches(doc, field, condition):
+                    return False
+            return True
+
+        return FakeCursor([dict(doc) for doc in self.docs if matches(doc)])
+
+def test_pages_skip_documents_without_sort_field(monkeypatch):
+    now = datetime(2025, 1, 1)
+    docs = [{"_id": ObjectId(), "store_id": 1, "upload_date": now - timedelta(days=i)} for i in range(3)]
+    docs.insert(1, {"_id": ObjectId(), "store_id": 1})
+    collection = FakeCollection(docs)
+    monkeypatch.setattr(listing_module.async_mongo_instance, "get_collection", lambda name: collection)
+    service = DataListingService()
+
+    first = asyncio.run(service.list_datasources(store_id=1, limit=2))
+    second = asyncio.run(service.list_datasources(store_id=1, limit=2, cursor=first["next_cursor"]))
+
+    assert first["next_cursor"] is not None
+    assert [item["upload_date"] for item in first["items"] + second["items"]] == [doc["upload_date"] for doc in docs if "upload_date" in doc]
+    assert second["next_cursor"] is None
+    assert collection.queries[0]["upload_date"] == {"$type": "date"}
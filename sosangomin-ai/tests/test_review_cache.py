@@ -0,0 +1,50 @@
+# tests/test_review_cache.py
+# 실행: sosangomin-ai 디렉토리에서 python -m pytest tests
+
+import asyncio
+from services.review_cache import PlaceReviewCache
+
+class FakeCollection:
+    """update_one만 기록하는 Motor 컬렉션 대역"""
+
+    def __init__(self):
+        self.updates = []
+
+    async def update_one(self, query, update, upsert=False):
+        self.updates.append((query, update))
+
+def _make_cache(collection: FakeCollection, max_reviews: int) -> PlaceReviewCache:
+    cache = PlaceReviewCache()
+    cache.max_reviews = max_reviews
+    cache._collection = lambda: collection
+    return cache
+
+def _reviews(count: int):
+    return {f"h{i}": {"text": f"리뷰 {i}", "sentiment": "positive"} for i in range(count)}
+
+def test_save_caps_merged_reviews_to_window():
+    collection = FakeCollection()
+    cache = _make_cache(collection, max_reviews=3)
+
+    saved = asyncio.run(cache.save("123", _reviews(5), fetched_count=2))
+
+    assert [review["text"] for review in saved] == ["리뷰 0", "리뷰 1", "리뷰 2"]
+    stored = collection.updates[0][1]["$set"]
+    assert stored["review_hashes"] == ["h0", "h1", "h2"]
+    assert all("hash" not in review for review in stored["reviews"])
+
+def test_save_keeps_full_crawl_larger_than_window():
+    cache = _make_cache(FakeCollection(), max_reviews=3)
+
+    saved = asyncio.run(cache.save("123", _reviews(5), fetched_count=5))
+
+    assert len(saved) == 5
+
+def test_cached_reviews_strips_legacy_hash_field():
+    cache = _make_cache(FakeCollection(), max_reviews=3)
+    legacy = {"reviews": [{"text": "맛있어요", "hash": "old"}]}
+
+    cached = cache.cached_reviews(legacy)
+
+    assert list(cached.values()) == [{"text": "맛있어요"}]
+    assert list(cached) == [cache.review_hash({"text": "맛있어요"})]
@@ -0,0 +1,118 @@
+# tests/test_review_fetcher.py
+# 실행: sosangomin-ai 디렉토리에서 python -m pytest tests
+
+import json
+import asyncio
+from pathlib import Path
+from datetime import datetime
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from services.review_fetcher import NaverReviewFetcher
+
+FIXTURES = Path(__file__).parent / "fixtures"
+REVIEW_FIELDS = {"text", "rating", "date", "sentiment", "keywords"}
+
+def _load_page(page: int):
+    return json.loads((FIXTURES / f"naver_visitor_reviews_page{page}.json").read_text(encoding="utf-8"))
+
+async def _run_fetch(fail_page=None, **fetch_kwargs):
+    """네이버 GraphQL 스텁 서버를 띄우고 fetch 실행 (수집 결과, 서버가 받은 요청 목록)"""
+    received = []
+
+    async def graphql(request: web.Request) -> web.Response:
+        body = await request.json()
+        received.append({"body": body, "referer": request.headers.get("Referer")})
+        page = body[0]["variables"]["input"]["page"]
+        if page == fail_page:
+            return web.Response(status=500)
+        return web.json_response(_load_page(page))
+
+    app = web.Application()
+    app.router.add_post("/graphql", graphql)
+
+    fetcher = NaverReviewFetcher()
+    fetcher.page_size = 3
+    fetcher.max_pages = 5
+    async with TestServer(app) as server:
+        fetcher.graphql_url = str(server.make_url("/graphql"))
+        try:
+            reviews = await fetcher.fetch("1234567890", **fetch_kwargs)
+        finally:
+            await fetcher.close()
+
+    return reviews, received
+
+def _pages(received):
+    return [request["body"][0]["variables"]["input"]["page"] for request in received]
+
+def test_fetch_paginates_until_short_page():
+    reviews, received = asyncio.run(_run_fetch())
+
+    # 3번째 페이지가 페이지 크기(3)보다 작으므로 거기서 중단
+    assert _pages(received) == [1, 2, 3]
+    # 본문이 공백뿐인 리뷰는 제외되지만 페이지 항목 수에는 포함되어 2페이지에서 멈추지 않음
+    assert [review["text"] for review in reviews] == [
+        "국물이 진하고 고기가 정말 맛있어요. 재방문 의사 있습니다!",
+        "직원분들이 친절하고 매장이 깔끔해요",
+        "점심시간에는 대기가 조금 길어요",
+        "가격 대비 양이 조금 아쉬웠어요",
+        "주차하기가 너무 불편했습니다",
+        "반찬이 정갈하고 맛있어요"
+    ]
+
+def test_fetch_stops_at_page_with_seen_review():
+    seen = "가격 대비 양이 조금 아쉬웠어요"
+
+    reviews, received = asyncio.run(_run_fetch(stop_when=lambda review: review["text"] == seen))
+
+    assert _pages(received) == [1, 2]
+    assert len(reviews) == 5
+
+def test_fetch_respects_max_pages():
+    reviews, received = asyncio.run(_run_fetch(max_pages=1))
+
+    assert _pages(received) == [1]
+    assert len(reviews) == 3
+
+def test_fetch_returns_collected_reviews_on_error_status():
+    reviews, received = asyncio.run(_run_fetch(fail_page=2))
+
+    assert _pages(received) == [1, 2]
+    assert len(reviews) == 3
+
+def test_fetch_output_matches_selenium_shape():
+    reviews, _ = asyncio.run(_run_fetch(max_pages=1))
+
+    for review in reviews:
+        assert set(review) == REVIEW_FIELDS
+        assert review["sentiment"] is None
+        assert review["keywords"] == []
+        assert isinstance(review["rating"], float)
+
+    assert reviews[1]["rating"] == 4.0
+    assert reviews[1]["date"] == "2024.03.10"
+    # 평점이 없으면 0, 방문일이 없으면 작성일 사용
+    assert reviews[2]["rating"] == 0.0
+    assert reviews[2]["date"] == "2024.02.28"
+
+def test_fetch_sends_business_type():
+    _, received = asyncio.run(_run_fetch(max_pages=1, business_type="hairshop"))
+
+    request = received[0]
+    variables = request["body"][0]["variables"]
+    assert variables["input"]["businessType"] == "hairshop"
+    assert variables["input"]["businessId"] == "1234567890"
+    assert variables["input"]["size"] == 3
+    assert request["referer"] == "https://m.place.naver.com/hairshop/1234567890/review/visitor"
+
+def test_fetch_uses_default_business_type():
+    _, received = asyncio.run(_run_fetch(max_pages=1))
+
+    assert received[0]["body"][0]["variables"]["input"]["businessType"] == "restaurant"
+
+def test_normalize_date_without_year():
+    today = datetime(2024, 3, 20)
+
+    assert NaverReviewFetcher.normalize_date("3.15.금", today) == "2024.03.15"
+    assert NaverReviewFetcher.normalize_date("12.24.일", today) == "2023.12.24"
+    assert NaverReviewFetcher.normalize_date(None, today) == "알 수 없음"